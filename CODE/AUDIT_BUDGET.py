@@ -0,0 +1,127 @@
+"""
+AUDIT BUDGET
+============
+Deadline-aware detector scheduling shared by both auditors.
+
+A real-time caller with a hard budget would rather act on a bounded
+estimate than on nothing. Given an absolute deadline (a time.perf_counter()
+instant), run_until() runs detectors in value-per-cost order: those
+contributing most to the composite per second of scanning first, the
+slow sentence-level analyses last. It stops once the deadline passes, and
+skips any detector whose expected cost no longer fits the time left. A
+detector is never interrupted mid-scan, so a result can overrun the
+deadline by at most one detector's cost.
+
+Costs are learned per auditor: an exponentially weighted mean of each
+detector's observed run time. Detectors not yet measured are tried first
+so they are measured. To warm the table before the first budgeted request,
+audit a few representative texts at startup with deadline=float("inf").
+
+Detectors left unrun are reported with score bounds (SCORE_BOUNDS); each
+auditor turns those into composite bounds (see their audit()). The same
+bounds drive decision-only mode (decide()): since the composites are
+monotone in every detector score, detectors stop as soon as fixed_label()
+shows the classification is the same at both ends of the range.
+
+Usage:
+    report = UnifiedPersuasionAuditor().audit(text, deadline=deadline_in(0.005))
+    if report["deadline"]["partial"]:
+        low, high = report["deadline"]["overall_bounds"]
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import time
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple
+
+# Every detector score lies in this range
+SCORE_BOUNDS = (0, 100)
+# Weight of the newest observation in the running cost estimate
+COST_SMOOTHING = 0.2
+
+
+def deadline_in(seconds: float) -> float:
+    """Absolute deadline `seconds` from now, for audit(..., deadline=...)."""
+    return time.perf_counter() + seconds
+
+
+class DetectorCosts:
+    """Running estimate of each detector's cost in seconds."""
+
+    def __init__(self, smoothing: float = COST_SMOOTHING):
+        self.smoothing = smoothing
+        self.seconds: Dict[str, float] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        previous = self.seconds.get(name)
+        if previous is None:
+            self.seconds[name] = seconds
+        else:
+            self.seconds[name] = previous + self.smoothing * (seconds - previous)
+
+    def order(self, values: Dict[str, float]) -> List[str]:
+        """Names by descending value per second; unmeasured detectors first."""
+        def key(name: str) -> Tuple[int, float]:
+            cost = self.seconds.get(name)
+            if cost is None:
+                return 0, 0.0
+            return 1, cost / values[name] if values[name] > 0 else float("inf")
+        return sorted(values, key=key)
+
+
+def run_until(detectors: Dict[str, Any], values: Dict[str, float], text: str, ctx: Any,
+              deadline: float, costs: DetectorCosts,
+              settled: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Run detectors in value-per-cost order until the deadline, or until
+    `settled(results so far)` is true.
+
+    Returns the results by name (in the detectors' own order) and the names
+    of the detectors left unrun.
+    """
+    clock = time.perf_counter
+    done: Dict[str, Any] = {}
+    for name in costs.order(values):
+        if settled is not None and settled(done):
+            break
+        started = clock()
+        if started >= deadline:
+            break
+        expected = costs.seconds.get(name)
+        if expected is not None and started + expected > deadline:
+            continue
+        done[name] = detectors[name].detect(text, ctx)
+        costs.observe(name, clock() - started)
+    results = {name: done[name] for name in detectors if name in done}
+    return results, [name for name in detectors if name not in done]
+
+
+def reachable_labels(classify: Callable[[float], str], low: float, high: float,
+                     breakpoints: Iterable[float] = ()) -> List[str]:
+    """
+    Every label classify() gives some score in [low, high], in order of first
+    appearance from `low` upward.
+
+    `breakpoints` are the scores where the label may change. Between two
+    consecutive breakpoints the label is constant, so probing each breakpoint
+    inside the range and one point between each pair is exact even for
+    scales with gaps. A monotone classify needs none.
+    """
+    points = sorted({low, high, *(point for point in breakpoints if low < point < high)})
+    probes = [points[0]]
+    for a, b in zip(points, points[1:]):
+        probes += [(a + b) / 2, b]
+    labels: List[str] = []
+    for point in probes:
+        label = classify(point)
+        if label not in labels:
+            labels.append(label)
+    return labels
+
+
+def fixed_label(classify: Callable[[float], str], low: float, high: float,
+                breakpoints: Iterable[float] = ()) -> Optional[str]:
+    """The label classify() gives every score in [low, high], or None if it can vary."""
+    labels = reachable_labels(classify, low, high, breakpoints)
+    return labels[0] if len(labels) == 1 else None
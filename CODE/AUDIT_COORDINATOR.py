@@ -0,0 +1,970 @@
+"""
+AUDIT COORDINATOR
+=================
+Coordinator/worker mode for corpus-scale audits across several hosts.
+
+The coordinator splits a corpus into leases (fixed-size batches of documents).
+Workers pull leases over plain TCP or through a shared filesystem directory,
+run the auditors locally and hand the results back. Leases that are not
+completed within the lease timeout are re-issued to the next worker that asks.
+Every completed lease becomes one shard of the output directory.
+
+No outside queue service is needed; the TCP protocol is newline-delimited JSON
+and the directory protocol relies only on atomic renames.
+
+Usage:
+    # Coordinator host
+    coordinator = AuditCoordinator(load_corpus("corpus.jsonl"), "audit_out")
+    coordinator.serve_tcp(("0.0.0.0", 7461))
+
+    # Each worker host
+    AuditWorker().run_tcp(("coordinator-host", 7461))
+
+    # Worker that picks up new pattern-pack versions between documents
+    AuditWorker(pattern_pack="packs/retail-eu.json").run_tcp(("coordinator-host", 7461))
+
+    # Rank on the workers; shards keep document ids, rankings.json the top reports
+    ranking = TopKTracker(1000, ["overall_influence_index", "composite_index"])
+    coordinator = AuditCoordinator(corpus, "audit_out", ranking=ranking, store_reports=False)
+
+    # Everything on local processes (testing)
+    manifest = run_local(corpus, "audit_out", workers=4)
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import socketserver
+import threading
+import multiprocessing
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator
+
+# Import from companion modules
+try:
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor
+    from NEAR_DUPLICATE_INDEX import NearDuplicateAuditor
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_PACK import PatternPack, PackWatcher, DEFAULT_RELOAD_INTERVAL
+    from TOP_K_RANKING import TopKTracker
+except ImportError:
+    # Fallback if running from different directory
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor
+    from NEAR_DUPLICATE_INDEX import NearDuplicateAuditor
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_PACK import PatternPack, PackWatcher, DEFAULT_RELOAD_INTERVAL
+    from TOP_K_RANKING import TopKTracker
+
+
+# =============================================================================
+# SECTION 1: CONFIGURATION CONSTANTS
+# =============================================================================
+
+DEFAULT_LEASE_SIZE = 200          # Documents per lease
+DEFAULT_LEASE_TIMEOUT = 300.0     # Seconds before an unfinished lease is re-issued
+DEFAULT_MAX_ATTEMPTS = 3          # Issues per lease before it is recorded as failed
+DEFAULT_POLL_INTERVAL = 0.5       # Seconds between polls when no lease is available
+DEFAULT_HEARTBEAT_INTERVAL = 30.0 # Seconds between lease renewals while a worker audits
+
+FRAMEWORKS = ("persuasion", "integrity")
+
+
+# =============================================================================
+# SECTION 2: DATA CLASSES
+# =============================================================================
+
+@dataclass
+class Lease:
+    """A batch of documents handed to one worker at a time."""
+    lease_id: int
+    documents: List[Tuple[str, str]]  # (doc_id, text)
+    attempts: int = 0
+    worker: Optional[str] = None
+    expires_at: float = 0.0
+    # Empty TopKTracker tables (to_dict form) the worker ranks the lease into
+    ranking: Optional[Dict[str, Any]] = None
+    # False: results are returned as bare {"id": ...} records (ranking only)
+    store_reports: bool = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "lease_id": self.lease_id,
+            "documents": [[doc_id, text] for doc_id, text in self.documents],
+            "attempts": self.attempts,
+        }
+        if self.ranking is not None:
+            data["ranking"] = self.ranking
+            data["store_reports"] = self.store_reports
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Lease":
+        return cls(
+            lease_id=data["lease_id"],
+            documents=[(doc_id, text) for doc_id, text in data["documents"]],
+            attempts=data.get("attempts", 0),
+            ranking=data.get("ranking"),
+            store_reports=data.get("store_reports", True),
+        )
+
+
+@dataclass
+class WorkerAuditors:
+    """The auditors a worker audits one document with; replaced as a whole on a pack reload."""
+    persuasion: Any
+    integrity: Any
+    integrity_serializer: Any
+    pack: Optional[PatternPack] = None
+
+
+@dataclass
+class CoordinatorStats:
+    """Progress counters reported in the output manifest."""
+    leases_total: int = 0
+    leases_completed: int = 0
+    leases_failed: List[int] = field(default_factory=list)
+    leases_reissued: int = 0
+    documents_completed: int = 0
+
+
+# =============================================================================
+# SECTION 3: CORPUS HELPERS
+# =============================================================================
+
+def load_corpus(path: str) -> Iterator[Tuple[str, str]]:
+    """Read a JSONL corpus with one {"id": ..., "text": ...} object per line."""
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            yield str(record.get("id", line_number)), record["text"]
+
+
+def split_into_leases(corpus: Iterable[Any], lease_size: int) -> List[Lease]:
+    """Split (doc_id, text) pairs, or bare texts, into fixed-size leases."""
+    leases = []
+    batch = []
+    for position, item in enumerate(corpus):
+        if isinstance(item, str):
+            item = (str(position), item)
+        batch.append((str(item[0]), item[1]))
+        if len(batch) >= lease_size:
+            leases.append(Lease(lease_id=len(leases), documents=batch))
+            batch = []
+    if batch:
+        leases.append(Lease(lease_id=len(leases), documents=batch))
+    return leases
+
+
+def iter_results(output_dir: str) -> Iterator[Dict[str, Any]]:
+    """Iterate merged results from every shard, in lease order."""
+    with open(os.path.join(output_dir, "manifest.json"), encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    for shard in manifest["shards"]:
+        with open(os.path.join(output_dir, shard), encoding="utf-8") as handle:
+            for line in handle:
+                yield json.loads(line)
+
+
+def load_rankings(output_dir: str) -> Optional[TopKTracker]:
+    """The top-K tables a ranking coordinator merged from its workers, if it ranked."""
+    with open(os.path.join(output_dir, "manifest.json"), encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    if "rankings" not in manifest:
+        return None
+    with open(os.path.join(output_dir, manifest["rankings"]), encoding="utf-8") as handle:
+        return TopKTracker.from_json(handle.read())
+
+
+def rank_results(output_dir: str, k: int, scores: Iterable[str], keep_reports: bool = True) -> TopKTracker:
+    """Top-K tables over a finished run that stored its reports, streamed shard by shard."""
+    tracker = TopKTracker(k, scores, keep_reports)
+    tracker.offer_results(iter_results(output_dir))
+    return tracker
+
+
+# =============================================================================
+# SECTION 4: LEASE TABLE AND SHARDED OUTPUT
+# =============================================================================
+
+class _Heartbeat:
+    """Call `beat` every `interval` seconds from a daemon thread while a lease is audited."""
+
+    def __init__(self, interval: float, beat):
+        self.interval = interval
+        self.beat = beat
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.beat()
+            except (OSError, ValueError):
+                pass  # A missed renewal only risks the lease being re-issued
+
+    def __enter__(self) -> "_Heartbeat":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+class LeaseTable:
+    """Thread-safe bookkeeping of pending, active and completed leases."""
+
+    def __init__(self, leases: List[Lease], lease_timeout: float, max_attempts: int):
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.pending = deque(leases)
+        self.active: Dict[int, Lease] = {}
+        self.completed = set()
+        self.stats = CoordinatorStats(leases_total=len(leases))
+        self._lock = threading.Lock()
+
+    def _reclaim_expired(self, now: float) -> None:
+        for lease_id, lease in list(self.active.items()):
+            if lease.expires_at > now:
+                continue
+            del self.active[lease_id]
+            if lease.attempts >= self.max_attempts:
+                self.stats.leases_failed.append(lease_id)
+            else:
+                self.pending.appendleft(lease)
+                self.stats.leases_reissued += 1
+
+    def acquire(self, worker: str) -> Optional[Lease]:
+        """Hand out the next lease, re-issuing expired ones first."""
+        with self._lock:
+            now = time.monotonic()
+            self._reclaim_expired(now)
+            if not self.pending:
+                return None
+            lease = self.pending.popleft()
+            lease.attempts += 1
+            lease.worker = worker
+            lease.expires_at = now + self.lease_timeout
+            self.active[lease.lease_id] = lease
+            return lease
+
+    def renew(self, lease_id: int) -> bool:
+        """Extend an active lease (worker heartbeat)."""
+        with self._lock:
+            lease = self.active.get(lease_id)
+            if lease is None:
+                return False
+            lease.expires_at = time.monotonic() + self.lease_timeout
+            return True
+
+    def complete(self, lease_id: int, document_count: int) -> bool:
+        """Mark a lease done. Returns False for duplicate or unknown completions."""
+        with self._lock:
+            if lease_id in self.completed or lease_id in self.stats.leases_failed:
+                return False
+            self.active.pop(lease_id, None)
+            for lease in list(self.pending):
+                if lease.lease_id == lease_id:
+                    self.pending.remove(lease)
+            self.completed.add(lease_id)
+            self.stats.leases_completed += 1
+            self.stats.documents_completed += document_count
+            return True
+
+    def abandon(self) -> List[int]:
+        """Record every pending and active lease as failed (no worker is left)."""
+        with self._lock:
+            abandoned = [lease.lease_id for lease in self.pending] + list(self.active)
+            self.pending.clear()
+            self.active.clear()
+            self.stats.leases_failed.extend(abandoned)
+            return abandoned
+
+    def is_done(self) -> bool:
+        with self._lock:
+            self._reclaim_expired(time.monotonic())
+            return not self.pending and not self.active
+
+
+class ShardWriter:
+    """Write one JSONL shard per completed lease plus a manifest."""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+
+    @staticmethod
+    def shard_name(lease_id: int) -> str:
+        return f"part-{lease_id:05d}.jsonl"
+
+    def write(self, lease_id: int, results: List[Dict[str, Any]]) -> str:
+        path = os.path.join(self.output_dir, self.shard_name(lease_id))
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            for result in results:
+                handle.write(json.dumps(result, default=str) + "\n")
+        os.replace(tmp_path, path)
+        return path
+
+    def write_manifest(self, completed: Iterable[int], stats: CoordinatorStats,
+                       ranking: Optional[TopKTracker] = None) -> Dict[str, Any]:
+        manifest = {
+            "shards": [self.shard_name(lease_id) for lease_id in sorted(completed)],
+            "leases_total": stats.leases_total,
+            "leases_completed": stats.leases_completed,
+            "leases_failed": sorted(stats.leases_failed),
+            "leases_reissued": stats.leases_reissued,
+            "documents_completed": stats.documents_completed,
+        }
+        if ranking is not None:
+            with open(os.path.join(self.output_dir, "rankings.json"), "w", encoding="utf-8") as handle:
+                handle.write(ranking.to_json())
+            manifest["rankings"] = "rankings.json"
+        with open(os.path.join(self.output_dir, "manifest.json"), "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2)
+        return manifest
+
+
+# =============================================================================
+# SECTION 5: COORDINATOR
+# =============================================================================
+
+class _CoordinatorHandler(socketserver.StreamRequestHandler):
+    """Newline-delimited JSON request handler for the TCP protocol."""
+
+    def handle(self):
+        coordinator = self.server.coordinator
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = coordinator.handle_message(json.loads(line))
+            self.wfile.write((json.dumps(response, default=str) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class AuditCoordinator:
+    """
+    Split a corpus into leases and collect results from workers.
+
+    With a ranking (TOP_K_RANKING.TopKTracker), every lease carries empty
+    copies of its tables; workers rank their lease and send the tables back
+    with the results, and they are merged here. With store_reports=False
+    the workers return only document ids, so reports that fall out of the
+    top K are never shipped or stored.
+
+    Usage:
+        coordinator = AuditCoordinator(corpus, "audit_out", lease_size=200)
+        coordinator.serve_tcp(("0.0.0.0", 7461))
+    """
+
+    def __init__(
+        self,
+        corpus: Iterable[Any],
+        output_dir: str,
+        lease_size: int = DEFAULT_LEASE_SIZE,
+        lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        ranking: Optional[TopKTracker] = None,
+        store_reports: bool = True
+    ):
+        if ranking is None and not store_reports:
+            raise ValueError("store_reports=False needs a ranking to keep any reports")
+        leases = split_into_leases(corpus, lease_size)
+        if ranking is not None:
+            tables = ranking.empty().to_dict()
+            for lease in leases:
+                lease.ranking = tables
+                lease.store_reports = store_reports
+        self.table = LeaseTable(leases, lease_timeout, max_attempts)
+        self.writer = ShardWriter(output_dir)
+        self.ranking = ranking
+        self.finished = threading.Event()
+        self._server = None
+        self._ranking_lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Protocol
+    # -------------------------------------------------------------------------
+    def handle_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch one protocol message: lease, renew or complete."""
+        op = message.get("op")
+        if op == "lease":
+            lease = self.table.acquire(message.get("worker", "unknown"))
+            if lease is None:
+                return {"lease": None, "done": self.table.is_done()}
+            return {"lease": lease.to_dict(), "done": False, "lease_timeout": self.table.lease_timeout}
+        if op == "renew":
+            return {"ok": self.table.renew(message["lease_id"])}
+        if op == "complete":
+            accepted = self.submit(message["lease_id"], message["results"], message.get("rankings"))
+            return {"ok": True, "accepted": accepted}
+        return {"ok": False, "error": f"unknown op: {op}"}
+
+    def submit(self, lease_id: int, results: List[Dict[str, Any]],
+               rankings: Optional[Dict[str, Any]] = None) -> bool:
+        """Merge a lease's results and top-K tables into the output (first completion wins)."""
+        accepted = self.table.complete(lease_id, len(results))
+        if accepted:
+            self.writer.write(lease_id, results)
+            if self.ranking is not None and rankings is not None:
+                with self._ranking_lock:
+                    self.ranking.merge(TopKTracker.from_dict(rankings))
+        if self.table.is_done():
+            self.finished.set()
+        return accepted
+
+    def manifest(self) -> Dict[str, Any]:
+        with self._ranking_lock:
+            return self.writer.write_manifest(self.table.completed, self.table.stats, self.ranking)
+
+    # -------------------------------------------------------------------------
+    # TCP transport
+    # -------------------------------------------------------------------------
+    def start_tcp(self, address: Tuple[str, int] = ("127.0.0.1", 0)) -> Tuple[str, int]:
+        """Start serving in a background thread and return the bound address."""
+        self._server = _ThreadingServer(address, _CoordinatorHandler)
+        self._server.coordinator = self
+        thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        thread.start()
+        return self._server.server_address
+
+    def stop_tcp(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def serve_tcp(self, address: Tuple[str, int]) -> Dict[str, Any]:
+        """Serve until every lease is completed or failed, then write the manifest."""
+        self.start_tcp(address)
+        try:
+            while not self.table.is_done():
+                self.finished.wait(DEFAULT_POLL_INTERVAL)
+        finally:
+            self.stop_tcp()
+        return self.manifest()
+
+    # -------------------------------------------------------------------------
+    # Shared-directory transport
+    # -------------------------------------------------------------------------
+    def serve_directory(self, root: str, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                        stall_timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Serve leases through a shared directory.
+
+        Layout: pending/ holds lease files, workers claim one by renaming it
+        into claimed/, and publish results into results/. Workers touch their
+        claim while they audit; claims untouched for the lease timeout are
+        moved back to pending/. If nothing is claimed, completed or touched for
+        stall_timeout seconds (default: the lease timeout), no worker is left,
+        and the leases still in pending/ are withdrawn and recorded as failed.
+        The lease timeout is written to the root so workers heartbeat often
+        enough, and a "done" marker there tells them to exit.
+        """
+        queue = DirectoryQueue(root)
+        queue.clear_done()
+        queue.configure(self.table.lease_timeout)
+        stall_timeout = self.table.lease_timeout if stall_timeout is None else stall_timeout
+        while self.table.pending:
+            lease = self.table.pending.popleft()
+            lease.attempts = 1
+            lease.expires_at = float("inf")  # Expiry is tracked by claim mtimes instead
+            self.table.active[lease.lease_id] = lease
+            queue.publish(lease)
+        try:
+            last_progress = time.monotonic()
+            activity = (queue.pending_count(), queue.last_claim_activity())
+            while self.table.active:
+                progress = False
+                for lease_id, results, rankings in queue.collect():
+                    self.submit(lease_id, results, rankings)
+                    progress = True
+                for lease_id in queue.reclaim(self.table.lease_timeout, self.table.max_attempts):
+                    self._fail(lease_id)
+                self.table.stats.leases_reissued = queue.reissued
+
+                pending, claim_activity = queue.pending_count(), queue.last_claim_activity()
+                progress = progress or pending < activity[0] or claim_activity > activity[1]
+                activity = (pending, claim_activity)
+                now = time.monotonic()
+                if progress:
+                    last_progress = now
+                elif pending and now - last_progress >= stall_timeout:
+                    for lease_id in queue.withdraw():
+                        self._fail(lease_id)
+                    last_progress = now
+                if self.table.active:
+                    time.sleep(poll_interval)
+        finally:
+            queue.mark_done()
+        return self.manifest()
+
+    def _fail(self, lease_id: int) -> None:
+        if self.table.active.pop(lease_id, None) is not None:
+            self.table.stats.leases_failed.append(lease_id)
+
+
+class DirectoryQueue:
+    """Lease exchange through atomic renames in a shared directory."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.pending_dir = os.path.join(root, "pending")
+        self.claimed_dir = os.path.join(root, "claimed")
+        self.results_dir = os.path.join(root, "results")
+        self.done_path = os.path.join(root, "done")
+        self.settings_path = os.path.join(root, "settings.json")
+        self.reissued = 0
+        for path in (self.pending_dir, self.claimed_dir, self.results_dir):
+            os.makedirs(path, exist_ok=True)
+
+    @property
+    def done(self) -> bool:
+        return os.path.exists(self.done_path)
+
+    def mark_done(self) -> None:
+        with open(self.done_path, "w", encoding="utf-8"):
+            pass
+
+    def clear_done(self) -> None:
+        try:
+            os.remove(self.done_path)
+        except FileNotFoundError:
+            pass
+
+    def configure(self, lease_timeout: float) -> None:
+        with open(self.settings_path + ".tmp", "w", encoding="utf-8") as handle:
+            json.dump({"lease_timeout": lease_timeout}, handle)
+        os.replace(self.settings_path + ".tmp", self.settings_path)
+
+    @property
+    def lease_timeout(self) -> float:
+        try:
+            with open(self.settings_path, "r", encoding="utf-8") as handle:
+                return float(json.load(handle)["lease_timeout"])
+        except (OSError, ValueError, KeyError):
+            return DEFAULT_LEASE_TIMEOUT
+
+    @staticmethod
+    def lease_name(lease_id: int) -> str:
+        return f"lease-{lease_id:05d}.json"
+
+    def publish(self, lease: Lease) -> None:
+        path = os.path.join(self.pending_dir, self.lease_name(lease.lease_id))
+        with open(path + ".tmp", "w", encoding="utf-8") as handle:
+            json.dump(lease.to_dict(), handle)
+        os.replace(path + ".tmp", path)
+
+    def claim(self, worker: str) -> Optional[Lease]:
+        """Claim the first pending lease. Losing a rename race just tries the next one."""
+        for name in sorted(os.listdir(self.pending_dir)):
+            if not name.endswith(".json"):
+                continue
+            claimed = os.path.join(self.claimed_dir, f"{name}.{worker}")
+            try:
+                os.rename(os.path.join(self.pending_dir, name), claimed)
+            except OSError:
+                continue
+            os.utime(claimed)
+            with open(claimed, encoding="utf-8") as handle:
+                return Lease.from_dict(json.load(handle))
+        return None
+
+    def claim_path(self, lease: Lease, worker: str) -> str:
+        return os.path.join(self.claimed_dir, f"{self.lease_name(lease.lease_id)}.{worker}")
+
+    def touch(self, lease: Lease, worker: str) -> None:
+        """Heartbeat: keep a claim from being reclaimed while it is audited."""
+        os.utime(self.claim_path(lease, worker))
+
+    def finish(self, lease: Lease, worker: str, results: List[Dict[str, Any]],
+               rankings: Optional[Dict[str, Any]] = None) -> None:
+        path = os.path.join(self.results_dir, f"lease-{lease.lease_id:05d}.jsonl")
+        if rankings is not None:
+            # In place before the results file appears, so collect() sees both
+            with open(path + f".{worker}.tmp", "w", encoding="utf-8") as handle:
+                json.dump(rankings, handle, default=str)
+            os.replace(path + f".{worker}.tmp", path[:-len(".jsonl")] + ".rankings.json")
+        with open(path + f".{worker}.tmp", "w", encoding="utf-8") as handle:
+            for result in results:
+                handle.write(json.dumps(result, default=str) + "\n")
+        os.replace(path + f".{worker}.tmp", path)
+        try:
+            os.remove(self.claim_path(lease, worker))
+        except OSError:
+            pass
+
+    def collect(self) -> Iterator[Tuple[int, List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """(lease id, results, top-K tables or None) for every published result."""
+        for name in sorted(os.listdir(self.results_dir)):
+            if not name.endswith(".jsonl"):
+                continue
+            path = os.path.join(self.results_dir, name)
+            with open(path, encoding="utf-8") as handle:
+                results = [json.loads(line) for line in handle if line.strip()]
+            os.remove(path)
+            rankings = None
+            rankings_path = path[:-len(".jsonl")] + ".rankings.json"
+            if os.path.exists(rankings_path):
+                with open(rankings_path, encoding="utf-8") as handle:
+                    rankings = json.load(handle)
+                os.remove(rankings_path)
+            yield int(name[len("lease-"):-len(".jsonl")]), results, rankings
+
+    def pending_count(self) -> int:
+        return sum(1 for name in os.listdir(self.pending_dir) if name.endswith(".json"))
+
+    def last_claim_activity(self) -> float:
+        """Newest claim or heartbeat time in claimed/ (0 if nothing is claimed)."""
+        latest = 0.0
+        for name in os.listdir(self.claimed_dir):
+            try:
+                latest = max(latest, os.path.getmtime(os.path.join(self.claimed_dir, name)))
+            except OSError:
+                continue
+        return latest
+
+    def withdraw(self) -> List[int]:
+        """Remove every unclaimed lease from pending/. Returns their ids."""
+        withdrawn = []
+        for name in os.listdir(self.pending_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                os.remove(os.path.join(self.pending_dir, name))
+            except OSError:
+                continue  # Claimed in the meantime
+            withdrawn.append(int(name[len("lease-"):-len(".json")]))
+        return withdrawn
+
+    def reclaim(self, lease_timeout: float, max_attempts: int) -> List[int]:
+        """Return stale claims to pending/. Returns leases dropped after max_attempts issues."""
+        failed = []
+        now = time.time()
+        for name in os.listdir(self.claimed_dir):
+            path = os.path.join(self.claimed_dir, name)
+            try:
+                if now - os.path.getmtime(path) < lease_timeout:
+                    continue
+                with open(path, encoding="utf-8") as handle:
+                    lease = Lease.from_dict(json.load(handle))
+                os.remove(path)
+            except OSError:
+                continue
+            if lease.attempts >= max_attempts:
+                failed.append(lease.lease_id)
+            else:
+                lease.attempts += 1
+                self.publish(lease)
+                self.reissued += 1
+        return failed
+
+
+# =============================================================================
+# SECTION 6: WORKER
+# =============================================================================
+
+class AuditWorker:
+    """
+    Pull leases from a coordinator and audit them locally.
+
+    Usage:
+        AuditWorker(frameworks=("persuasion", "integrity")).run_tcp(("host", 7461))
+    """
+
+    def __init__(self, frameworks: Tuple[str, ...] = FRAMEWORKS, worker_id: Optional[str] = None,
+                 near_duplicate_threshold: Optional[float] = None, sketches: Any = None,
+                 normalize: bool = False, sentence_cache: Any = None,
+                 pattern_pack: Optional[str] = None, pack_cache_dir: Optional[str] = None,
+                 reload_interval: Optional[float] = DEFAULT_RELOAD_INTERVAL,
+                 heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL):
+        unknown = set(frameworks) - set(FRAMEWORKS)
+        if unknown:
+            raise ValueError(f"Unknown frameworks: {sorted(unknown)}")
+        self.frameworks = frameworks
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.near_duplicate_threshold = near_duplicate_threshold
+        # Optional CorpusSketches fed from every audited document
+        self.sketches = sketches
+        self.normalize = normalize
+        # Leases are renewed this often while being audited (capped at a third of the lease timeout)
+        self.heartbeat_interval = heartbeat_interval
+        # Optional SentenceCache reused across every document this worker audits.
+        # Entries stay valid across pack versions: overridden patterns are new
+        # objects, which the cache does not prime, so detectors scan them directly.
+        self.sentence_cache = sentence_cache
+
+        # Optional pattern pack (PATTERN_PACK.py), reloaded in the background
+        # every reload_interval seconds unless that is None
+        self.pack_watcher: Optional[PackWatcher] = None
+        self._auditors: Optional[WorkerAuditors] = None
+        if pattern_pack is None:
+            self._auditors = self._build_auditors()
+        else:
+            self.pack_watcher = PackWatcher(pattern_pack, pack_cache_dir, reload_interval or 0.0,
+                                            prepare=self._build_auditors)
+            if not self.pack_watcher.poll():
+                raise ValueError(self.pack_watcher.error)
+            if reload_interval is not None:
+                self.pack_watcher.start()
+
+    @property
+    def auditors(self) -> Optional[WorkerAuditors]:
+        """Auditors for the next document: the newest published pack version, if watching one."""
+        if self.pack_watcher is not None:
+            current = self.pack_watcher.current
+            return current[1] if current is not None else None
+        return self._auditors
+
+    def _build_auditors(self, pack: Optional[PatternPack] = None) -> WorkerAuditors:
+        persuasion = UnifiedPersuasionAuditor() if "persuasion" in self.frameworks else None
+        integrity = IntegrityPatternAuditor() if "integrity" in self.frameworks else None
+        serializer = integrity
+        if pack is not None:
+            for auditor in (persuasion, integrity):
+                if auditor is not None:
+                    pack.apply(auditor)
+        previous = self.auditors
+        if previous is not None:
+            # Detector costs learned so far carry over to the new version
+            for auditor, old in ((persuasion, previous.persuasion), (integrity, previous.integrity)):
+                if auditor is not None and old is not None:
+                    auditor.costs = getattr(old, "auditor", old).costs
+        if self.near_duplicate_threshold is not None:
+            # A fresh index per version, so no report is reused across versions
+            if persuasion is not None:
+                persuasion = NearDuplicateAuditor(persuasion, self.near_duplicate_threshold)
+            if integrity is not None:
+                integrity = NearDuplicateAuditor(integrity, self.near_duplicate_threshold)
+        return WorkerAuditors(persuasion, integrity, serializer, pack)
+
+    def audit_document(self, doc_id: str, text: str) -> Dict[str, Any]:
+        result = {"id": doc_id}
+        # Read once: a reload published mid-document applies from the next one
+        auditors = self.auditors
+        ctx = ScanContext.create(text, self.normalize)
+        if self.sentence_cache is not None:
+            self.sentence_cache.prime(ctx)
+        kwargs = {}
+        if self.near_duplicate_threshold is not None:
+            # One signature per document, shared by both frameworks' indexes
+            wrapper = auditors.persuasion or auditors.integrity
+            kwargs["fingerprint"] = wrapper.index.fingerprint(text)
+        if auditors.persuasion is not None:
+            result["persuasion"] = auditors.persuasion.audit(text, ctx, **kwargs)
+        if auditors.integrity is not None:
+            report = auditors.integrity.audit(text, ctx, **kwargs)
+            result["integrity"] = auditors.integrity_serializer.to_dict(report)
+        if auditors.pack is not None:
+            result["pattern_pack"] = {"name": auditors.pack.name, "version": auditors.pack.version}
+        if self.sketches is not None:
+            self.sketches.observe(result, ctx)
+        return result
+
+    def process(self, lease: Lease) -> List[Dict[str, Any]]:
+        """Audit a lease. A document that raises is recorded as an error, not fatal."""
+        results = []
+        for doc_id, text in lease.documents:
+            try:
+                results.append(self.audit_document(doc_id, text))
+            except Exception as error:
+                results.append({"id": doc_id, "error": f"{type(error).__name__}: {error}"})
+        return results
+
+    def rank(self, lease: Lease, results: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Rank a lease into the top-K tables it carries, if any. Returns the
+        results to send (bare ids when the lease stores no reports) and the tables.
+        """
+        if lease.ranking is None:
+            return results, None
+        tracker = TopKTracker.from_dict(lease.ranking)
+        tracker.offer_results(results)
+        if not lease.store_reports:
+            results = [{"id": result["id"]} for result in results]
+        return results, tracker.to_dict()
+
+    def run_tcp(self, address: Tuple[str, int], poll_interval: float = DEFAULT_POLL_INTERVAL) -> int:
+        """Work until the coordinator reports completion. Returns leases processed."""
+        processed = 0
+        lock = threading.Lock()
+        with socket.create_connection(address) as connection:
+            reader = connection.makefile("r", encoding="utf-8")
+            writer = connection.makefile("w", encoding="utf-8")
+
+            def request(message: Dict[str, Any]) -> Dict[str, Any]:
+                with lock:
+                    writer.write(json.dumps(message, default=str) + "\n")
+                    writer.flush()
+                    return json.loads(reader.readline())
+
+            while True:
+                response = request({"op": "lease", "worker": self.worker_id})
+                if response.get("lease") is None:
+                    if response.get("done"):
+                        return processed
+                    time.sleep(poll_interval)
+                    continue
+                lease = Lease.from_dict(response["lease"])
+                interval = min(self.heartbeat_interval,
+                               response.get("lease_timeout", DEFAULT_LEASE_TIMEOUT) / 3)
+                with _Heartbeat(interval, lambda: request({"op": "renew", "lease_id": lease.lease_id})):
+                    results, rankings = self.rank(lease, self.process(lease))
+                message = {"op": "complete", "lease_id": lease.lease_id, "results": results}
+                if rankings is not None:
+                    message["rankings"] = rankings
+                request(message)
+                processed += 1
+
+    def run_directory(self, root: str, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                      idle_timeout: Optional[float] = None) -> int:
+        """
+        Claim leases from a shared directory until the coordinator writes its
+        done marker, or, if idle_timeout is given, none appear for that long.
+        """
+        queue = DirectoryQueue(root)
+        processed = 0
+        idle_since = time.monotonic()
+        while not queue.done:
+            lease = queue.claim(self.worker_id)
+            if lease is None:
+                if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                    break
+                time.sleep(poll_interval)
+                continue
+            interval = min(self.heartbeat_interval, queue.lease_timeout / 3)
+            with _Heartbeat(interval, lambda: queue.touch(lease, self.worker_id)):
+                results, rankings = self.rank(lease, self.process(lease))
+            queue.finish(lease, self.worker_id, results, rankings)
+            processed += 1
+            idle_since = time.monotonic()
+        return processed
+
+
+# =============================================================================
+# SECTION 7: LOCAL MODE
+# =============================================================================
+
+def _tcp_worker_main(address: Tuple[str, int], frameworks: Tuple[str, ...]) -> None:
+    AuditWorker(frameworks=frameworks).run_tcp(address)
+
+
+def _directory_worker_main(root: str, frameworks: Tuple[str, ...]) -> None:
+    AuditWorker(frameworks=frameworks).run_directory(root, poll_interval=0.05)
+
+
+def run_local(
+    corpus: Iterable[Any],
+    output_dir: str,
+    workers: int = 2,
+    transport: str = "tcp",
+    frameworks: Tuple[str, ...] = FRAMEWORKS,
+    lease_size: int = DEFAULT_LEASE_SIZE,
+    lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+    ranking: Optional[TopKTracker] = None,
+    store_reports: bool = True
+) -> Dict[str, Any]:
+    """Run a coordinator and worker processes on this machine. Returns the manifest."""
+    coordinator = AuditCoordinator(corpus, output_dir, lease_size=lease_size,
+                                   lease_timeout=lease_timeout, ranking=ranking,
+                                   store_reports=store_reports)
+    if transport == "tcp":
+        address = coordinator.start_tcp(("127.0.0.1", 0))
+        target, args = _tcp_worker_main, (address, frameworks)
+    elif transport == "directory":
+        root = os.path.join(output_dir, "_leases")
+        target, args = _directory_worker_main, (root, frameworks)
+        DirectoryQueue(root).clear_done()
+    else:
+        raise ValueError(f"Unknown transport: {transport}")
+
+    processes = [multiprocessing.Process(target=target, args=args, daemon=True)
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        if transport == "tcp":
+            while not coordinator.table.is_done():
+                if not any(process.is_alive() for process in processes):
+                    # Every worker died: nobody is left to finish the leases
+                    coordinator.table.abandon()
+                    break
+                coordinator.finished.wait(0.05)
+            manifest = coordinator.manifest()
+        else:
+            manifest = coordinator.serve_directory(args[0], poll_interval=0.05)
+    finally:
+        for process in processes:
+            process.join(timeout=10)
+        coordinator.stop_tcp()
+    return manifest
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Distributed corpus audits")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve = subparsers.add_parser("coordinator", help="Serve leases for a JSONL corpus")
+    serve.add_argument("corpus")
+    serve.add_argument("output_dir")
+    serve.add_argument("--host", default="0.0.0.0")
+    serve.add_argument("--port", type=int, default=7461)
+    serve.add_argument("--directory", help="Shared directory instead of TCP")
+    serve.add_argument("--lease-size", type=int, default=DEFAULT_LEASE_SIZE)
+    serve.add_argument("--lease-timeout", type=float, default=DEFAULT_LEASE_TIMEOUT)
+    serve.add_argument("--top-k", type=int, help="Rank on the workers, keeping this many per score")
+    serve.add_argument("--rank-scores", default="overall_influence_index,composite_index")
+    serve.add_argument("--ranked-only", action="store_true",
+                       help="Store only the ranked reports; shards keep document ids")
+
+    work = subparsers.add_parser("worker", help="Pull and audit leases")
+    work.add_argument("--host", default="127.0.0.1")
+    work.add_argument("--port", type=int, default=7461)
+    work.add_argument("--directory", help="Shared directory instead of TCP")
+    work.add_argument("--frameworks", default=",".join(FRAMEWORKS))
+    work.add_argument("--pattern-pack", help="Pattern pack JSON, reloaded when it changes")
+    work.add_argument("--pack-cache-dir", help="Directory for validated pattern packs")
+
+    args = parser.parse_args()
+    if args.command == "coordinator":
+        ranking = TopKTracker(args.top_k, args.rank_scores.split(",")) if args.top_k else None
+        coordinator = AuditCoordinator(load_corpus(args.corpus), args.output_dir,
+                                       lease_size=args.lease_size, lease_timeout=args.lease_timeout,
+                                       ranking=ranking, store_reports=not args.ranked_only)
+        if args.directory:
+            manifest = coordinator.serve_directory(args.directory)
+        else:
+            manifest = coordinator.serve_tcp((args.host, args.port))
+        print(json.dumps(manifest, indent=2))
+    else:
+        worker = AuditWorker(frameworks=tuple(args.frameworks.split(",")),
+                             pattern_pack=args.pattern_pack, pack_cache_dir=args.pack_cache_dir)
+        if args.directory:
+            count = worker.run_directory(args.directory)
+        else:
+            count = worker.run_tcp((args.host, args.port))
+        print(f"Processed {count} leases")
+
+
+if __name__ == "__main__":
+    main()
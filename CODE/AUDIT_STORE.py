@@ -0,0 +1,456 @@
+"""
+AUDIT STORE
+===========
+Persistent, indexed storage for persuasion and integrity audits (SQLite).
+
+Each audit becomes one row in `audits` (framework, overall score,
+classification, timestamp) plus child rows for every detector score, red
+flag and integrity combination. Filters on those columns use covering
+indexes instead of a scan over JSON blobs. Writes are batched with
+executemany inside one transaction per batch.
+
+Accepted inputs: UnifiedPersuasionAuditor reports (dict), IntegrityAuditReport
+or its to_dict() form, CombinedAuditReport, and AuditWorker result records
+({"id", "persuasion", "integrity"}).
+
+Usage:
+    store = AuditStore("audits.db")
+    store.add_many((doc_id, auditor.audit(text)) for doc_id, text in corpus)
+    rows = store.query(min_scores={"SCARCITY": 80},
+                       intensities={"EMOTIONAL": "STRONG_ARC"},
+                       since="2026-01-01")
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import json
+import sqlite3
+import dataclasses
+from array import array
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Union
+
+# Import from companion modules
+try:
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor, IntegrityAuditReport
+    from COMBINED_AUDITOR import CombinedAuditReport
+    from AUDIT_COORDINATOR import iter_results
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor, IntegrityAuditReport
+    from COMBINED_AUDITOR import CombinedAuditReport
+    from AUDIT_COORDINATOR import iter_results
+
+# =============================================================================
+# SECTION 1: CONFIGURATION CONSTANTS
+# =============================================================================
+
+DEFAULT_BATCH_SIZE = 1000
+
+PERSUASION_GROUPS = ("tactical_stimulus", "psychological_principles", "linguistic_patterns")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS audits (
+    id INTEGER PRIMARY KEY,
+    doc_id TEXT,
+    framework TEXT NOT NULL,
+    audit_id TEXT,
+    content_hash TEXT,
+    content_length INTEGER,
+    audited_at REAL,
+    overall_score REAL,
+    classification TEXT,
+    report TEXT
+);
+CREATE INDEX IF NOT EXISTS audits_doc ON audits (doc_id);
+CREATE INDEX IF NOT EXISTS audits_framework_time ON audits (framework, audited_at);
+CREATE INDEX IF NOT EXISTS audits_framework_score ON audits (framework, overall_score);
+CREATE INDEX IF NOT EXISTS audits_classification ON audits (classification, audited_at);
+
+CREATE TABLE IF NOT EXISTS detector_scores (
+    audit INTEGER NOT NULL,
+    grp TEXT NOT NULL,
+    category TEXT NOT NULL,
+    score REAL NOT NULL,
+    intensity TEXT,
+    flagged INTEGER
+);
+CREATE INDEX IF NOT EXISTS detector_scores_category ON detector_scores (category, score, audit);
+CREATE INDEX IF NOT EXISTS detector_scores_intensity ON detector_scores (category, intensity, audit);
+CREATE INDEX IF NOT EXISTS detector_scores_audit ON detector_scores (audit);
+
+CREATE TABLE IF NOT EXISTS red_flags (
+    audit INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    score REAL
+);
+CREATE INDEX IF NOT EXISTS red_flags_category ON red_flags (category, severity, audit);
+
+CREATE TABLE IF NOT EXISTS combinations (
+    audit INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    intensity TEXT,
+    score REAL
+);
+CREATE INDEX IF NOT EXISTS combinations_type ON combinations (type, audit);
+"""
+
+
+def _epoch(value: Union[None, str, float, datetime]) -> Optional[float]:
+    """Timestamps are stored as epoch seconds; accept ISO strings and datetimes."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+# =============================================================================
+# SECTION 2: REPORT FLATTENING
+# =============================================================================
+
+@dataclasses.dataclass
+class StoredAudit:
+    """One audit flattened into the store's row layout."""
+    doc_id: Optional[str]
+    framework: str
+    audit_id: Optional[str]
+    content_hash: Optional[str]
+    content_length: Optional[int]
+    audited_at: Optional[float]
+    overall_score: float
+    classification: str
+    report: Optional[Dict[str, Any]]
+    scores: List[Tuple[str, str, float, Optional[str], Optional[int]]]
+    red_flags: List[Tuple[str, str, Optional[float]]]
+    combinations: List[Tuple[str, Optional[str], Optional[float]]]
+
+
+_integrity_serializer = IntegrityPatternAuditor()
+
+
+def flatten_persuasion(doc_id: Optional[str], report: Dict[str, Any]) -> StoredAudit:
+    scores = []
+    for group in PERSUASION_GROUPS:
+        for category, result in report.get(group, {}).items():
+            scores.append((group, category, result["score"], result["intensity"], None))
+    return StoredAudit(
+        doc_id=doc_id,
+        framework="persuasion",
+        audit_id=report.get("audit_id"),
+        content_hash=report.get("content_hash"),
+        content_length=report.get("content_length"),
+        audited_at=_epoch(report.get("timestamp")),
+        overall_score=report["composite_scores"]["overall_influence_index"],
+        classification=report["composite_scores"]["classification"],
+        report=report,
+        scores=scores,
+        red_flags=[(flag["category"], flag["severity"], flag.get("score")) for flag in report["red_flags"]],
+        combinations=[]
+    )
+
+
+def flatten_integrity(doc_id: Optional[str], report: Union[IntegrityAuditReport, Dict[str, Any]]) -> StoredAudit:
+    if isinstance(report, IntegrityAuditReport):
+        report = _integrity_serializer.to_dict(report)
+    scores = [
+        ("integrity", category, result["score"], None, int(result["flagged"]))
+        for category, result in report["detections"].items()
+    ]
+    combinations = [
+        (combo["type"], combo.get("intensity"), combo.get("score", combo.get("combined_score")))
+        for combo in report["pattern_combinations"]
+    ]
+    return StoredAudit(
+        doc_id=doc_id,
+        framework="integrity",
+        audit_id=report.get("audit_id"),
+        content_hash=None,
+        content_length=report.get("text_length"),
+        audited_at=_epoch(report.get("timestamp")),
+        overall_score=report["composite_index"],
+        classification=report["intensity"],
+        report=report,
+        scores=scores,
+        red_flags=[],
+        combinations=combinations
+    )
+
+
+def flatten(doc_id: Optional[str], report: Any) -> List[StoredAudit]:
+    """Flatten any supported report shape into one StoredAudit per framework."""
+    if isinstance(report, CombinedAuditReport):
+        shared = {
+            "audit_id": report.audit_id,
+            "timestamp": report.timestamp,
+            "content_hash": report.content_hash,
+            "content_length": report.content_length,
+        }
+        persuasion = flatten_persuasion(doc_id, dict(report.persuasion, **shared))
+        integrity = flatten_integrity(doc_id, dict(report.integrity, text_length=report.content_length,
+                                                   **{k: shared[k] for k in ("audit_id", "timestamp")}))
+        integrity.content_hash = report.content_hash
+        return [persuasion, integrity]
+    if isinstance(report, IntegrityAuditReport):
+        return [flatten_integrity(doc_id, report)]
+    if "persuasion" in report or "integrity" in report:
+        # AuditWorker result record
+        doc_id = report.get("id", doc_id)
+        stored = []
+        if "persuasion" in report:
+            stored.append(flatten_persuasion(doc_id, report["persuasion"]))
+        if "integrity" in report:
+            stored.append(flatten_integrity(doc_id, report["integrity"]))
+        return stored
+    if "detections" in report:
+        return [flatten_integrity(doc_id, report)]
+    return [flatten_persuasion(doc_id, report)]
+
+
+# =============================================================================
+# SECTION 3: STORE
+# =============================================================================
+
+class AuditStore:
+    """SQLite-backed audit store with bulk writes and indexed filters."""
+
+    def __init__(self, path: str = ":memory:", store_reports: bool = True):
+        self.path = path
+        self.store_reports = store_reports
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "AuditStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def add(self, doc_id: Optional[str], report: Any) -> List[int]:
+        """Store one report; returns the audit row ids written."""
+        return self._write(flatten(doc_id, report))
+
+    def add_many(self, items: Iterable[Any], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Store many reports, one transaction per batch.
+
+        Items are (doc_id, report) pairs or AuditWorker result records.
+        Returns the number of audit rows written.
+        """
+        written = 0
+        batch: List[StoredAudit] = []
+        for item in items:
+            if isinstance(item, tuple):
+                batch.extend(flatten(*item))
+            else:
+                batch.extend(flatten(None, item))
+            if len(batch) >= batch_size:
+                written += len(self._write(batch))
+                batch = []
+        if batch:
+            written += len(self._write(batch))
+        return written
+
+    def import_results(self, output_dir: str, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """Load the shards written by AuditCoordinator into the store."""
+        return self.add_many(iter_results(output_dir), batch_size=batch_size)
+
+    def _write(self, audits: List[StoredAudit]) -> List[int]:
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            first_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM audits").fetchone()[0]
+            ids = list(range(first_id, first_id + len(audits)))
+            self.conn.executemany(
+                "INSERT INTO audits VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (row_id, a.doc_id, a.framework, a.audit_id, a.content_hash, a.content_length,
+                     a.audited_at, a.overall_score, a.classification,
+                     json.dumps(a.report, default=str) if self.store_reports else None)
+                    for row_id, a in zip(ids, audits)
+                ]
+            )
+            self.conn.executemany(
+                "INSERT INTO detector_scores VALUES (?, ?, ?, ?, ?, ?)",
+                [(row_id,) + score for row_id, a in zip(ids, audits) for score in a.scores]
+            )
+            self.conn.executemany(
+                "INSERT INTO red_flags VALUES (?, ?, ?, ?)",
+                [(row_id,) + flag for row_id, a in zip(ids, audits) for flag in a.red_flags]
+            )
+            self.conn.executemany(
+                "INSERT INTO combinations VALUES (?, ?, ?, ?)",
+                [(row_id,) + combo for row_id, a in zip(ids, audits) for combo in a.combinations]
+            )
+        return ids
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def query(
+        self,
+        framework: Optional[str] = None,
+        min_scores: Optional[Dict[str, float]] = None,
+        max_scores: Optional[Dict[str, float]] = None,
+        intensities: Optional[Dict[str, str]] = None,
+        red_flags: Optional[List[str]] = None,
+        combinations: Optional[List[str]] = None,
+        classification: Optional[str] = None,
+        min_overall: Optional[float] = None,
+        since: Union[None, str, float, datetime] = None,
+        until: Union[None, str, float, datetime] = None,
+        doc_id: Optional[str] = None,
+        include_reports: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Audits matching every given filter (AND).
+
+        min_scores / max_scores / intensities are keyed by detector category
+        (e.g. "SCARCITY", "EMOTIONAL", "INTENSITY_ESCALATION"); red_flags by
+        red-flag category (e.g. "PSYCHOLOGICAL_SCARCITY"); combinations by
+        integrity combination type. `since` / `until` bound the audit time.
+        """
+        clauses, params = [], []
+        if framework is not None:
+            clauses.append("a.framework = ?")
+            params.append(framework)
+        if classification is not None:
+            clauses.append("a.classification = ?")
+            params.append(classification)
+        if min_overall is not None:
+            clauses.append("a.overall_score >= ?")
+            params.append(min_overall)
+        if since is not None:
+            clauses.append("a.audited_at >= ?")
+            params.append(_epoch(since))
+        if until is not None:
+            clauses.append("a.audited_at < ?")
+            params.append(_epoch(until))
+        if doc_id is not None:
+            clauses.append("a.doc_id = ?")
+            params.append(doc_id)
+        for category, score in (min_scores or {}).items():
+            clauses.append("a.id IN (SELECT audit FROM detector_scores WHERE category = ? AND score >= ?)")
+            params.extend([category, score])
+        for category, score in (max_scores or {}).items():
+            clauses.append("a.id IN (SELECT audit FROM detector_scores WHERE category = ? AND score <= ?)")
+            params.extend([category, score])
+        for category, intensity in (intensities or {}).items():
+            clauses.append("a.id IN (SELECT audit FROM detector_scores WHERE category = ? AND intensity = ?)")
+            params.extend([category, intensity])
+        for category in red_flags or []:
+            clauses.append("a.id IN (SELECT audit FROM red_flags WHERE category = ?)")
+            params.append(category)
+        for combination in combinations or []:
+            clauses.append("a.id IN (SELECT audit FROM combinations WHERE type = ?)")
+            params.append(combination)
+
+        columns = "a.id, a.doc_id, a.framework, a.audit_id, a.content_hash, a.content_length, " \
+                  "a.audited_at, a.overall_score, a.classification"
+        if include_reports:
+            columns += ", a.report"
+        sql = f"SELECT {columns} FROM audits a"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY a.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        rows = []
+        for row in self.conn.execute(sql, params):
+            record = dict(row)
+            if include_reports and record["report"] is not None:
+                record["report"] = json.loads(record["report"])
+            rows.append(record)
+        return rows
+
+    def scores(self, audit_row: int) -> Dict[str, float]:
+        """Per-detector scores for one stored audit."""
+        return {
+            row["category"]: row["score"]
+            for row in self.conn.execute("SELECT category, score FROM detector_scores WHERE audit = ?", (audit_row,))
+        }
+
+    def score_columns(self, framework: str, categories: Iterable[str]) -> Tuple[List[int], Dict[str, array]]:
+        """
+        Audit row ids of one framework, and per category a column of their
+        scores in the same order (0 where a category was not scored).
+        """
+        ids = [row[0] for row in self.conn.execute(
+            "SELECT id FROM audits WHERE framework = ? ORDER BY id", (framework,))]
+        position = {audit: index for index, audit in enumerate(ids)}
+        columns = {category: array("d", bytes(8 * len(ids))) for category in categories}
+        if columns:
+            placeholders = ", ".join("?" * len(columns))
+            for audit, category, score in self.conn.execute(
+                "SELECT d.audit, d.category, d.score FROM detector_scores d JOIN audits a ON a.id = d.audit "
+                f"WHERE a.framework = ? AND d.category IN ({placeholders})", [framework, *columns]
+            ):
+                columns[category][position[audit]] = score
+        return ids, columns
+
+    def detail_columns(self, framework: str, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], List[bool]]:
+        """
+        Per (category, detail key), whether each audit's detector details hold
+        a non-empty value, in score_columns() order. Reads the stored reports.
+        """
+        keys = list(keys)
+        columns: Dict[Tuple[str, str], List[bool]] = {key: [] for key in keys}
+        for row in self.conn.execute("SELECT report FROM audits WHERE framework = ? ORDER BY id", (framework,)):
+            if row["report"] is None:
+                raise ValueError("Detail columns need a store opened with store_reports=True")
+            report = json.loads(row["report"])
+            if framework == "integrity":
+                results = report.get("detections", {})
+            else:
+                results = {cat: result for group in PERSUASION_GROUPS for cat, result in report.get(group, {}).items()}
+            for category, key in keys:
+                details = results.get(category, {}).get("details", {})
+                columns[(category, key)].append(bool(details.get(key)))
+        return columns
+
+    def report(self, audit_row: int) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT report FROM audits WHERE id = ?", (audit_row,)).fetchone()
+        if row is None or row["report"] is None:
+            return None
+        return json.loads(row["report"])
+
+    def counts(self, column: str = "classification", framework: Optional[str] = None) -> Dict[Any, int]:
+        """
+        Audit counts grouped by classification, framework or doc_id.
+        Classifications are keyed (framework, classification) unless one
+        framework is given, since both frameworks use labels such as LOW.
+        """
+        if column not in ("classification", "framework", "doc_id"):
+            raise ValueError("column must be classification, framework or doc_id")
+        params: List[Any] = []
+        if column == "classification" and framework is None:
+            sql = "SELECT framework, classification, COUNT(*) FROM audits GROUP BY framework, classification"
+            return {(name, label): count for name, label, count in self.conn.execute(sql)}
+        sql = f"SELECT {column}, COUNT(*) FROM audits"
+        if framework is not None:
+            sql += " WHERE framework = ?"
+            params.append(framework)
+        sql += f" GROUP BY {column}"
+        return {key: count for key, count in self.conn.execute(sql, params)}
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM audits").fetchone()[0]
@@ -0,0 +1,282 @@
+"""
+COMBINATION RULES
+=================
+Declarative combination rules for red flags and integrity combinations,
+compiled to Python for per-document and whole-archive evaluation.
+
+A rule is plain data (JSON-ready), so policy teams can add one without a
+code change:
+
+    {
+        "name": "COMPOUND_TARGETING",
+        "when": {"all": [{"score": "SUSCEPTIBILITY_TARGETING", "gt": 25},
+                         {"score": "EMOTIONAL_CYCLING", "gt": 30}]},
+        "emit": {"type": "COMPOUND_TARGETING", "intensity": "EXTREME",
+                 "combined_score": {"mean": ["SUSCEPTIBILITY_TARGETING", "EMOTIONAL_CYCLING"]}}
+    }
+
+Conditions:
+    {"score": CATEGORY, OP: number}     OP is gt, ge, lt, le or eq; a missing
+                                        category scores 0
+    {"detail": [CATEGORY, KEY]}         the detector's details[KEY] is present
+                                        and non-empty
+    {"all": [...]}, {"any": [...]}, {"not": condition}
+Emitted fields, in order, are literal JSON values or:
+    {"score": CATEGORY}                 the category's score
+    {"mean": [CATEGORY, ...]}           mean of the scores
+    {"matches": CATEGORY, "limit": N}   the first N matches
+    {"detail": [CATEGORY, KEY], "limit": N}
+
+Each condition compiles to one Python expression over score and detail
+variables. Per document it runs as a function of the detector results; over
+a batch it runs as a single comprehension over score columns. So a new rule
+can be re-evaluated over every stored audit (AuditStore.score_columns) in
+seconds, without re-auditing any text.
+
+Usage:
+    rules = RuleSet.load("policy_rules.json")
+    combinations = rules.evaluate(report_detections)
+    matched = rules.evaluate_store(store, "integrity")   # {rule: [audit row ids]}
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import copy
+import json
+import math
+from typing import Dict, List, Optional, Any, Callable, Iterable, Sequence, Tuple
+
+COMPARISONS = {"gt": ">", "ge": ">=", "lt": "<", "le": "<=", "eq": "=="}
+
+# =============================================================================
+# SECTION 1: DEFAULT RULES
+# =============================================================================
+
+PERSUASION_COMBINATION_RULES: List[Dict[str, Any]] = [
+    {
+        "name": "EMOTIONAL_SCARCITY",
+        "when": {"all": [{"score": "EMOTIONAL", "gt": 50}, {"score": "SCARCITY", "gt": 50}]},
+        "emit": {
+            "category": "COMBINATION",
+            "severity": "HIGH",
+            "score": {"mean": ["EMOTIONAL", "SCARCITY"]},
+            "details": "Emotional arc + scarcity combination detected (high-pressure pattern)",
+            "matches": [],
+        },
+    },
+]
+
+
+def _single(name: str, threshold: int, limit: int) -> Dict[str, Any]:
+    return {
+        "name": f"HIGH_{name}",
+        "when": {"score": name, "gt": threshold},
+        "emit": {"type": f"HIGH_{name}", "intensity": "EXTREME",
+                 "score": {"score": name}, "matches": {"matches": name, "limit": limit}},
+    }
+
+
+def _joint(name: str, intensity: str, categories: List[str], threshold: Any) -> Dict[str, Any]:
+    thresholds = threshold if isinstance(threshold, list) else [threshold] * len(categories)
+    return {
+        "name": name,
+        "when": {"all": [{"score": cat, "gt": limit} for cat, limit in zip(categories, thresholds)]},
+        "emit": {"type": name, "intensity": intensity, "combined_score": {"mean": categories}},
+    }
+
+
+INTEGRITY_COMBINATION_RULES: List[Dict[str, Any]] = [
+    _single("SUSCEPTIBILITY_TARGETING", 50, 5),
+    _single("INTENSITY_ESCALATION", 40, 5),
+    {
+        "name": "DEHUMANIZATION_PRESENT",
+        "when": {"detail": ["INTENSITY_ESCALATION", "dehumanization_markers"]},
+        "emit": {"type": "DEHUMANIZATION_PRESENT", "intensity": "EXTREME",
+                 "matches": {"detail": ["INTENSITY_ESCALATION", "dehumanization_markers"], "limit": 3}},
+    },
+    _joint("IDENTITY_PLUS_ENVIRONMENT", "HIGH", ["IDENTITY_POSITION", "INFORMATION_ENVIRONMENT"], 30),
+    _joint("ESCALATION_PIPELINE", "EXTREME",
+           ["INFORMATION_ENVIRONMENT", "INTENSITY_ESCALATION", "IDENTITY_POSITION"], 30),
+    _joint("COMPOUND_TARGETING", "EXTREME",
+           ["SUSCEPTIBILITY_TARGETING", "EMOTIONAL_CYCLING", "COGNITIVE_LOAD"], [25, 30, 30]),
+    _joint("LAYERED_CONCEALMENT", "HIGH",
+           ["SYNTHETIC_AUTHORITY", "UNDISCLOSED_COMMERCIAL", "CONCEALED_IDENTITY"], 30),
+]
+
+
+# =============================================================================
+# SECTION 2: COMPILER
+# =============================================================================
+
+class _Compiler:
+    """Turns a condition into a Python expression over numbered variables."""
+
+    def __init__(self, rule_name: str = ""):
+        self.rule_name = rule_name
+        self.scores: List[str] = []
+        self.details: List[Tuple[str, str]] = []
+
+    def _score(self, category: str) -> str:
+        if category not in self.scores:
+            self.scores.append(category)
+        return f"s{self.scores.index(category)}"
+
+    def _detail(self, category: str, key: str) -> str:
+        if (category, key) not in self.details:
+            self.details.append((category, key))
+        return f"d{self.details.index((category, key))}"
+
+    def expression(self, condition: Dict[str, Any]) -> str:
+        if "all" in condition or "any" in condition:
+            joiner = " and " if "all" in condition else " or "
+            parts = [self.expression(part) for part in condition.get("all", condition.get("any"))]
+            return f"({joiner.join(parts)})" if parts else ("True" if "all" in condition else "False")
+        if "not" in condition:
+            return f"(not {self.expression(condition['not'])})"
+        if "detail" in condition:
+            category, key = condition["detail"]
+            return self._detail(str(category), str(key))
+        if "score" in condition:
+            ops = [op for op in COMPARISONS if op in condition]
+            if len(ops) != 1:
+                raise ValueError(f"Score condition needs exactly one of {sorted(COMPARISONS)}: {condition}")
+            # float() rejects anything that is not a number, so no rule text reaches the source;
+            # inf and nan would, and compile to bare names the evaluation cannot resolve
+            threshold = float(condition[ops[0]])
+            if not math.isfinite(threshold):
+                raise ValueError(f"Rule {self.rule_name}: score threshold must be finite: {condition}")
+            return f"({self._score(str(condition['score']))} {COMPARISONS[ops[0]]} {threshold!r})"
+        raise ValueError(f"Unknown condition: {condition}")
+
+
+def _field(spec: Any) -> Callable[[Dict[str, Any]], Any]:
+    """Getter for one emitted field over {category: detector result}."""
+    if isinstance(spec, dict) and len(spec.keys() - {"limit"}) == 1:
+        limit = spec.get("limit")
+        if "score" in spec:
+            category = spec["score"]
+            return lambda results: _score_of(results, category)
+        if "mean" in spec:
+            categories = list(spec["mean"])
+            return lambda results: sum(_score_of(results, cat) for cat in categories) / len(categories)
+        if "matches" in spec:
+            category = spec["matches"]
+            return lambda results: list(results[category].matches[:limit])
+        if "detail" in spec:
+            category, key = spec["detail"]
+            return lambda results: results[category].details[key][:limit]
+    return lambda results: copy.deepcopy(spec)
+
+
+def _score_of(results: Dict[str, Any], category: str) -> Any:
+    result = results.get(category)
+    return result.score if result is not None else 0
+
+
+def _has_detail(results: Dict[str, Any], category: str, key: str) -> bool:
+    result = results.get(category)
+    return bool(result is not None and key in result.details and result.details[key])
+
+
+class CompiledRule:
+    """One rule: a compiled row test, a compiled column test and field getters."""
+
+    def __init__(self, rule: Dict[str, Any]):
+        self.rule = rule
+        self.name = rule["name"]
+        compiler = _Compiler(self.name)
+        expression = compiler.expression(rule["when"])
+        self.scores = compiler.scores
+        self.details = compiler.details
+        self.source = expression
+
+        names = [f"s{i}" for i in range(len(self.scores))] + [f"d{i}" for i in range(len(self.details))]
+        self._row = eval(f"lambda {', '.join(names) or '*_'}: {expression}", {"__builtins__": {}})
+        if names:
+            self._column = eval(
+                f"lambda columns: [{expression} for {', '.join(names)}{',' if len(names) == 1 else ''}"
+                f" in zip(*columns)]", {"__builtins__": {"zip": zip}})
+        else:
+            self._column = lambda columns, value=eval(expression, {"__builtins__": {}}): value
+        self.fields = [(key, _field(spec)) for key, spec in rule["emit"].items()]
+
+    def test(self, results: Dict[str, Any]) -> bool:
+        return self._row(*(_score_of(results, cat) for cat in self.scores),
+                         *(_has_detail(results, cat, key) for cat, key in self.details))
+
+    def emit(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: getter(results) for key, getter in self.fields}
+
+    def test_columns(self, scores: Dict[str, Sequence[float]], details: Dict[Tuple[str, str], Sequence[bool]],
+                     length: int) -> List[bool]:
+        if not self.scores and not self.details:
+            return [self._column(None)] * length
+        columns = [scores[cat] if cat in scores else [0] * length for cat in self.scores]
+        for key in self.details:
+            if key not in details:
+                raise KeyError(f"Rule {self.name} needs detail column {key}")
+            columns.append(details[key])
+        return self._column(columns)
+
+
+# =============================================================================
+# SECTION 3: RULE SET
+# =============================================================================
+
+class RuleSet:
+    """An ordered list of compiled combination rules."""
+
+    def __init__(self, rules: Iterable[Dict[str, Any]]):
+        self.rules = [CompiledRule(rule) for rule in rules]
+
+    @classmethod
+    def load(cls, path: str) -> "RuleSet":
+        with open(path, encoding="utf-8") as handle:
+            return cls(json.load(handle))
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_list(), handle, indent=2, ensure_ascii=False)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return [rule.rule for rule in self.rules]
+
+    @property
+    def categories(self) -> List[str]:
+        seen: List[str] = []
+        for rule in self.rules:
+            seen.extend(cat for cat in rule.scores if cat not in seen)
+        return seen
+
+    @property
+    def detail_keys(self) -> List[Tuple[str, str]]:
+        seen: List[Tuple[str, str]] = []
+        for rule in self.rules:
+            seen.extend(key for key in rule.details if key not in seen)
+        return seen
+
+    def evaluate(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Emitted records of every rule that holds, in rule order."""
+        return [rule.emit(results) for rule in self.rules if rule.test(results)]
+
+    def evaluate_columns(self, scores: Dict[str, Sequence[float]],
+                         details: Optional[Dict[Tuple[str, str], Sequence[bool]]] = None,
+                         length: Optional[int] = None) -> Dict[str, List[bool]]:
+        """
+        Per-rule match masks over a batch given as one score column per
+        category (and one bool column per (category, detail key) used).
+        """
+        details = details or {}
+        if length is None:
+            length = len(next(iter(scores.values()))) if scores else len(next(iter(details.values()), ()))
+        return {rule.name: rule.test_columns(scores, details, length) for rule in self.rules}
+
+    def evaluate_store(self, store: Any, framework: str) -> Dict[str, List[int]]:
+        """Audit row ids matching each rule, from an AuditStore's stored scores."""
+        ids, scores = store.score_columns(framework, self.categories)
+        details: Dict[Tuple[str, str], List[bool]] = {}
+        if self.detail_keys:
+            details = store.detail_columns(framework, self.detail_keys)
+        masks = self.evaluate_columns(scores, details, len(ids))
+        return {name: [row for row, hit in zip(ids, mask) if hit] for name, mask in masks.items()}
@@ -0,0 +1,157 @@
+"""
+COMBINED AUDITOR
+================
+Persuasion and integrity audits over one shared scan.
+
+UnifiedPersuasionAuditor and IntegrityPatternAuditor both run against a single
+ScanContext, driven by one scan plan merged across Patterns and
+IntegrityPatterns. The text is lowercased and split once, each regex and
+keyword probe runs once, and both frameworks' results come back in one
+report with one set of metadata.
+
+Usage:
+    auditor = CombinedAuditor()
+    report = auditor.audit("Your content text here")
+    print(report.to_json())
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import json
+import hashlib
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext, ScanPlan
+    from MARKUP_EXTRACTOR import extract_markup
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor, IntegrityAuditReport
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext, ScanPlan
+    from MARKUP_EXTRACTOR import extract_markup
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor, IntegrityAuditReport
+
+# Per-document metadata carried once at the top of the combined report
+PERSUASION_METADATA_KEYS = ("audit_id", "timestamp", "content_hash", "content_length", "content_preview")
+INTEGRITY_METADATA_KEYS = ("audit_id", "timestamp", "text_length")
+
+
+# =============================================================================
+# SECTION 1: REPORT
+# =============================================================================
+
+@dataclass
+class CombinedAuditReport:
+    """Both frameworks' results for one document."""
+    audit_id: str
+    timestamp: str
+    content_hash: str
+    content_length: int
+    content_preview: str
+    persuasion: Dict[str, Any]
+    integrity: Dict[str, Any]
+    summary: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent, default=str)
+
+
+# =============================================================================
+# SECTION 2: COMBINED AUDITOR
+# =============================================================================
+
+class CombinedAuditor:
+    """
+    Run both auditors over one ScanContext per document.
+
+    The merged scan plan is recorded once at construction; `audit` primes a
+    fresh context with it and hands the same context to both auditors.
+    """
+
+    def __init__(self, normalize: bool = False, sentence_cache: Any = None):
+        self.normalize = normalize
+        self.persuasion = UnifiedPersuasionAuditor(normalize)
+        self.integrity = IntegrityPatternAuditor(normalize)
+        self.plan = ScanPlan.record(self._run)
+        # Optional SentenceCache (SENTENCE_CACHE.py) shared across documents
+        self.sentence_cache = sentence_cache
+
+    def _prime(self, ctx: ScanContext) -> ScanContext:
+        if self.sentence_cache is not None:
+            self.sentence_cache.prime(ctx)
+        return self.plan.execute(ctx)
+
+    def _run(self, ctx: ScanContext,
+             deadline: Optional[float] = None) -> Tuple[Dict[str, Any], IntegrityAuditReport]:
+        return (self.persuasion.audit(ctx.original, ctx, deadline),
+                self.integrity.audit(ctx.original, ctx, deadline))
+
+    def context(self, text: str) -> ScanContext:
+        """A ScanContext for `text` with every planned scan already run."""
+        return self._prime(ScanContext.create(text, self.normalize))
+
+    def audit(self, text: str, ctx: Optional[ScanContext] = None,
+              deadline: Optional[float] = None) -> CombinedAuditReport:
+        """
+        Audit `text` under both frameworks. With a deadline (AUDIT_BUDGET.py)
+        the planned scans are not run up front: each auditor runs detectors
+        lazily in value-per-cost order and reports bounds for the rest. The
+        persuasion audit gets the time it needs first; integrity gets what is left.
+        """
+        if ctx is None:
+            ctx = self.context(text) if deadline is None else ScanContext.create(text, self.normalize)
+        persuasion, integrity_report = self._run(ctx, deadline)
+        integrity = self.integrity.to_dict(integrity_report)
+
+        timestamp = datetime.now().isoformat()
+        summary = {
+            "persuasion_score": persuasion["summary"]["overall_score"],
+            "persuasion_classification": persuasion["summary"]["classification"],
+            "red_flag_count": len(persuasion["red_flags"]),
+            "integrity_index": integrity["composite_index"],
+            "integrity_intensity": integrity["intensity"],
+            "integrity_categories_flagged": integrity["summary"]["categories_flagged"],
+            "integrity_combination_count": integrity["summary"]["combination_count"],
+        }
+
+        return CombinedAuditReport(
+            audit_id=hashlib.md5(f"{text[:100]}{timestamp}".encode()).hexdigest()[:12],
+            timestamp=timestamp,
+            content_hash=persuasion["content_hash"],
+            content_length=len(text),
+            content_preview=persuasion["content_preview"],
+            persuasion={k: v for k, v in persuasion.items() if k not in PERSUASION_METADATA_KEYS},
+            integrity={k: v for k, v in integrity.items() if k not in INTEGRITY_METADATA_KEYS},
+            summary=summary
+        )
+
+    def audit_markup(self, content: str, source_format: str = "auto") -> CombinedAuditReport:
+        """Audit raw HTML or Markdown, keeping its block structure for the detectors."""
+        extracted = extract_markup(content, source_format)
+        ctx = self._prime(ScanContext.from_extracted(extracted, self.normalize))
+        return self.audit(extracted.text, ctx)
+
+    def quick_score(self, text: str) -> Dict[str, Any]:
+        """Headline scores for both frameworks from one shared scan."""
+        ctx = self.context(text)
+        return {
+            "persuasion": self.persuasion.quick_score(text, ctx),
+            "integrity": self.integrity.quick_score(text, ctx),
+        }
+
+
+def audit_combined(text: str) -> CombinedAuditReport:
+    auditor = CombinedAuditor()
+    return auditor.audit(text)
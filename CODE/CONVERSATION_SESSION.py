@@ -0,0 +1,181 @@
+"""
+CONVERSATION SESSION
+====================
+Streaming integrity audit over a conversation thread.
+
+Messages are ingested one at a time. Each message is scanned once, together
+with a bounded tail of the preceding thread, so sequence markers that cross a
+message boundary (fear→relief, bad news→good news, graduated escalation) are
+still caught. Per-marker counts, bounded match samples and word/sentence
+totals are kept as running state. Category scores, the composite index and
+pattern combinations are rebuilt from that state after every message, so the
+cost of a message does not depend on how long the thread already is.
+
+Scores track IntegrityPatternAuditor.audit() on the messages joined with a
+space; only matches spanning more than the tail window can differ.
+
+Usage:
+    session = ConversationSession()
+    for message in thread:
+        report = session.add_message(message)
+        print(report.composite_index, report.pattern_combinations)
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import hashlib
+from typing import Dict, List, Optional, Any, Tuple, Pattern
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import SENTENCE_BOUNDARY, findall_item
+    from INTEGRITY_VIOLATION_DETECTOR import (
+        IntegrityPatternAuditor, IntegrityAuditReport, DetectionResult
+    )
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import SENTENCE_BOUNDARY, findall_item
+    from INTEGRITY_VIOLATION_DETECTOR import (
+        IntegrityPatternAuditor, IntegrityAuditReport, DetectionResult
+    )
+
+# =============================================================================
+# SECTION 1: CONFIGURATION CONSTANTS
+# =============================================================================
+
+MESSAGE_SEPARATOR = " "
+DEFAULT_TAIL_CHARS = 600     # Covers the longest bounded sequence markers (.{500,} disclosure)
+DEFAULT_MAX_SAMPLES = 25     # Distinct matches kept per category and per marker
+
+# Markers scored outside MARKER_SCORES
+HEDGING_MARKER = "NATURAL_HEDGING"
+SENTENCE_MARKER = "SENTENCE_BOUNDARY"
+
+
+# =============================================================================
+# SECTION 2: SESSION
+# =============================================================================
+
+class ConversationSession:
+    """Rolling integrity state for one conversation thread."""
+
+    def __init__(
+        self,
+        auditor: Optional[IntegrityPatternAuditor] = None,
+        tail_chars: int = DEFAULT_TAIL_CHARS,
+        max_samples: int = DEFAULT_MAX_SAMPLES
+    ):
+        self.auditor = auditor or IntegrityPatternAuditor()
+        self.tail_chars = tail_chars
+        self.max_samples = max_samples
+
+        self.markers: Dict[str, List[Tuple[str, int]]] = {
+            category: list(detector.MARKER_SCORES.items())
+            for category, detector in self.auditor.detectors.items()
+        }
+        # Each detector's own pattern holder, so a pattern pack applied to the
+        # auditor changes the regexes together with the scores
+        self.patterns: Dict[str, Pattern] = {
+            marker: getattr(self.auditor.detectors[category].patterns, marker)
+            for category, markers in self.markers.items() for marker, _ in markers
+        }
+        self.patterns[HEDGING_MARKER] = self.auditor.detectors["SYNTHETIC_AUTHORITY"].patterns.NATURAL_HEDGING
+        self.patterns[SENTENCE_MARKER] = SENTENCE_BOUNDARY
+
+        self.counts: Dict[str, int] = {marker: 0 for marker in self.patterns}
+        self.samples: Dict[str, Dict[str, None]] = {marker: {} for marker in self.patterns}
+        self._last_end: Dict[str, int] = {marker: 0 for marker in self.patterns}
+
+        self.tail = ""
+        self.length = 0
+        self.word_count = 0
+        self.message_count = 0
+        self._digest = hashlib.md5()
+
+    def add_message(self, message: str) -> IntegrityAuditReport:
+        """Ingest one message and return the updated thread report."""
+        piece = MESSAGE_SEPARATOR + message if self.message_count else message
+        window = self.tail + piece
+        window_start = self.length - len(self.tail)
+
+        for marker, pattern in self.patterns.items():
+            self._scan(marker, pattern, window, window_start)
+
+        self.length += len(piece)
+        self.word_count += len(message.split())
+        self.message_count += 1
+        self._digest.update(piece.encode())
+        self.tail = self._trim_tail(window)
+        return self.report()
+
+    def _scan(self, marker: str, pattern: Pattern, window: str, window_start: int) -> None:
+        # Count matches that reach into the new message and do not overlap a
+        # match already counted for this marker.
+        for match in pattern.finditer(window):
+            start, end = window_start + match.start(), window_start + match.end()
+            if end <= self.length or start < self._last_end[marker]:
+                continue
+            self.counts[marker] += 1
+            self._last_end[marker] = end
+            samples = self.samples[marker]
+            if len(samples) < self.max_samples:
+                finding = findall_item(match)
+                samples[finding[0] if isinstance(finding, tuple) else finding] = None
+
+    def _trim_tail(self, window: str) -> str:
+        if len(window) <= self.tail_chars:
+            return window
+        tail = window[-self.tail_chars:]
+        # Start on a word boundary so a cut word cannot fake a match
+        cut = tail.find(" ")
+        return tail[cut + 1:] if cut >= 0 else tail
+
+    def _detection(self, category: str) -> DetectionResult:
+        detector = self.auditor.detectors[category]
+        raw_score = 0
+        matches: Dict[str, None] = {}
+        details: Dict[str, Any] = {"marker_counts": {}}
+        for marker, points in self.markers[category]:
+            count = self.counts[marker]
+            if not count:
+                continue
+            raw_score += count * points
+            details["marker_counts"][marker] = count
+            details[marker.lower()] = list(self.samples[marker])
+            for sample in self.samples[marker]:
+                if len(matches) < self.max_samples:
+                    matches[sample] = None
+
+        hedging_penalty = getattr(detector, "HEDGING_PENALTY", 0)
+        if hedging_penalty:
+            hedging_present = self.counts[HEDGING_MARKER] > 0
+            details["natural_hedging_present"] = hedging_present
+            if not hedging_present and self.length > 200:
+                raw_score += hedging_penalty
+
+        complexity_bonus = getattr(detector, "COMPLEXITY_BONUS", 0)
+        if complexity_bonus:
+            sentence_count = self.counts[SENTENCE_MARKER] + 1
+            if self.word_count / sentence_count > 25 and self.word_count > 500:
+                raw_score += complexity_bonus
+
+        normalized_score = min(int((raw_score / detector.MAX_SCORE) * 100), 100)
+        return DetectionResult(
+            category=category,
+            score=normalized_score,
+            flagged=normalized_score > detector.THRESHOLD,
+            threshold=detector.THRESHOLD,
+            matches=list(matches),
+            details=details
+        )
+
+    def report(self) -> IntegrityAuditReport:
+        """Report for the thread so far, rebuilt from the running state."""
+        detections = {category: self._detection(category) for category in self.markers}
+        report = self.auditor._build_report(detections, self._digest.hexdigest()[:12], self.length)
+        report.summary["message_count"] = self.message_count
+        return report
@@ -0,0 +1,391 @@
+"""
+CORPUS SKETCHES
+===============
+Approximate corpus-wide pattern frequencies and score distributions.
+
+Memory is fixed no matter how many documents pass through:
+    - CountMinSketch counts documents per pattern term (PATTERN_REGISTRY ids);
+      estimates never undercount and overcount by at most ~e/width of the
+      total with probability 1 - e^-depth.
+    - KLLSketch keeps a quantile summary per score (composites, every
+      persuasion detector and integrity category); rank error is about
+      1.7 / k.
+Both serialize to JSON and merge, so each shard or worker sketches its own
+share and the results combine into the corpus view without keeping any
+per-document output.
+
+Usage:
+    sketches = CorpusSketches()
+    auditor = SketchingAuditor(CombinedAuditor(), sketches)
+    for doc_id, text in corpus:
+        auditor.audit(text)
+    sketches.percentiles("SCARCITY", [0.5, 0.9, 0.99])
+    sketches.exceed_rate("SCARCITY", RedFlagGenerator.HIGH_SCORE_THRESHOLD)
+    sketches.heavy_hitters(20)
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import sys
+import math
+import json
+import base64
+import random
+import hashlib
+from array import array
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_REGISTRY import PatternRegistry
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor
+    from TOP_K_RANKING import SCORE_ALIASES, PERSUASION_GROUPS, resolve_score_path, framework_view, score_at
+except ImportError:
+    # Fallback if running from different directory
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_REGISTRY import PatternRegistry
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor
+    from TOP_K_RANKING import SCORE_ALIASES, PERSUASION_GROUPS, resolve_score_path, framework_view, score_at
+
+DEFAULT_SCORES = tuple(SCORE_ALIASES) + tuple(PERSUASION_GROUPS) + tuple(IntegrityPatternAuditor.CATEGORY_WEIGHTS)
+
+
+# =============================================================================
+# SECTION 1: COUNT-MIN SKETCH
+# =============================================================================
+
+class CountMinSketch:
+    """Counts per key in width * depth counters; merge by addition."""
+
+    def __init__(self, width: int = 2048, depth: int = 5, seed: int = 0):
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.table = array("Q", bytes(8 * width * depth))
+        self.total = 0
+        self._key = seed.to_bytes(8, "little")
+
+    def _cells(self, key: str) -> List[int]:
+        # Row hashes derived from one 128-bit digest (h1 + row * h2)
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16, key=self._key).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [row * self.width + (h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Add to a key; returns its new estimate."""
+        table = self.table
+        estimate = None
+        for cell in self._cells(key):
+            table[cell] += count
+            if estimate is None or table[cell] < estimate:
+                estimate = table[cell]
+        self.total += count
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        return min(self.table[cell] for cell in self._cells(key))
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (other.width, other.depth, other.seed) != (self.width, self.depth, self.seed):
+            raise ValueError("cannot merge count-min sketches with different shapes or seeds")
+        table = self.table
+        for cell, count in enumerate(other.table):
+            if count:
+                table[cell] += count
+        self.total += other.total
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        table = array("Q", self.table)
+        if sys.byteorder == "big":
+            table.byteswap()
+        return {
+            "width": self.width,
+            "depth": self.depth,
+            "seed": self.seed,
+            "total": self.total,
+            "table": base64.b64encode(table.tobytes()).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CountMinSketch":
+        sketch = cls(data["width"], data["depth"], data["seed"])
+        sketch.table = array("Q", base64.b64decode(data["table"]))
+        if sys.byteorder == "big":
+            sketch.table.byteswap()
+        sketch.total = data["total"]
+        return sketch
+
+
+# =============================================================================
+# SECTION 2: KLL QUANTILE SKETCH
+# =============================================================================
+
+class KLLSketch:
+    """
+    Karnin-Lang-Liberty quantile sketch.
+
+    Level h holds items of weight 2^h. A full level is sorted and every
+    other item (random offset) is promoted, so total weight always equals
+    the number of values added.
+    """
+
+    C = 2.0 / 3.0
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.compactors: List[List[float]] = [[]]
+        self.n = 0
+        self.size = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._rng = random.Random(seed)
+        self._max_size = self._capacity(0)
+
+    def _capacity(self, level: int) -> int:
+        height = len(self.compactors)
+        return max(2, int(math.ceil(self.k * self.C ** (height - level - 1))))
+
+    def _grow(self) -> None:
+        self.compactors.append([])
+        self._max_size = sum(self._capacity(level) for level in range(len(self.compactors)))
+
+    def add(self, value: float) -> None:
+        self.compactors[0].append(value)
+        self.size += 1
+        self.n += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self.size >= self._max_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        for level in range(len(self.compactors)):
+            items = self.compactors[level]
+            if len(items) < self._capacity(level):
+                continue
+            if level + 1 == len(self.compactors):
+                self._grow()
+            items.sort()
+            odd = len(items) % 2
+            promoted = items[odd + self._rng.randint(0, 1)::2]
+            self.compactors[level] = items[:odd]
+            self.compactors[level + 1].extend(promoted)
+            self.size -= len(items) - odd - len(promoted)
+            if self.size < self._max_size:
+                break
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        if other.k != self.k:
+            raise ValueError("cannot merge KLL sketches with different k")
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.n += other.n
+        self.size = sum(len(items) for items in self.compactors)
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        while self.size >= self._max_size:
+            self._compress()
+        return self
+
+    def _weighted(self) -> List[Tuple[float, int]]:
+        items = [(value, 1 << level) for level, values in enumerate(self.compactors) for value in values]
+        items.sort()
+        return items
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate value at quantile q in [0, 1]."""
+        if not self.n:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        target, cumulative = q * self.n, 0
+        for value, weight in self._weighted():
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return self.max
+
+    def rank(self, value: float, inclusive: bool = True) -> float:
+        """Approximate fraction of values <= value (< value if not inclusive)."""
+        if not self.n:
+            return 0.0
+        below = sum(weight for item, weight in self._weighted()
+                    if item < value or (inclusive and item == value))
+        return below / self.n
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"k": self.k, "n": self.n, "min": self.min, "max": self.max, "compactors": self.compactors}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], seed: int = 0) -> "KLLSketch":
+        sketch = cls(data["k"], seed)
+        sketch.compactors = [list(items) for items in data["compactors"]]
+        sketch._max_size = sum(sketch._capacity(level) for level in range(len(sketch.compactors)))
+        sketch.n = data["n"]
+        sketch.size = sum(len(items) for items in sketch.compactors)
+        sketch.min, sketch.max = data["min"], data["max"]
+        return sketch
+
+
+# =============================================================================
+# SECTION 3: CORPUS SKETCHES
+# =============================================================================
+
+class CorpusSketches:
+    """Pattern-hit frequencies and score distributions for one shard or corpus."""
+
+    def __init__(self, scores: Iterable[str] = DEFAULT_SCORES, width: int = 2048, depth: int = 5,
+                 k: int = 200, heavy_hitter_capacity: int = 256, seed: int = 0,
+                 registry: Optional[PatternRegistry] = None):
+        self.scores = {score: resolve_score_path(score) for score in scores}
+        self.hits = CountMinSketch(width, depth, seed)
+        self.distributions = {score: KLLSketch(k, seed) for score in self.scores}
+        self.heavy_hitter_capacity = heavy_hitter_capacity
+        self.candidates: Dict[str, int] = {}
+        self.documents = 0
+        self._registry = registry
+
+    @property
+    def registry(self) -> PatternRegistry:
+        if self._registry is None:
+            self._registry = PatternRegistry.default()
+        return self._registry
+
+    def observe(self, report: Any, ctx: Optional[ScanContext] = None) -> None:
+        """
+        Fold one audited document in. Score distributions come from the report;
+        pattern hits need the audit's ScanContext and are skipped without it.
+        Only probes the audit made are counted; nothing is scanned again, so
+        a report reused from a near-duplicate adds no pattern hits.
+        """
+        self.documents += 1
+        view = framework_view(report)
+        for score, path in self.scores.items():
+            value = score_at(view, path)
+            if value is not None:
+                self.distributions[score].add(value)
+        if ctx is not None:
+            for term_id, term in self.registry.terms.items():
+                if term.observed(ctx):
+                    self._track(term_id, self.hits.add(term_id))
+
+    def _track(self, term_id: str, estimate: int) -> None:
+        candidates = self.candidates
+        if term_id in candidates or len(candidates) < self.heavy_hitter_capacity:
+            candidates[term_id] = estimate
+            return
+        weakest = min(candidates, key=candidates.get)
+        if estimate > candidates[weakest]:
+            del candidates[weakest]
+            candidates[term_id] = estimate
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def hit_rate(self, term_id: str) -> float:
+        """Estimated fraction of documents in which a pattern term fired."""
+        return self.hits.estimate(term_id) / self.documents if self.documents else 0.0
+
+    def heavy_hitters(self, n: int = 20) -> List[Tuple[str, int]]:
+        """Most frequently hit pattern terms with estimated document counts."""
+        ranked = sorted(((term_id, self.hits.estimate(term_id)) for term_id in self.candidates),
+                        key=lambda item: (-item[1], item[0]))
+        return ranked[:n]
+
+    def percentiles(self, score: str, quantiles: Iterable[float] = (0.5, 0.9, 0.99)) -> Dict[float, Optional[float]]:
+        sketch = self.distributions[score]
+        return {q: sketch.quantile(q) for q in quantiles}
+
+    def exceed_rate(self, score: str, threshold: float) -> float:
+        """Estimated fraction of documents scoring at or above a threshold."""
+        return 1.0 - self.distributions[score].rank(threshold, inclusive=False)
+
+    # -------------------------------------------------------------------------
+    # Merge and persistence
+    # -------------------------------------------------------------------------
+
+    def merge(self, other: "CorpusSketches") -> "CorpusSketches":
+        self.hits.merge(other.hits)
+        for score, sketch in other.distributions.items():
+            if score in self.distributions:
+                self.distributions[score].merge(sketch)
+            else:
+                self.scores[score] = other.scores[score]
+                self.distributions[score] = sketch
+        self.documents += other.documents
+        for term_id in set(self.candidates) | set(other.candidates):
+            self._track(term_id, self.hits.estimate(term_id))
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "documents": self.documents,
+            "heavy_hitter_capacity": self.heavy_hitter_capacity,
+            "hits": self.hits.to_dict(),
+            "candidates": sorted(self.candidates),
+            "distributions": {score: sketch.to_dict() for score, sketch in self.distributions.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], registry: Optional[PatternRegistry] = None) -> "CorpusSketches":
+        hits = CountMinSketch.from_dict(data["hits"])
+        sketches = cls(data["distributions"], hits.width, hits.depth,
+                       heavy_hitter_capacity=data["heavy_hitter_capacity"], seed=hits.seed,
+                       registry=registry)
+        sketches.hits = hits
+        sketches.documents = data["documents"]
+        sketches.distributions = {
+            score: KLLSketch.from_dict(sketch, hits.seed) for score, sketch in data["distributions"].items()
+        }
+        sketches.candidates = {term_id: hits.estimate(term_id) for term_id in data["candidates"]}
+        return sketches
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle)
+
+    @classmethod
+    def load(cls, path: str, registry: Optional[PatternRegistry] = None) -> "CorpusSketches":
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle), registry)
+
+
+# =============================================================================
+# SECTION 4: AUDITOR WRAPPER
+# =============================================================================
+
+class SketchingAuditor:
+    """
+    Audit and sketch in one pass.
+
+    Works with UnifiedPersuasionAuditor, IntegrityPatternAuditor or
+    CombinedAuditor; pattern hits are read from the context the audit filled.
+    """
+
+    def __init__(self, auditor: Any, sketches: CorpusSketches):
+        self.auditor = auditor
+        self.sketches = sketches
+
+    def audit(self, text: str, ctx: Optional[ScanContext] = None) -> Any:
+        if ctx is None:
+            context = getattr(self.auditor, "context", None)
+            normalize = getattr(self.auditor, "normalize", False)
+            ctx = context(text) if context else ScanContext.create(text, normalize)
+        report = self.auditor.audit(text, ctx)
+        self.sketches.observe(report, ctx)
+        return report
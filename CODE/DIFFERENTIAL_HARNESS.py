@@ -0,0 +1,600 @@
+"""
+DIFFERENTIAL HARNESS
+====================
+Side-by-side equivalence checks between the reference detectors and any
+optimized scan path, offline or as a production shadow.
+
+The reference path audits each document with both auditors on a
+ReferenceContext, which memoizes nothing (every probe is its own plain `re`
+scan, so no detector sees another's results), ignores prefilters and any
+engine installed process-wide, and computes the word-level features that
+detectors take from ScanContext.tokens the original way: re.sub() per word
+for alliteration and a findall() per nominalization pattern and for
+contractions, instead of the TokenStream shortcuts.
+A candidate is anything that turns a document into a ScanContext for the
+auditors: CombinedAuditor(...).context, ParallelAuditor(...).context,
+SentenceCache priming, or context_factory(backend=..., prefilters=...). A
+candidate may also bring its own auditors, e.g. rewritten detector classes.
+
+For each document the harness compares every detector's score, intensity,
+flagged, threshold, matches and each details entry on its own. So a
+divergence names the sub-score it came from ("integrity/COGNITIVE_LOAD",
+"details.complexity_score"). Report-level fields outside the detector
+sections (summaries, red flags, combinations) are compared as well.
+
+differential_corpus() builds a seeded corpus from the detectors' own
+vocabulary. It mixes keywords in random case, random strings each regex
+matches, repeated boilerplate sentences, and adversarial fragments:
+case-folding and length-changing Unicode, unusual whitespace, terminator
+runs, abbreviations and markup. Any other corpus can be passed instead.
+
+ShadowAuditor serves the optimized CombinedAuditor and re-checks a sampled
+fraction of live documents against the reference, keeping the most recent
+divergences.
+
+Usage:
+    harness = DifferentialHarness(CombinedAuditor(sentence_cache=SentenceCache()).context)
+    report = harness.run(differential_corpus(seed=7, documents=500))
+    assert report.equivalent, report.to_dict()
+
+    shadow = ShadowAuditor(CombinedAuditor(sentence_cache=cache), sample_rate=0.01)
+    result = shadow.audit(text)          # served from the optimized path
+
+    python DIFFERENTIAL_HARNESS.py --engine sentence-cache --documents 500 --seed 7
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import re
+import copy
+import random
+import string
+from collections import deque, Counter
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator, Pattern, Tuple
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext, TokenStream
+    from REGEX_BACKEND import ReBackend
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor, RegisterFormalityDetector
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor
+    from COMBINED_AUDITOR import PERSUASION_METADATA_KEYS, INTEGRITY_METADATA_KEYS
+    from PATTERN_REGISTRY import PatternRegistry, DETECTOR_GROUPS, TERM_REGEX, TERM_KEYWORD
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext, TokenStream
+    from REGEX_BACKEND import ReBackend
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor, RegisterFormalityDetector
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor
+    from COMBINED_AUDITOR import PERSUASION_METADATA_KEYS, INTEGRITY_METADATA_KEYS
+    from PATTERN_REGISTRY import PatternRegistry, DETECTOR_GROUPS, TERM_REGEX, TERM_KEYWORD
+
+DETECTOR_FIELDS = ("score", "intensity", "flagged", "threshold", "matches")
+# Report sections already compared detector by detector
+DETECTOR_SECTIONS = ("tactical_stimulus", "psychological_principles", "linguistic_patterns", "detections")
+# Divergences kept in a report; counts cover all of them
+DEFAULT_MAX_KEPT = 1000
+# Candidates selectable from the command line
+ENGINES = ("plan", "normalize", "sentence-cache", "parallel", "re2")
+
+
+# =============================================================================
+# SECTION 1: REFERENCE AND CANDIDATE CONTEXTS
+# =============================================================================
+
+class ReferenceTokens(TokenStream):
+    """Word-level features computed the way the detectors did before TokenStream."""
+
+    def alliteration_count(self) -> int:
+        words = self._ctx.lower.split()
+        count = 0
+        for i in range(len(words) - 2):
+            w1 = re.sub(r'[^a-z]', '', words[i])
+            w2 = re.sub(r'[^a-z]', '', words[i+1])
+            w3 = re.sub(r'[^a-z]', '', words[i+2])
+            if w1 and w2 and w3 and w1[0] == w2[0] == w3[0]:
+                count += 1
+        return count
+
+    def suffix_count(self, endings: Any, patterns: Any) -> int:
+        return sum(len(pattern.findall(self._ctx.text)) for pattern in patterns)
+
+    def contraction_count(self) -> int:
+        return len(RegisterFormalityDetector.CONTRACTION_PATTERN.findall(self._ctx.text))
+
+    @property
+    def sentence_word_counts(self) -> array:
+        sentences = [s.strip() for s in self._ctx.sentences if s.strip()]
+        return array("l", (len(s.split()) for s in sentences))
+
+
+class ReferenceContext(ScanContext):
+    """
+    ScanContext that shares nothing: every probe is a fresh plain `re` scan,
+    with no prefilters, whatever engine is installed globally, and the
+    word-level features come from ReferenceTokens.
+    """
+    prefilters: Dict[Pattern, Tuple[Tuple[str, ...], bool]] = {}
+    backend = ReBackend()
+
+    @property
+    def tokens(self) -> TokenStream:
+        if self._tokens is None:
+            self._tokens = ReferenceTokens(self)
+        return self._tokens
+
+    def findall(self, pattern: Pattern, lower: bool = False) -> List[Any]:
+        return pattern.findall(self.lower if lower else self.text)
+
+    def findall_in(self, pattern: Pattern, subject: str) -> List[Any]:
+        return pattern.findall(subject)
+
+    def contains(self, keyword: str) -> bool:
+        return keyword in self.lower
+
+    def keywords(self, keywords: Any) -> List[str]:
+        return [kw for kw in keywords if kw in self.lower]
+
+
+class _RecordingDetector:
+    """A detector that also keeps its latest result, under its "framework/CATEGORY" name."""
+
+    def __init__(self, detector: Any, name: str, results: Dict[str, Any]):
+        self._detector = detector
+        self._name = name
+        self._results = results
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._detector, attribute)
+
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> Any:
+        result = self._detector.detect(text, ctx)
+        self._results[self._name] = result
+        return result
+
+
+def _recording(auditors: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow copies of the auditors whose detectors record into `results`."""
+    copies = {}
+    for framework, auditor in auditors.items():
+        clone = copy.copy(auditor)
+        for group in DETECTOR_GROUPS:
+            detectors = getattr(auditor, group, None)
+            if detectors:
+                setattr(clone, group, {category: _RecordingDetector(detector, f"{framework}/{category}", results)
+                                       for category, detector in detectors.items()})
+        copies[framework] = clone
+    return copies
+
+
+def context_factory(backend: Any = None, prefilters: Optional[Dict[Pattern, Any]] = None,
+                    normalize: bool = False) -> Callable[[str], ScanContext]:
+    """A candidate that scans with the given engine and prefilters, without installing them process-wide."""
+    attributes = {}
+    if backend is not None:
+        attributes["backend"] = backend
+    if prefilters is not None:
+        attributes["prefilters"] = prefilters
+    context = type("CandidateContext", (ScanContext,), attributes)
+    return lambda text: context.create(text, normalize)
+
+
+# =============================================================================
+# SECTION 2: CORPUS
+# =============================================================================
+
+ADVERSARIAL_FRAGMENTS = (
+    "İSTANBUL İstanbul", "STRASSE straße", "ﬁnal ofﬁce ﬂow", "200 \u212a (kelvin) vs K", "ſuch ſtrong",
+    "ΣΊΣΥΦΟΣ ὈΔΥΣΣΕΎΣ", "éclair café", "zero\u200bwidth\u200bjoin", "tab\there\x0bvt\x0cff\x1cfs",
+    "line one\r\nline two\r\n", "\u00a0non\u00a0breaking\u2003em", "Dr. Smith, Ph.D., M.D. said so.",
+    "U.S.A. e.g. i.e. etc.", "wait... what?!", "!!!", "?!?!", "....", "$1,999.99 save 99% 10x 3/4",
+    "<b>bold</b> &amp; **markdown** # Heading", "http://example.com/a.b?c=d&e=f", "🔥🔥🔥 act now 🔥",
+    "مرحبا بالعالم", "ALL CAPS SHOUTING TEXT", "a" * 300, "-- -- --", "\"quoted\" 'single' “curly”",
+)
+
+FILLER_WORDS = (
+    "the", "report", "team", "will", "review", "results", "of", "a", "plan", "and", "people",
+    "we", "this", "was", "quarter", "notes", "in", "it", "market", "data", "your", "new", "for",
+)
+
+_TERMINATORS = (". ", ". ", ". ", "! ", "? ", "... ", "?! ", ".\n\n", "\n", ".", "")
+
+
+def _set_contains(ch: str, items: Any) -> bool:
+    """Whether character `ch` is in a parsed [...] set."""
+    code = ord(ch)
+    negate, found = False, False
+    for op, value in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            found = found or code == value
+        elif op is sre_constants.RANGE:
+            found = found or value[0] <= code <= value[1]
+        elif op is sre_constants.CATEGORY:
+            found = found or _category_contains(ch, value)
+    return found != negate
+
+
+def _category_contains(ch: str, category: Any) -> bool:
+    tests = {
+        sre_constants.CATEGORY_DIGIT: ch.isdigit(),
+        sre_constants.CATEGORY_NOT_DIGIT: not ch.isdigit(),
+        sre_constants.CATEGORY_SPACE: ch.isspace(),
+        sre_constants.CATEGORY_NOT_SPACE: not ch.isspace(),
+        sre_constants.CATEGORY_WORD: ch.isalnum() or ch == "_",
+        sre_constants.CATEGORY_NOT_WORD: not (ch.isalnum() or ch == "_"),
+    }
+    return tests.get(category, False)
+
+
+_POOL = string.ascii_letters + string.digits + " .,!?'-%$/"
+
+
+def _generate(items: Any, rng: random.Random, groups: Dict[int, str], max_repeat: int) -> str:
+    out: List[str] = []
+    for op, value in items:
+        if op is sre_constants.LITERAL:
+            out.append(chr(value))
+        elif op is sre_constants.NOT_LITERAL:
+            out.append(rng.choice([ch for ch in _POOL if ord(ch) != value]))
+        elif op is sre_constants.ANY:
+            out.append(rng.choice(string.ascii_lowercase))
+        elif op is sre_constants.IN:
+            candidates = [ch for ch in _POOL if _set_contains(ch, value)]
+            candidates += [chr(v[0]) for o, v in value if o is sre_constants.RANGE]
+            candidates += [chr(v) for o, v in value if o is sre_constants.LITERAL]
+            candidates = [ch for ch in candidates if _set_contains(ch, value)]
+            out.append(rng.choice(candidates) if candidates else "")
+        elif op is sre_constants.BRANCH:
+            out.append(_generate(rng.choice(value[1]), rng, groups, max_repeat))
+        elif op is sre_constants.SUBPATTERN:
+            piece = _generate(value[-1], rng, groups, max_repeat)
+            if value[0] is not None:
+                groups[value[0]] = piece
+            out.append(piece)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+                    getattr(sre_constants, "POSSESSIVE_REPEAT", None)):
+            low, high, body = value
+            count = rng.randint(low, min(high, low + max_repeat))
+            out.extend(_generate(body, rng, groups, max_repeat) for _ in range(count))
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            out.append(_generate(value, rng, groups, max_repeat))
+        elif op is sre_constants.GROUPREF:
+            out.append(groups.get(value, ""))
+        elif op is sre_constants.GROUPREF_EXISTS:
+            group, yes, no = value
+            branch = yes if group in groups else no
+            if branch is not None:
+                out.append(_generate(branch, rng, groups, max_repeat))
+        # AT (anchors, \\b) and lookaround add no characters
+    return "".join(out)
+
+
+def sample_match(pattern: Pattern, rng: random.Random, attempts: int = 8, max_repeat: int = 3) -> Optional[str]:
+    """A random string that `pattern` finds a match in, or None if none was produced."""
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+    for _ in range(attempts):
+        sample = _generate(parsed, rng, {}, max_repeat)
+        if sample and pattern.search(f" {sample} "):
+            return sample
+    return None
+
+
+def _vary_case(text: str, rng: random.Random) -> str:
+    return rng.choice((text, text, text.upper(), text.title(), text.capitalize()))
+
+
+def differential_corpus(seed: int = 0, documents: int = 200, max_sentences: int = 40,
+                        registry: Optional[PatternRegistry] = None) -> Iterator[str]:
+    """Seeded documents built from the detectors' vocabulary plus adversarial fragments."""
+    rng = random.Random(seed)
+    registry = registry or PatternRegistry.default()
+    keywords = sorted({term.keywords[0] for term in registry.terms.values() if term.kind == TERM_KEYWORD})
+    regexes = sorted({term.pattern for term in registry.terms.values() if term.kind == TERM_REGEX},
+                     key=lambda pattern: (pattern.pattern, pattern.flags))
+
+    yield ""
+    yield " \n\t "
+    boilerplate: List[str] = []
+    for _ in range(max(documents - 2, 0)):
+        parts: List[str] = []
+        for _ in range(rng.randint(1, max_sentences)):
+            roll = rng.random()
+            if roll < 0.1 and boilerplate:
+                sentence = rng.choice(boilerplate)
+            else:
+                words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(0, 12))]
+                for _ in range(rng.randint(0, 3)):
+                    words.insert(rng.randint(0, len(words)), _vary_case(rng.choice(keywords), rng))
+                if rng.random() < 0.5:
+                    sample = sample_match(rng.choice(regexes), rng)
+                    if sample:
+                        words.insert(rng.randint(0, len(words)), sample)
+                if rng.random() < 0.15:
+                    words.insert(rng.randint(0, len(words)), rng.choice(ADVERSARIAL_FRAGMENTS))
+                sentence = " ".join(words)
+                if rng.random() < 0.05:
+                    boilerplate.append(sentence)
+            parts.append(sentence + rng.choice(_TERMINATORS))
+        yield "".join(parts)
+
+
+# =============================================================================
+# SECTION 3: COMPARISON
+# =============================================================================
+
+@dataclass
+class Divergence:
+    """One field that differs between the reference and the candidate."""
+    document: int
+    detector: str       # "persuasion/SCARCITY", or "persuasion/report" for report-level fields
+    field: str          # "score", "intensity", "matches", "details.<key>", "summary.<key>", ...
+    reference: Any
+    candidate: Any
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"document": self.document, "detector": self.detector, "field": self.field,
+                "reference": self.reference, "candidate": self.candidate}
+
+
+def _plain(value: Any) -> Any:
+    """Enum members as their values, for comparison and reporting."""
+    return getattr(value, "value", value)
+
+
+def compare_results(document: int, detector: str, reference: Any, candidate: Any) -> List[Divergence]:
+    """Field-by-field differences between two DetectionResults, each details key separately."""
+    found = []
+    for name in DETECTOR_FIELDS:
+        if hasattr(reference, name) or hasattr(candidate, name):
+            ref, cand = _plain(getattr(reference, name, None)), _plain(getattr(candidate, name, None))
+            if ref != cand:
+                found.append(Divergence(document, detector, name, ref, cand))
+    ref_details, cand_details = reference.details, candidate.details
+    for key in list(ref_details) + [key for key in cand_details if key not in ref_details]:
+        ref, cand = ref_details.get(key), cand_details.get(key)
+        if ref != cand or (key in ref_details) != (key in cand_details):
+            found.append(Divergence(document, detector, f"details.{key}", ref, cand))
+    return found
+
+
+def compare_reports(document: int, label: str, reference: Dict[str, Any], candidate: Dict[str, Any],
+                    ignore: Tuple[str, ...]) -> List[Divergence]:
+    """Differences in report fields outside the detector sections, one level deep."""
+    found = []
+    skipped = set(ignore) | set(DETECTOR_SECTIONS)
+    for key in list(reference) + [key for key in candidate if key not in reference]:
+        if key in skipped:
+            continue
+        ref, cand = reference.get(key), candidate.get(key)
+        if isinstance(ref, dict) and isinstance(cand, dict):
+            for sub in list(ref) + [sub for sub in cand if sub not in ref]:
+                if ref.get(sub) != cand.get(sub):
+                    found.append(Divergence(document, label, f"{key}.{sub}", ref.get(sub), cand.get(sub)))
+        elif ref != cand:
+            found.append(Divergence(document, label, key, ref, cand))
+    return found
+
+
+@dataclass
+class DifferentialReport:
+    """Outcome of a differential run."""
+    documents: int = 0
+    divergent_documents: int = 0
+    divergences: List[Divergence] = field(default_factory=list)
+    by_detector: Counter = field(default_factory=Counter)
+    by_field: Counter = field(default_factory=Counter)
+
+    @property
+    def equivalent(self) -> bool:
+        return self.divergent_documents == 0
+
+    def add(self, found: List[Divergence], max_kept: int) -> None:
+        self.documents += 1
+        if found:
+            self.divergent_documents += 1
+        for divergence in found:
+            self.by_detector[divergence.detector] += 1
+            self.by_field[f"{divergence.detector}:{divergence.field}"] += 1
+            if len(self.divergences) < max_kept:
+                self.divergences.append(divergence)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "equivalent": self.equivalent,
+            "documents": self.documents,
+            "divergent_documents": self.divergent_documents,
+            "by_detector": dict(self.by_detector.most_common()),
+            "by_field": dict(self.by_field.most_common()),
+            "divergences": [divergence.to_dict() for divergence in self.divergences],
+        }
+
+
+# =============================================================================
+# SECTION 4: HARNESS
+# =============================================================================
+
+class DifferentialHarness:
+    """Compare a candidate scan path (and optionally candidate auditors) with the reference detectors."""
+
+    def __init__(self, candidate: Optional[Callable[[str], ScanContext]] = None,
+                 auditors: Optional[Dict[str, Any]] = None,
+                 candidate_auditors: Optional[Dict[str, Any]] = None,
+                 max_kept: int = DEFAULT_MAX_KEPT):
+        if candidate is None:
+            from COMBINED_AUDITOR import CombinedAuditor
+            candidate = CombinedAuditor().context
+        self.candidate = candidate
+        self.auditors = auditors or {"persuasion": UnifiedPersuasionAuditor(),
+                                     "integrity": IntegrityPatternAuditor()}
+        self.candidate_auditors = candidate_auditors or self.auditors
+        self.max_kept = max_kept
+        # One audit per side gives both the reports and every detector's result
+        self._reference_results: Dict[str, Any] = {}
+        self._candidate_results: Dict[str, Any] = {}
+        self._reference = _recording(self.auditors, self._reference_results)
+        self._candidate = _recording(self.candidate_auditors, self._candidate_results)
+
+    def _reports(self, auditors: Dict[str, Any], text: str, ctx: ScanContext) -> Dict[str, Dict[str, Any]]:
+        reports = {}
+        if "persuasion" in auditors:
+            reports["persuasion"] = auditors["persuasion"].audit(text, ctx)
+        if "integrity" in auditors:
+            integrity = auditors["integrity"]
+            reports["integrity"] = integrity.to_dict(integrity.audit(text, ctx))
+        return reports
+
+    def compare(self, text: str, document: int = 0, ctx: Optional[ScanContext] = None) -> List[Divergence]:
+        """
+        Every divergence for one document. `ctx` is the candidate's context
+        when it was already built (e.g. by the request being served).
+        """
+        ctx = ctx if ctx is not None else self.candidate(text)
+        normalize = ctx.source is not None
+        found: List[Divergence] = []
+
+        self._reference_results.clear()
+        self._candidate_results.clear()
+        reference_reports = self._reports(self._reference, text, ReferenceContext.create(text, normalize))
+        candidate_reports = self._reports(self._candidate, text, ctx)
+        for name, reference in self._reference_results.items():
+            candidate = self._candidate_results.get(name)
+            if candidate is None:
+                found.append(Divergence(document, name, "missing", reference.score, None))
+                continue
+            found.extend(compare_results(document, name, reference, candidate))
+
+        ignore = {"persuasion": PERSUASION_METADATA_KEYS, "integrity": INTEGRITY_METADATA_KEYS}
+        for framework, reference in reference_reports.items():
+            found.extend(compare_reports(document, f"{framework}/report", reference,
+                                         candidate_reports.get(framework, {}), ignore[framework]))
+        return found
+
+    def run(self, corpus: Iterable[str]) -> DifferentialReport:
+        report = DifferentialReport()
+        for document, text in enumerate(corpus):
+            report.add(self.compare(text, document), self.max_kept)
+        return report
+
+
+# =============================================================================
+# SECTION 5: SHADOW MODE
+# =============================================================================
+
+class ShadowAuditor:
+    """
+    Serve audits from an optimized CombinedAuditor and check a sampled
+    fraction against the reference detectors.
+
+    A sampled document costs one unshared reference audit plus one more
+    candidate audit on the context already filled, whose scans are not
+    repeated. The served report is never altered.
+    """
+
+    def __init__(self, auditor: Any = None, sample_rate: float = 0.01, seed: Optional[int] = None,
+                 max_kept: int = DEFAULT_MAX_KEPT,
+                 on_divergence: Optional[Callable[[str, List[Divergence]], None]] = None):
+        if auditor is None:
+            from COMBINED_AUDITOR import CombinedAuditor
+            auditor = CombinedAuditor()
+        self.auditor = auditor
+        self.harness = DifferentialHarness(
+            auditor.context, {"persuasion": UnifiedPersuasionAuditor(auditor.normalize),
+                              "integrity": IntegrityPatternAuditor(auditor.normalize)},
+            {"persuasion": auditor.persuasion, "integrity": auditor.integrity})
+        self.sample_rate = sample_rate
+        self.rng = random.Random(seed)
+        self.report = DifferentialReport()
+        self.recent: deque = deque(maxlen=max_kept)
+        self.on_divergence = on_divergence
+        self.audits = 0
+
+    def audit(self, text: str) -> Any:
+        self.audits += 1
+        ctx = self.auditor.context(text)
+        result = self.auditor.audit(text, ctx)
+        if self.rng.random() < self.sample_rate:
+            found = self.harness.compare(text, self.report.documents, ctx)
+            self.report.add(found, 0)
+            if found:
+                self.recent.extend(found)
+                if self.on_divergence is not None:
+                    self.on_divergence(text, found)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "audits": self.audits,
+            "checked": self.report.documents,
+            "divergent_documents": self.report.divergent_documents,
+            "by_detector": dict(self.report.by_detector.most_common()),
+        }
+
+
+# =============================================================================
+# SECTION 6: COMMAND LINE
+# =============================================================================
+
+def _engine(name: str) -> Callable[[str], ScanContext]:
+    from COMBINED_AUDITOR import CombinedAuditor
+    if name == "plan":
+        return CombinedAuditor().context
+    if name == "normalize":
+        return CombinedAuditor(normalize=True).context
+    if name == "sentence-cache":
+        from SENTENCE_CACHE import SentenceCache
+        return CombinedAuditor(sentence_cache=SentenceCache()).context
+    if name == "parallel":
+        from PARALLEL_AUDIT import ParallelAuditor
+        return ParallelAuditor(CombinedAuditor(), processes=2, min_chars=0).context
+    if name == "re2":
+        from REGEX_BACKEND import Re2Backend
+        # Built directly: get_backend("re2") falls back to `re` when RE2 is missing
+        return context_factory(backend=Re2Backend())
+    raise ValueError(f"Unknown engine: {name}")
+
+
+def main():
+    import sys
+    import json
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Differential check of an optimized engine against the reference detectors")
+    parser.add_argument("--engine", choices=ENGINES, default="plan")
+    parser.add_argument("--corpus", help="JSONL corpus of {\"id\", \"text\"} records instead of the generated one")
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.corpus:
+        from AUDIT_COORDINATOR import load_corpus
+        corpus: Iterable[str] = (text for _, text in load_corpus(args.corpus))
+    else:
+        corpus = differential_corpus(args.seed, args.documents)
+    try:
+        engine = _engine(args.engine)
+    except ImportError as error:
+        parser.error(f"Engine {args.engine} unavailable: {error}")
+    report = DifferentialHarness(engine).run(corpus)
+    print(json.dumps(report.to_dict(), indent=2, default=str, ensure_ascii=False))
+    sys.exit(0 if report.equivalent else 1)
+
+
+if __name__ == "__main__":
+    main()
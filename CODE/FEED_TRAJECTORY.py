@@ -0,0 +1,281 @@
+"""
+FEED TRAJECTORY
+===============
+Sliding-window escalation trends for long-running sources (accounts, feeds).
+
+Each source keeps a fixed ring of buckets over its most recent window, by
+time or by item count. A bucket holds running sums of the integrity detector
+scores that fell into it (count, sum, per-category max and the regression
+sums) and, for each detector detail a combination rule tests (such as
+INTENSITY_ESCALATION's dehumanization_markers), the number of items that
+carried it. Per-source memory is constant no matter how many items arrive
+and no raw text is retained.
+
+From the live buckets the aggregator derives, per category, the windowed
+mean, peak and least-squares slope. The windowed means are fed through
+IntegrityPatternAuditor._identify_combinations, with a detail present when
+any item in the window carried it; a combination fires an alert when it
+becomes active for the window and clears when it drops out. Detail flags
+come from IntegrityAuditReports; plain score dicts carry none.
+
+Usage:
+    aggregator = TrajectoryAggregator(window=7 * 86400, buckets=7, by="time")
+    for source_id, text, posted_at in feed:
+        alerts = aggregator.add(source_id, auditor.audit(text), timestamp=posted_at)
+    trend = aggregator.trend("account-42")
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Union
+
+# Import from companion modules
+try:
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor, IntegrityAuditReport, DetectionResult
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor, IntegrityAuditReport, DetectionResult
+
+# =============================================================================
+# SECTION 1: CONFIGURATION CONSTANTS
+# =============================================================================
+
+DEFAULT_WINDOW = 500          # Items (by="count") or seconds (by="time")
+DEFAULT_BUCKETS = 10          # Window resolution; memory per source scales with this
+DEFAULT_MIN_ITEMS = 3         # Items in the window before combinations are evaluated
+WINDOW_MODES = ("count", "time")
+
+CATEGORIES = list(IntegrityPatternAuditor.CATEGORY_WEIGHTS)
+
+# Bucket layout: [n, sum_x, sum_xx] followed by sum_y, sum_xy, max_y per category,
+# then one item count per rule detail key
+_N, _SX, _SXX = 0, 1, 2
+_HEADER = 3
+_PER_CATEGORY = 3
+_BUCKET_WIDTH = _HEADER + _PER_CATEGORY * len(CATEGORIES)
+
+
+# =============================================================================
+# SECTION 2: DATA STRUCTURES
+# =============================================================================
+
+@dataclass
+class CombinationAlert:
+    """A windowed combination that became active (FIRED) or inactive (CLEARED)."""
+    source_id: str
+    combination: str
+    state: str
+    position: float
+    window_items: int
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SourceTrend:
+    """Windowed view of one source."""
+    source_id: str
+    window_items: int
+    mean_scores: Dict[str, float]
+    peak_scores: Dict[str, float]
+    slopes: Dict[str, float]
+    composite_index: float
+    active_combinations: List[str]
+
+
+class SourceWindow:
+    """Fixed ring of buckets for one source."""
+
+    __slots__ = ("origin", "head_slot", "items_seen", "buckets", "active")
+
+    def __init__(self, bucket_count: int, origin: float, width: int = _BUCKET_WIDTH):
+        self.origin = origin
+        self.head_slot = -1
+        self.items_seen = 0
+        self.buckets = array("d", bytes(8 * width * bucket_count))
+        self.active: Dict[str, Dict[str, Any]] = {}
+
+
+# =============================================================================
+# SECTION 3: AGGREGATOR
+# =============================================================================
+
+class TrajectoryAggregator:
+    """Per-source rolling windows of integrity scores with edge-triggered alerts."""
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW,
+        buckets: int = DEFAULT_BUCKETS,
+        by: str = "count",
+        min_items: int = DEFAULT_MIN_ITEMS,
+        auditor: Optional[IntegrityPatternAuditor] = None
+    ):
+        if by not in WINDOW_MODES:
+            raise ValueError(f"by must be one of {WINDOW_MODES}")
+        self.window = window
+        self.bucket_count = buckets
+        self.bucket_span = window / buckets
+        self.by = by
+        self.min_items = min_items
+        self.auditor = auditor or IntegrityPatternAuditor()
+        # (category, details key) pairs the combination rules test
+        self.detail_keys = self.auditor.combination_rules.detail_keys
+        self.width = _BUCKET_WIDTH + len(self.detail_keys)
+        self.sources: Dict[str, SourceWindow] = {}
+
+    def add(
+        self,
+        source_id: str,
+        scores: Union[IntegrityAuditReport, Dict[str, float]],
+        timestamp: Optional[float] = None
+    ) -> List[CombinationAlert]:
+        """Add one item's detector scores; return alerts whose state changed."""
+        flags: List[bool] = []
+        if isinstance(scores, IntegrityAuditReport):
+            detections = scores.detections
+            flags = [category in detections and bool(detections[category].details.get(key))
+                     for category, key in self.detail_keys]
+            scores = {category: result.score for category, result in detections.items()}
+
+        state = self.sources.get(source_id)
+        if state is None:
+            origin = (time.time() if timestamp is None else timestamp) if self.by == "time" else 0.0
+            state = SourceWindow(self.bucket_count, origin, self.width)
+            self.sources[source_id] = state
+
+        if self.by == "time":
+            x = (time.time() if timestamp is None else timestamp) - state.origin
+        else:
+            x = float(state.items_seen)
+        state.items_seen += 1
+
+        slot = int(x // self.bucket_span)
+        if slot <= state.head_slot - self.bucket_count:
+            return []  # Older than the window
+        if slot > state.head_slot:
+            self._advance(state, slot)
+        self._accumulate(state, slot, x, scores, flags)
+        return self._evaluate(source_id, state, x)
+
+    def _advance(self, state: SourceWindow, slot: int) -> None:
+        first = max(state.head_slot + 1, slot - self.bucket_count + 1)
+        width = self.width
+        for stale in range(first, slot + 1):
+            offset = (stale % self.bucket_count) * width
+            state.buckets[offset:offset + width] = array("d", bytes(8 * width))
+        state.head_slot = slot
+
+    def _accumulate(self, state: SourceWindow, slot: int, x: float, scores: Dict[str, float],
+                    flags: List[bool]) -> None:
+        buckets = state.buckets
+        offset = (slot % self.bucket_count) * self.width
+        buckets[offset + _N] += 1
+        buckets[offset + _SX] += x
+        buckets[offset + _SXX] += x * x
+        for index, category in enumerate(CATEGORIES):
+            y = float(scores.get(category, 0))
+            base = offset + _HEADER + index * _PER_CATEGORY
+            buckets[base] += y
+            buckets[base + 1] += x * y
+            if y > buckets[base + 2]:
+                buckets[base + 2] = y
+        for index, flag in enumerate(flags):
+            if flag:
+                buckets[offset + _BUCKET_WIDTH + index] += 1
+
+    def _totals(self, state: SourceWindow) -> List[float]:
+        width = self.width
+        totals = [0.0] * width
+        buckets = state.buckets
+        for position in range(self.bucket_count):
+            offset = position * width
+            if not buckets[offset + _N]:
+                continue
+            for column in range(width):
+                value = buckets[offset + column]
+                if _HEADER <= column < _BUCKET_WIDTH and (column - _HEADER) % _PER_CATEGORY == 2:
+                    if value > totals[column]:
+                        totals[column] = value
+                else:
+                    totals[column] += value
+        return totals
+
+    def trend(self, source_id: str) -> Optional[SourceTrend]:
+        """Windowed means, peaks and slopes for a source, or None if unknown."""
+        state = self.sources.get(source_id)
+        if state is None:
+            return None
+        totals = self._totals(state)
+        n = totals[_N]
+        means, peaks, slopes = {}, {}, {}
+        variance_x = n * totals[_SXX] - totals[_SX] ** 2 if n else 0.0
+        for index, category in enumerate(CATEGORIES):
+            base = _HEADER + index * _PER_CATEGORY
+            sum_y, sum_xy, peak = totals[base], totals[base + 1], totals[base + 2]
+            means[category] = round(sum_y / n, 2) if n else 0.0
+            peaks[category] = peak
+            slopes[category] = (n * sum_xy - totals[_SX] * sum_y) / variance_x if variance_x > 0 else 0.0
+
+        detections = self._windowed_detections(means, totals)
+        return SourceTrend(
+            source_id=source_id,
+            window_items=int(n),
+            mean_scores=means,
+            peak_scores=peaks,
+            slopes=slopes,
+            composite_index=round(self.auditor._calculate_composite(detections), 1),
+            active_combinations=list(state.active)
+        )
+
+    def _windowed_detections(self, means: Dict[str, float], totals: List[float]) -> Dict[str, DetectionResult]:
+        detections = {}
+        for category, mean in means.items():
+            threshold = self.auditor.detectors[category].THRESHOLD
+            detections[category] = DetectionResult(
+                category=category,
+                score=mean,
+                flagged=mean > threshold,
+                threshold=threshold,
+                matches=[],
+                details={}
+            )
+        n = int(totals[_N])
+        for index, (category, key) in enumerate(self.detail_keys):
+            carried = int(totals[_BUCKET_WIDTH + index])
+            if carried and category in detections:
+                # Item counts stand in for the matched text, which is not kept
+                detections[category].details[key] = [f"{carried} of {n} items"]
+        return detections
+
+    def _evaluate(self, source_id: str, state: SourceWindow, x: float) -> List[CombinationAlert]:
+        totals = self._totals(state)
+        n = int(totals[_N])
+        if n < self.min_items:
+            current = {}
+        else:
+            means = {
+                category: totals[_HEADER + index * _PER_CATEGORY] / n
+                for index, category in enumerate(CATEGORIES)
+            }
+            combinations = self.auditor._identify_combinations(self._windowed_detections(means, totals))
+            current = {combo["type"]: combo for combo in combinations}
+
+        alerts = []
+        for combination, details in current.items():
+            if combination not in state.active:
+                alerts.append(CombinationAlert(source_id, combination, "FIRED", x, n, details))
+        for combination, details in state.active.items():
+            if combination not in current:
+                alerts.append(CombinationAlert(source_id, combination, "CLEARED", x, n, details))
+        state.active = current
+        return alerts
+
+    def forget(self, source_id: str) -> None:
+        self.sources.pop(source_id, None)
@@ -8,13 +8,27 @@ Application: Content auditing for influence technique identification
 """
 
 import re
+import os
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 import json
 from datetime import datetime
 import hashlib
 
+# Import from companion module
+try:
+    from SCAN_CONTEXT import ScanContext
+    from AUDIT_BUDGET import DetectorCosts, SCORE_BOUNDS, run_until, fixed_label
+    from COMBINATION_RULES import RuleSet, INTEGRITY_COMBINATION_RULES
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext
+    from AUDIT_BUDGET import DetectorCosts, SCORE_BOUNDS, run_until, fixed_label
+    from COMBINATION_RULES import RuleSet, INTEGRITY_COMBINATION_RULES
+
 
 class IntensityLevel(Enum):
     MINIMAL = "MINIMAL"
@@ -44,6 +58,8 @@ class IntegrityAuditReport:
     intensity: IntensityLevel
     pattern_combinations: List[Dict[str, Any]]
     summary: Dict[str, Any]
+    # Set by deadline-aware audits: completed categories and composite bounds
+    deadline: Optional[Dict[str, Any]] = None
 
 
 # =============================================================================
@@ -442,39 +458,48 @@ class SyntheticAuthorityDetector:
     - Artificial consensus language (30 pts)
     - Absence of natural hedging (10 pts)
     """
+    patterns = IntegrityPatterns
     THRESHOLD = 40
     MAX_SCORE = 200
+    MARKER_SCORES = {
+        'UNVERIFIABLE_CREDENTIALS': 15,
+        'FABRICATED_INSTITUTION': 25,
+        'CREDENTIAL_STACKING': 20,
+        'ARTIFICIAL_CONSENSUS': 30
+    }
+    HEDGING_PENALTY = 10
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
-        unverifiable = IntegrityPatterns.UNVERIFIABLE_CREDENTIALS.findall(text)
-        unverifiable_score = len(unverifiable) * 15
+        unverifiable = ctx.findall(self.patterns.UNVERIFIABLE_CREDENTIALS)
+        unverifiable_score = len(unverifiable) * self.MARKER_SCORES['UNVERIFIABLE_CREDENTIALS']
         if unverifiable:
             matches.extend(unverifiable)
             details['unverifiable_credentials'] = unverifiable
 
-        fabricated = IntegrityPatterns.FABRICATED_INSTITUTION.findall(text)
-        fabricated_score = len(fabricated) * 25
+        fabricated = ctx.findall(self.patterns.FABRICATED_INSTITUTION)
+        fabricated_score = len(fabricated) * self.MARKER_SCORES['FABRICATED_INSTITUTION']
         if fabricated:
             matches.extend(fabricated)
             details['fabricated_institutions'] = fabricated
 
-        stacking = IntegrityPatterns.CREDENTIAL_STACKING.findall(text)
-        stacking_score = len(stacking) * 20
+        stacking = ctx.findall(self.patterns.CREDENTIAL_STACKING)
+        stacking_score = len(stacking) * self.MARKER_SCORES['CREDENTIAL_STACKING']
         if stacking:
             matches.extend([s[0] if isinstance(s, tuple) else s for s in stacking])
             details['credential_stacking'] = len(stacking)
 
-        consensus = IntegrityPatterns.ARTIFICIAL_CONSENSUS.findall(text)
-        consensus_score = len(consensus) * 30
+        consensus = ctx.findall(self.patterns.ARTIFICIAL_CONSENSUS)
+        consensus_score = len(consensus) * self.MARKER_SCORES['ARTIFICIAL_CONSENSUS']
         if consensus:
             matches.extend(consensus)
             details['artificial_consensus'] = consensus
 
-        hedging = IntegrityPatterns.NATURAL_HEDGING.findall(text)
-        hedging_penalty = 10 if not hedging and len(text) > 200 else 0
+        hedging = ctx.findall(self.patterns.NATURAL_HEDGING)
+        hedging_penalty = self.HEDGING_PENALTY if not hedging and len(text) > 200 else 0
         details['natural_hedging_present'] = len(hedging) > 0
 
         raw_score = unverifiable_score + fabricated_score + stacking_score + consensus_score + hedging_penalty
@@ -505,39 +530,48 @@ class UndisclosedCommercialDetector:
     - Affiliate link obfuscation (25 pts)
     - Journalistic mimicry (30 pts)
     """
+    patterns = IntegrityPatterns
     THRESHOLD = 35
     MAX_SCORE = 175
+    MARKER_SCORES = {
+        'PROMOTIONAL_DISGUISE': 20,
+        'NATIVE_AD': 15,
+        'BURIED_DISCLOSURE': 35,
+        'AFFILIATE_OBFUSCATION': 25,
+        'JOURNALISTIC_MIMICRY': 30
+    }
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
-        promotional = IntegrityPatterns.PROMOTIONAL_DISGUISE.findall(text)
-        promotional_score = len(promotional) * 20
+        promotional = ctx.findall(self.patterns.PROMOTIONAL_DISGUISE)
+        promotional_score = len(promotional) * self.MARKER_SCORES['PROMOTIONAL_DISGUISE']
         if promotional:
             matches.extend(promotional)
             details['promotional_language'] = promotional
 
-        native = IntegrityPatterns.NATIVE_AD.findall(text)
-        native_score = len(native) * 15
+        native = ctx.findall(self.patterns.NATIVE_AD)
+        native_score = len(native) * self.MARKER_SCORES['NATIVE_AD']
         if native:
             matches.extend(native)
             details['native_ad_markers'] = native
 
-        buried = IntegrityPatterns.BURIED_DISCLOSURE.findall(text)
-        buried_score = len(buried) * 35
+        buried = ctx.findall(self.patterns.BURIED_DISCLOSURE)
+        buried_score = len(buried) * self.MARKER_SCORES['BURIED_DISCLOSURE']
         if buried:
             matches.extend(buried)
             details['buried_disclosure'] = True
 
-        affiliate = IntegrityPatterns.AFFILIATE_OBFUSCATION.findall(text)
-        affiliate_score = len(affiliate) * 25
+        affiliate = ctx.findall(self.patterns.AFFILIATE_OBFUSCATION)
+        affiliate_score = len(affiliate) * self.MARKER_SCORES['AFFILIATE_OBFUSCATION']
         if affiliate:
             matches.extend(affiliate)
             details['affiliate_links'] = affiliate
 
-        journalistic = IntegrityPatterns.JOURNALISTIC_MIMICRY.findall(text)
-        journalism_score = len(journalistic) * 30
+        journalistic = ctx.findall(self.patterns.JOURNALISTIC_MIMICRY)
+        journalism_score = len(journalistic) * self.MARKER_SCORES['JOURNALISTIC_MIMICRY']
         if journalistic:
             matches.extend(journalistic)
             details['journalistic_mimicry'] = journalistic
@@ -570,39 +604,48 @@ class ConcealedIdentityDetector:
     - Defensive disclosure patterns (20 pts)
     - Independence claims (15 pts)
     """
+    patterns = IntegrityPatterns
     THRESHOLD = 30
     MAX_SCORE = 175
+    MARKER_SCORES = {
+        'ARTIFICIAL_GRASSROOTS': 25,
+        'COORDINATED_TEMPLATE': 35,
+        'NEW_ACCOUNT_SIGNALS': 30,
+        'DEFENSIVE_DISCLOSURE': 20,
+        'INDEPENDENCE_CLAIMS': 15
+    }
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
-        grassroots = IntegrityPatterns.ARTIFICIAL_GRASSROOTS.findall(text)
-        grassroots_score = len(grassroots) * 25
+        grassroots = ctx.findall(self.patterns.ARTIFICIAL_GRASSROOTS)
+        grassroots_score = len(grassroots) * self.MARKER_SCORES['ARTIFICIAL_GRASSROOTS']
         if grassroots:
             matches.extend(grassroots)
             details['grassroots_claims'] = grassroots
 
-        templates = IntegrityPatterns.COORDINATED_TEMPLATE.findall(text)
-        template_score = len(templates) * 35
+        templates = ctx.findall(self.patterns.COORDINATED_TEMPLATE)
+        template_score = len(templates) * self.MARKER_SCORES['COORDINATED_TEMPLATE']
         if templates:
             matches.extend(templates)
             details['template_markers'] = templates
 
-        new_account = IntegrityPatterns.NEW_ACCOUNT_SIGNALS.findall(text)
-        new_score = len(new_account) * 30
+        new_account = ctx.findall(self.patterns.NEW_ACCOUNT_SIGNALS)
+        new_score = len(new_account) * self.MARKER_SCORES['NEW_ACCOUNT_SIGNALS']
         if new_account:
             matches.extend(new_account)
             details['new_account_signals'] = new_account
 
-        defensive = IntegrityPatterns.DEFENSIVE_DISCLOSURE.findall(text)
-        defensive_score = len(defensive) * 20
+        defensive = ctx.findall(self.patterns.DEFENSIVE_DISCLOSURE)
+        defensive_score = len(defensive) * self.MARKER_SCORES['DEFENSIVE_DISCLOSURE']
         if defensive:
             matches.extend(defensive)
             details['defensive_disclosure'] = defensive
 
-        independence = IntegrityPatterns.INDEPENDENCE_CLAIMS.findall(text)
-        independence_score = len(independence) * 15
+        independence = ctx.findall(self.patterns.INDEPENDENCE_CLAIMS)
+        independence_score = len(independence) * self.MARKER_SCORES['INDEPENDENCE_CLAIMS']
         if independence:
             matches.extend(independence)
             details['independence_claims'] = independence
@@ -635,39 +678,48 @@ class InformationEnvironmentDetector:
     - Ingroup reinforcement (20 pts)
     - Engagement boundary tactics (25 pts)
     """
+    patterns = IntegrityPatterns
     THRESHOLD = 35
     MAX_SCORE = 165
+    MARKER_SCORES = {
+        'INFORMATION_GATING': 20,
+        'ALTERNATIVE_SOURCE_PROMOTION': 15,
+        'OUTGROUP_SOURCE_DISMISSAL': 25,
+        'INGROUP_REINFORCEMENT': 20,
+        'ENGAGEMENT_BOUNDARY': 25
+    }
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
-        gating = IntegrityPatterns.INFORMATION_GATING.findall(text)
-        gating_score = len(gating) * 20
+        gating = ctx.findall(self.patterns.INFORMATION_GATING)
+        gating_score = len(gating) * self.MARKER_SCORES['INFORMATION_GATING']
         if gating:
             matches.extend(gating)
             details['information_gating'] = gating
 
-        alt_source = IntegrityPatterns.ALTERNATIVE_SOURCE_PROMOTION.findall(text)
-        alt_score = len(alt_source) * 15
+        alt_source = ctx.findall(self.patterns.ALTERNATIVE_SOURCE_PROMOTION)
+        alt_score = len(alt_source) * self.MARKER_SCORES['ALTERNATIVE_SOURCE_PROMOTION']
         if alt_source:
             matches.extend(alt_source)
             details['alternative_sources'] = alt_source
 
-        outgroup = IntegrityPatterns.OUTGROUP_SOURCE_DISMISSAL.findall(text)
-        outgroup_score = len(outgroup) * 25
+        outgroup = ctx.findall(self.patterns.OUTGROUP_SOURCE_DISMISSAL)
+        outgroup_score = len(outgroup) * self.MARKER_SCORES['OUTGROUP_SOURCE_DISMISSAL']
         if outgroup:
             matches.extend(outgroup)
             details['outgroup_dismissal'] = outgroup
 
-        ingroup = IntegrityPatterns.INGROUP_REINFORCEMENT.findall(text)
-        ingroup_score = len(ingroup) * 20
+        ingroup = ctx.findall(self.patterns.INGROUP_REINFORCEMENT)
+        ingroup_score = len(ingroup) * self.MARKER_SCORES['INGROUP_REINFORCEMENT']
         if ingroup:
             matches.extend(ingroup)
             details['ingroup_reinforcement'] = ingroup
 
-        boundary = IntegrityPatterns.ENGAGEMENT_BOUNDARY.findall(text)
-        boundary_score = len(boundary) * 25
+        boundary = ctx.findall(self.patterns.ENGAGEMENT_BOUNDARY)
+        boundary_score = len(boundary) * self.MARKER_SCORES['ENGAGEMENT_BOUNDARY']
         if boundary:
             matches.extend(boundary)
             details['engagement_boundary'] = boundary
@@ -700,39 +752,48 @@ class PublicPositionDetector:
     - Consistency reference language (20 pts)
     - Position change labeling (35 pts)
     """
+    patterns = IntegrityPatterns
     THRESHOLD = 40
     MAX_SCORE = 175
+    MARKER_SCORES = {
+        'PUBLIC_COMMITMENT_PROMPT': 25,
+        'SOCIAL_PROOF_COMMITMENT': 15,
+        'ESCALATING_COMMITMENT': 30,
+        'CONSISTENCY_REFERENCE': 20,
+        'POSITION_CHANGE_LABELING': 35
+    }
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
-        public = IntegrityPatterns.PUBLIC_COMMITMENT_PROMPT.findall(text)
-        public_score = len(public) * 25
+        public = ctx.findall(self.patterns.PUBLIC_COMMITMENT_PROMPT)
+        public_score = len(public) * self.MARKER_SCORES['PUBLIC_COMMITMENT_PROMPT']
         if public:
             matches.extend(public)
             details['public_commitment'] = public
 
-        social = IntegrityPatterns.SOCIAL_PROOF_COMMITMENT.findall(text)
-        social_score = len(social) * 15
+        social = ctx.findall(self.patterns.SOCIAL_PROOF_COMMITMENT)
+        social_score = len(social) * self.MARKER_SCORES['SOCIAL_PROOF_COMMITMENT']
         if social:
             matches.extend(social)
             details['social_proof_commitment'] = social
 
-        escalating = IntegrityPatterns.ESCALATING_COMMITMENT.findall(text)
-        escalating_score = len(escalating) * 30
+        escalating = ctx.findall(self.patterns.ESCALATING_COMMITMENT)
+        escalating_score = len(escalating) * self.MARKER_SCORES['ESCALATING_COMMITMENT']
         if escalating:
             matches.extend(escalating)
             details['escalating_commitment'] = escalating
 
-        consistency = IntegrityPatterns.CONSISTENCY_REFERENCE.findall(text)
-        consistency_score = len(consistency) * 20
+        consistency = ctx.findall(self.patterns.CONSISTENCY_REFERENCE)
+        consistency_score = len(consistency) * self.MARKER_SCORES['CONSISTENCY_REFERENCE']
         if consistency:
             matches.extend(consistency)
             details['consistency_reference'] = consistency
 
-        labeling = IntegrityPatterns.POSITION_CHANGE_LABELING.findall(text)
-        labeling_score = len(labeling) * 35
+        labeling = ctx.findall(self.patterns.POSITION_CHANGE_LABELING)
+        labeling_score = len(labeling) * self.MARKER_SCORES['POSITION_CHANGE_LABELING']
         if labeling:
             matches.extend(labeling)
             details['position_change_labeling'] = labeling
@@ -766,47 +827,57 @@ class CognitiveLoadDetector:
     - Time pressure + complexity (30 pts)
     - High complexity density bonus (15 pts)
     """
+    patterns = IntegrityPatterns
     THRESHOLD = 45
     MAX_SCORE = 180
+    MARKER_SCORES = {
+        'INFORMATION_DENSITY': 20,
+        'COMPLEXITY_STACKING': 15,
+        'DECISION_COMPLEXITY': 25,
+        'ATTENTION_INTERRUPT': 20,
+        'TIME_PRESSURE_COMPLEXITY': 30
+    }
+    COMPLEXITY_BONUS = 15
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
-        density = IntegrityPatterns.INFORMATION_DENSITY.findall(text)
-        density_score = len(density) * 20
+        density = ctx.findall(self.patterns.INFORMATION_DENSITY)
+        density_score = len(density) * self.MARKER_SCORES['INFORMATION_DENSITY']
         if density:
             matches.extend([d[0] if isinstance(d, tuple) else d for d in density])
             details['information_density'] = len(density)
 
-        stacking = IntegrityPatterns.COMPLEXITY_STACKING.findall(text)
-        stacking_score = len(stacking) * 15
+        stacking = ctx.findall(self.patterns.COMPLEXITY_STACKING)
+        stacking_score = len(stacking) * self.MARKER_SCORES['COMPLEXITY_STACKING']
         if stacking:
             matches.extend(stacking)
             details['complexity_markers'] = stacking
 
-        decision = IntegrityPatterns.DECISION_COMPLEXITY.findall(text)
-        decision_score = len(decision) * 25
+        decision = ctx.findall(self.patterns.DECISION_COMPLEXITY)
+        decision_score = len(decision) * self.MARKER_SCORES['DECISION_COMPLEXITY']
         if decision:
             matches.extend(decision)
             details['decision_complexity'] = decision
 
-        interrupt = IntegrityPatterns.ATTENTION_INTERRUPT.findall(text)
-        interrupt_score = len(interrupt) * 20
+        interrupt = ctx.findall(self.patterns.ATTENTION_INTERRUPT)
+        interrupt_score = len(interrupt) * self.MARKER_SCORES['ATTENTION_INTERRUPT']
         if interrupt:
             matches.extend(interrupt)
             details['attention_interrupt'] = interrupt
 
-        time_pressure = IntegrityPatterns.TIME_PRESSURE_COMPLEXITY.findall(text)
-        time_score = len(time_pressure) * 30
+        time_pressure = ctx.findall(self.patterns.TIME_PRESSURE_COMPLEXITY)
+        time_score = len(time_pressure) * self.MARKER_SCORES['TIME_PRESSURE_COMPLEXITY']
         if time_pressure:
             matches.extend(time_pressure)
             details['time_pressure'] = time_pressure
 
         word_count = len(text.split())
-        sentence_count = max(len(re.split(r'[.!?]+', text)), 1)
+        sentence_count = max(len(ctx.sentences), 1)
         avg_sentence_length = word_count / sentence_count
-        complexity_bonus = 15 if avg_sentence_length > 25 and word_count > 500 else 0
+        complexity_bonus = self.COMPLEXITY_BONUS if avg_sentence_length > 25 and word_count > 500 else 0
 
         raw_score = density_score + stacking_score + decision_score + interrupt_score + time_score + complexity_bonus
         normalized_score = min(int((raw_score / self.MAX_SCORE) * 100), 100)
@@ -837,45 +908,55 @@ class SusceptibilityTargetingDetector:
     - Distress state targeting (35 pts)
     - Self-evaluation targeting (30 pts)
     """
+    patterns = IntegrityPatterns
     THRESHOLD = 25
     MAX_SCORE = 200
+    MARKER_SCORES = {
+        'CHILD_DIRECTED': 35,
+        'YOUTH_LINGUISTIC_MARKERS': 15,
+        'MINOR_SPECIFIC_PATTERNS': 40,
+        'HABITUAL_USE_PATTERNS': 30,
+        'DISTRESS_STATE_TARGETING': 35,
+        'SELF_EVALUATION_TARGETING': 30
+    }
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
-        child = IntegrityPatterns.CHILD_DIRECTED.findall(text)
-        child_score = len(child) * 35
+        child = ctx.findall(self.patterns.CHILD_DIRECTED)
+        child_score = len(child) * self.MARKER_SCORES['CHILD_DIRECTED']
         if child:
             matches.extend(child)
             details['child_directed'] = child
 
-        youth = IntegrityPatterns.YOUTH_LINGUISTIC_MARKERS.findall(text)
-        youth_score = len(youth) * 15
+        youth = ctx.findall(self.patterns.YOUTH_LINGUISTIC_MARKERS)
+        youth_score = len(youth) * self.MARKER_SCORES['YOUTH_LINGUISTIC_MARKERS']
         if youth:
             matches.extend(youth)
             details['youth_markers'] = youth
 
-        minor = IntegrityPatterns.MINOR_SPECIFIC_PATTERNS.findall(text)
-        minor_score = len(minor) * 40
+        minor = ctx.findall(self.patterns.MINOR_SPECIFIC_PATTERNS)
+        minor_score = len(minor) * self.MARKER_SCORES['MINOR_SPECIFIC_PATTERNS']
         if minor:
             matches.extend(minor)
             details['minor_patterns'] = minor
 
-        habitual = IntegrityPatterns.HABITUAL_USE_PATTERNS.findall(text)
-        habitual_score = len(habitual) * 30
+        habitual = ctx.findall(self.patterns.HABITUAL_USE_PATTERNS)
+        habitual_score = len(habitual) * self.MARKER_SCORES['HABITUAL_USE_PATTERNS']
         if habitual:
             matches.extend(habitual)
             details['habitual_use'] = habitual
 
-        distress = IntegrityPatterns.DISTRESS_STATE_TARGETING.findall(text)
-        distress_score = len(distress) * 35
+        distress = ctx.findall(self.patterns.DISTRESS_STATE_TARGETING)
+        distress_score = len(distress) * self.MARKER_SCORES['DISTRESS_STATE_TARGETING']
         if distress:
             matches.extend(distress)
             details['distress_targeting'] = distress
 
-        self_eval = IntegrityPatterns.SELF_EVALUATION_TARGETING.findall(text)
-        self_eval_score = len(self_eval) * 30
+        self_eval = ctx.findall(self.patterns.SELF_EVALUATION_TARGETING)
+        self_eval_score = len(self_eval) * self.MARKER_SCORES['SELF_EVALUATION_TARGETING']
         if self_eval:
             matches.extend(self_eval)
             details['self_evaluation_targeting'] = self_eval
@@ -908,39 +989,48 @@ class IdentityPositionDetector:
     - Reversal impossibility framing (35 pts)
     - Exit cost amplification (25 pts)
     """
+    patterns = IntegrityPatterns
     THRESHOLD = 35
     MAX_SCORE = 185
+    MARKER_SCORES = {
+        'IDENTITY_BELIEF_FUSION': 25,
+        'BELIEF_VIRTUE_ASSOCIATION': 20,
+        'POSITION_CHANGE_COST': 30,
+        'REVERSAL_IMPOSSIBILITY': 35,
+        'EXIT_COST_AMPLIFICATION': 25
+    }
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
-        fusion = IntegrityPatterns.IDENTITY_BELIEF_FUSION.findall(text)
-        fusion_score = len(fusion) * 25
+        fusion = ctx.findall(self.patterns.IDENTITY_BELIEF_FUSION)
+        fusion_score = len(fusion) * self.MARKER_SCORES['IDENTITY_BELIEF_FUSION']
         if fusion:
             matches.extend(fusion)
             details['identity_fusion'] = fusion
 
-        virtue = IntegrityPatterns.BELIEF_VIRTUE_ASSOCIATION.findall(text)
-        virtue_score = len(virtue) * 20
+        virtue = ctx.findall(self.patterns.BELIEF_VIRTUE_ASSOCIATION)
+        virtue_score = len(virtue) * self.MARKER_SCORES['BELIEF_VIRTUE_ASSOCIATION']
         if virtue:
             matches.extend(virtue)
             details['belief_virtue'] = virtue
 
-        cost = IntegrityPatterns.POSITION_CHANGE_COST.findall(text)
-        cost_score = len(cost) * 30
+        cost = ctx.findall(self.patterns.POSITION_CHANGE_COST)
+        cost_score = len(cost) * self.MARKER_SCORES['POSITION_CHANGE_COST']
         if cost:
             matches.extend(cost)
             details['position_change_cost'] = cost
 
-        reversal = IntegrityPatterns.REVERSAL_IMPOSSIBILITY.findall(text)
-        reversal_score = len(reversal) * 35
+        reversal = ctx.findall(self.patterns.REVERSAL_IMPOSSIBILITY)
+        reversal_score = len(reversal) * self.MARKER_SCORES['REVERSAL_IMPOSSIBILITY']
         if reversal:
             matches.extend(reversal)
             details['reversal_impossibility'] = reversal
 
-        exit_cost = IntegrityPatterns.EXIT_COST_AMPLIFICATION.findall(text)
-        exit_score = len(exit_cost) * 25
+        exit_cost = ctx.findall(self.patterns.EXIT_COST_AMPLIFICATION)
+        exit_score = len(exit_cost) * self.MARKER_SCORES['EXIT_COST_AMPLIFICATION']
         if exit_cost:
             matches.extend(exit_cost)
             details['exit_costs'] = exit_cost
@@ -974,45 +1064,55 @@ class IntensityEscalationDetector:
     - Binary framing (20 pts)
     - Threat narrative patterns (25 pts)
     """
+    patterns = IntegrityPatterns
     THRESHOLD = 30
     MAX_SCORE = 220
+    MARKER_SCORES = {
+        'ESCALATION_SIGNALS': 25,
+        'RELATIONSHIP_SEVERANCE': 30,
+        'INTENSITY_AMPLIFICATION': 20,
+        'DEHUMANIZATION_MARKERS': 40,
+        'BINARY_FRAMING': 20,
+        'THREAT_NARRATIVE': 25
+    }
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
-        escalation = IntegrityPatterns.ESCALATION_SIGNALS.findall(text)
-        escalation_score = len(escalation) * 25
+        escalation = ctx.findall(self.patterns.ESCALATION_SIGNALS)
+        escalation_score = len(escalation) * self.MARKER_SCORES['ESCALATION_SIGNALS']
         if escalation:
             matches.extend(escalation)
             details['escalation_signals'] = escalation
 
-        severance = IntegrityPatterns.RELATIONSHIP_SEVERANCE.findall(text)
-        severance_score = len(severance) * 30
+        severance = ctx.findall(self.patterns.RELATIONSHIP_SEVERANCE)
+        severance_score = len(severance) * self.MARKER_SCORES['RELATIONSHIP_SEVERANCE']
         if severance:
             matches.extend(severance)
             details['relationship_severance'] = severance
 
-        amplification = IntegrityPatterns.INTENSITY_AMPLIFICATION.findall(text)
-        amplification_score = len(amplification) * 20
+        amplification = ctx.findall(self.patterns.INTENSITY_AMPLIFICATION)
+        amplification_score = len(amplification) * self.MARKER_SCORES['INTENSITY_AMPLIFICATION']
         if amplification:
             matches.extend(amplification)
             details['intensity_amplification'] = amplification
 
-        dehumanization = IntegrityPatterns.DEHUMANIZATION_MARKERS.findall(text)
-        dehumanization_score = len(dehumanization) * 40
+        dehumanization = ctx.findall(self.patterns.DEHUMANIZATION_MARKERS)
+        dehumanization_score = len(dehumanization) * self.MARKER_SCORES['DEHUMANIZATION_MARKERS']
         if dehumanization:
             matches.extend(dehumanization)
             details['dehumanization_markers'] = dehumanization
 
-        binary = IntegrityPatterns.BINARY_FRAMING.findall(text)
-        binary_score = len(binary) * 20
+        binary = ctx.findall(self.patterns.BINARY_FRAMING)
+        binary_score = len(binary) * self.MARKER_SCORES['BINARY_FRAMING']
         if binary:
             matches.extend(binary)
             details['binary_framing'] = binary
 
-        threat = IntegrityPatterns.THREAT_NARRATIVE.findall(text)
-        threat_score = len(threat) * 25
+        threat = ctx.findall(self.patterns.THREAT_NARRATIVE)
+        threat_score = len(threat) * self.MARKER_SCORES['THREAT_NARRATIVE']
         if threat:
             matches.extend(threat)
             details['threat_narrative'] = threat
@@ -1047,51 +1147,62 @@ class EmotionalCyclingDetector:
     - Analytical bypass patterns (20 pts)
     - Vigilance reduction markers (15 pts)
     """
+    patterns = IntegrityPatterns
     THRESHOLD = 35
     MAX_SCORE = 195
+    MARKER_SCORES = {
+        'FEAR_RELIEF_SEQUENCE': 35,
+        'HOPE_DISAPPOINTMENT_SEQUENCE': 30,
+        'INTERMITTENT_REINFORCEMENT': 25,
+        'EXCLUSIVE_UNDERSTANDING': 30,
+        'SUPPORT_NETWORK_DISPLACEMENT': 25,
+        'ANALYTICAL_BYPASS': 20,
+        'VIGILANCE_REDUCTION': 15
+    }
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
-        fear_relief = IntegrityPatterns.FEAR_RELIEF_SEQUENCE.findall(text)
-        fear_score = len(fear_relief) * 35
+        fear_relief = ctx.findall(self.patterns.FEAR_RELIEF_SEQUENCE)
+        fear_score = len(fear_relief) * self.MARKER_SCORES['FEAR_RELIEF_SEQUENCE']
         if fear_relief:
             matches.extend(fear_relief)
             details['fear_relief_cycles'] = len(fear_relief)
 
-        hope_disappoint = IntegrityPatterns.HOPE_DISAPPOINTMENT_SEQUENCE.findall(text)
-        hope_score = len(hope_disappoint) * 30
+        hope_disappoint = ctx.findall(self.patterns.HOPE_DISAPPOINTMENT_SEQUENCE)
+        hope_score = len(hope_disappoint) * self.MARKER_SCORES['HOPE_DISAPPOINTMENT_SEQUENCE']
         if hope_disappoint:
             matches.extend(hope_disappoint)
             details['hope_disappointment_cycles'] = len(hope_disappoint)
 
-        intermittent = IntegrityPatterns.INTERMITTENT_REINFORCEMENT.findall(text)
-        intermittent_score = len(intermittent) * 25
+        intermittent = ctx.findall(self.patterns.INTERMITTENT_REINFORCEMENT)
+        intermittent_score = len(intermittent) * self.MARKER_SCORES['INTERMITTENT_REINFORCEMENT']
         if intermittent:
             matches.extend(intermittent)
             details['intermittent_reinforcement'] = intermittent
 
-        exclusive = IntegrityPatterns.EXCLUSIVE_UNDERSTANDING.findall(text)
-        exclusive_score = len(exclusive) * 30
+        exclusive = ctx.findall(self.patterns.EXCLUSIVE_UNDERSTANDING)
+        exclusive_score = len(exclusive) * self.MARKER_SCORES['EXCLUSIVE_UNDERSTANDING']
         if exclusive:
             matches.extend(exclusive)
             details['exclusive_understanding'] = exclusive
 
-        displacement = IntegrityPatterns.SUPPORT_NETWORK_DISPLACEMENT.findall(text)
-        displacement_score = len(displacement) * 25
+        displacement = ctx.findall(self.patterns.SUPPORT_NETWORK_DISPLACEMENT)
+        displacement_score = len(displacement) * self.MARKER_SCORES['SUPPORT_NETWORK_DISPLACEMENT']
         if displacement:
             matches.extend(displacement)
             details['support_displacement'] = displacement
 
-        bypass = IntegrityPatterns.ANALYTICAL_BYPASS.findall(text)
-        bypass_score = len(bypass) * 20
+        bypass = ctx.findall(self.patterns.ANALYTICAL_BYPASS)
+        bypass_score = len(bypass) * self.MARKER_SCORES['ANALYTICAL_BYPASS']
         if bypass:
             matches.extend(bypass)
             details['analytical_bypass'] = bypass
 
-        vigilance = IntegrityPatterns.VIGILANCE_REDUCTION.findall(text)
-        vigilance_score = len(vigilance) * 15
+        vigilance = ctx.findall(self.patterns.VIGILANCE_REDUCTION)
+        vigilance_score = len(vigilance) * self.MARKER_SCORES['VIGILANCE_REDUCTION']
         if vigilance:
             matches.extend(vigilance)
             details['vigilance_reduction'] = vigilance
@@ -1133,7 +1244,9 @@ class IntegrityPatternAuditor:
         'EMOTIONAL_CYCLING': 1.2
     }
 
-    def __init__(self):
+    def __init__(self, normalize: bool = False):
+        # Normalize text once per audit (TEXT_NORMALIZER.py); off by default
+        self.normalize = normalize
         self.detectors = {
             'SYNTHETIC_AUTHORITY': SyntheticAuthorityDetector(),
             'UNDISCLOSED_COMMERCIAL': UndisclosedCommercialDetector(),
@@ -1146,6 +1259,10 @@ class IntegrityPatternAuditor:
             'INTENSITY_ESCALATION': IntensityEscalationDetector(),
             'EMOTIONAL_CYCLING': EmotionalCyclingDetector()
         }
+        # Observed detector run times, for deadline-aware audits (AUDIT_BUDGET.py)
+        self.costs = DetectorCosts()
+        # Cross-category combination rules (COMBINATION_RULES.py)
+        self.combination_rules = RuleSet(INTEGRITY_COMBINATION_RULES)
 
     def _generate_audit_id(self, text: str) -> str:
         return hashlib.md5(text.encode()).hexdigest()[:12]
@@ -1174,79 +1291,49 @@ class IntegrityPatternAuditor:
             return IntensityLevel.EXTREME
 
     def _identify_combinations(self, detections: Dict[str, DetectionResult]) -> List[Dict[str, Any]]:
-        combinations = []
-
-        if detections['SUSCEPTIBILITY_TARGETING'].score > 50:
-            combinations.append({
-                'type': 'HIGH_SUSCEPTIBILITY_TARGETING',
-                'intensity': 'EXTREME',
-                'score': detections['SUSCEPTIBILITY_TARGETING'].score,
-                'matches': detections['SUSCEPTIBILITY_TARGETING'].matches[:5]
-            })
-
-        if detections['INTENSITY_ESCALATION'].score > 40:
-            combinations.append({
-                'type': 'HIGH_INTENSITY_ESCALATION',
-                'intensity': 'EXTREME',
-                'score': detections['INTENSITY_ESCALATION'].score,
-                'matches': detections['INTENSITY_ESCALATION'].matches[:5]
-            })
-
-        escalation_details = detections['INTENSITY_ESCALATION'].details
-        if 'dehumanization_markers' in escalation_details and escalation_details['dehumanization_markers']:
-            combinations.append({
-                'type': 'DEHUMANIZATION_PRESENT',
-                'intensity': 'EXTREME',
-                'matches': escalation_details['dehumanization_markers'][:3]
-            })
-
-        if detections['IDENTITY_POSITION'].score > 30 and detections['INFORMATION_ENVIRONMENT'].score > 30:
-            combinations.append({
-                'type': 'IDENTITY_PLUS_ENVIRONMENT',
-                'intensity': 'HIGH',
-                'combined_score': (detections['IDENTITY_POSITION'].score + detections['INFORMATION_ENVIRONMENT'].score) / 2
-            })
-
-        if (detections['INFORMATION_ENVIRONMENT'].score > 30 and
-                detections['INTENSITY_ESCALATION'].score > 30 and
-                detections['IDENTITY_POSITION'].score > 30):
-            combinations.append({
-                'type': 'ESCALATION_PIPELINE',
-                'intensity': 'EXTREME',
-                'combined_score': (detections['INFORMATION_ENVIRONMENT'].score +
-                                   detections['INTENSITY_ESCALATION'].score +
-                                   detections['IDENTITY_POSITION'].score) / 3
-            })
-
-        if (detections['SUSCEPTIBILITY_TARGETING'].score > 25 and
-                detections['EMOTIONAL_CYCLING'].score > 30 and
-                detections['COGNITIVE_LOAD'].score > 30):
-            combinations.append({
-                'type': 'COMPOUND_TARGETING',
-                'intensity': 'EXTREME',
-                'combined_score': (detections['SUSCEPTIBILITY_TARGETING'].score +
-                                   detections['EMOTIONAL_CYCLING'].score +
-                                   detections['COGNITIVE_LOAD'].score) / 3
-            })
-
-        if (detections['SYNTHETIC_AUTHORITY'].score > 30 and
-                detections['UNDISCLOSED_COMMERCIAL'].score > 30 and
-                detections['CONCEALED_IDENTITY'].score > 30):
-            combinations.append({
-                'type': 'LAYERED_CONCEALMENT',
-                'intensity': 'HIGH',
-                'combined_score': (detections['SYNTHETIC_AUTHORITY'].score +
-                                   detections['UNDISCLOSED_COMMERCIAL'].score +
-                                   detections['CONCEALED_IDENTITY'].score) / 3
-            })
-
-        return combinations
-
-    def audit(self, text: str) -> IntegrityAuditReport:
+        return self.combination_rules.evaluate(detections)
+
+    def audit(self, text: str, ctx: Optional[ScanContext] = None,
+              deadline: Optional[float] = None) -> IntegrityAuditReport:
+        ctx = ctx or ScanContext.create(text, self.normalize)
+        if deadline is not None:
+            return self._audit_until(text, ctx, deadline)
         detections = {}
         for category, detector in self.detectors.items():
-            detections[category] = detector.detect(text)
+            detections[category] = detector.detect(ctx.text, ctx)
+
+        return self._build_report(detections, self._generate_audit_id(text), len(text))
+
+    def _placeholder(self, category: str, score: int) -> DetectionResult:
+        flagged = score > self.detectors[category].THRESHOLD
+        return DetectionResult(category, score, flagged, self.detectors[category].THRESHOLD, [],
+                               {'skipped': 'deadline'})
+
+    def _audit_until(self, text: str, ctx: ScanContext, deadline: float) -> IntegrityAuditReport:
+        """
+        Run detectors by category weight per second until the deadline.
+
+        Unrun categories score 0 in the report; the deadline section bounds
+        the composite with them at either end of their range.
+        """
+        detections, missing = run_until(self.detectors, self.CATEGORY_WEIGHTS, ctx.text, ctx,
+                                        deadline, self.costs)
+        lower = {cat: detections.get(cat) or self._placeholder(cat, SCORE_BOUNDS[0]) for cat in self.detectors}
+        upper = {cat: detections.get(cat) or self._placeholder(cat, SCORE_BOUNDS[1]) for cat in self.detectors}
+
+        report = self._build_report(lower, self._generate_audit_id(text), len(text))
+        high = self._calculate_composite(upper)
+        report.deadline = {
+            'partial': bool(missing),
+            'completed': [cat for cat in self.detectors if cat not in missing],
+            'missing': {cat: list(SCORE_BOUNDS) for cat in missing},
+            'composite_bounds': [report.composite_index, round(high, 1)],
+            'intensity_bounds': [report.intensity.value, self._classify_intensity(high).value],
+        }
+        return report
 
+    def _build_report(self, detections: Dict[str, DetectionResult], audit_id: str,
+                      text_length: int) -> IntegrityAuditReport:
         composite = self._calculate_composite(detections)
         intensity = self._classify_intensity(composite)
         combinations = self._identify_combinations(detections)
@@ -1264,9 +1351,9 @@ class IntegrityPatternAuditor:
         }
 
         return IntegrityAuditReport(
-            audit_id=self._generate_audit_id(text),
+            audit_id=audit_id,
             timestamp=datetime.now().isoformat(),
-            text_length=len(text),
+            text_length=text_length,
             detections=detections,
             composite_index=round(composite, 1),
             intensity=intensity,
@@ -1274,10 +1361,46 @@ class IntegrityPatternAuditor:
             summary=summary
         )
 
-    def quick_score(self, text: str) -> Dict[str, Any]:
+    def decide(self, text: str, ctx: Optional[ScanContext] = None,
+               deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Intensity only: run detectors until the level can no longer change.
+
+        The composite only grows with any score or flag, so scoring the
+        remaining categories at 0 (unflagged) and 100 (flagged) bounds it;
+        detection stops once both bounds give the same intensity.
+        """
+        ctx = ctx or ScanContext.create(text, self.normalize)
+
+        def bounds(detections: Dict[str, DetectionResult]) -> Tuple[float, ...]:
+            return tuple(
+                self._calculate_composite({cat: detections.get(cat) or self._placeholder(cat, fill)
+                                           for cat in self.detectors})
+                for fill in SCORE_BOUNDS
+            )
+
+        def classify(score: float) -> str:
+            return self._classify_intensity(score).value
+
+        def settled(detections: Dict[str, DetectionResult]) -> bool:
+            return fixed_label(classify, *bounds(detections)) is not None
+
+        detections, missing = run_until(self.detectors, self.CATEGORY_WEIGHTS, ctx.text, ctx,
+                                        float('inf') if deadline is None else deadline, self.costs, settled)
+        low, high = bounds(detections)
+        return {
+            'intensity': fixed_label(classify, low, high),
+            'intensity_bounds': [classify(low), classify(high)],
+            'composite_bounds': [round(low, 1), round(high, 1)],
+            'completed': list(detections),
+            'skipped': missing,
+        }
+
+    def quick_score(self, text: str, ctx: Optional[ScanContext] = None) -> Dict[str, Any]:
+        ctx = ctx or ScanContext.create(text, self.normalize)
         detections = {}
         for category, detector in self.detectors.items():
-            result = detector.detect(text)
+            result = detector.detect(ctx.text, ctx)
             detections[category] = {'score': result.score, 'flagged': result.flagged}
 
         composite = self._calculate_composite({
@@ -1291,7 +1414,7 @@ class IntegrityPatternAuditor:
             'intensity': self._classify_intensity(composite).value
         }
 
-    def to_json(self, report: IntegrityAuditReport) -> str:
+    def to_dict(self, report: IntegrityAuditReport) -> Dict[str, Any]:
         def serialize(obj):
             if isinstance(obj, DetectionResult):
                 return {
@@ -1310,7 +1433,7 @@ class IntegrityPatternAuditor:
                 return [serialize(v) for v in obj]
             return obj
 
-        report_dict = {
+        return {
             'audit_id': report.audit_id,
             'timestamp': report.timestamp,
             'text_length': report.text_length,
@@ -1318,9 +1441,12 @@ class IntegrityPatternAuditor:
             'composite_index': report.composite_index,
             'intensity': report.intensity.value,
             'pattern_combinations': report.pattern_combinations,
-            'summary': report.summary
+            'summary': report.summary,
+            **({'deadline': report.deadline} if report.deadline is not None else {})
         }
-        return json.dumps(report_dict, indent=2)
+
+    def to_json(self, report: IntegrityAuditReport) -> str:
+        return json.dumps(self.to_dict(report), indent=2)
 
 
 def audit_integrity(text: str) -> IntegrityAuditReport:
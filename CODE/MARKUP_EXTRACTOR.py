@@ -0,0 +1,301 @@
+"""
+MARKUP EXTRACTOR
+================
+Streaming HTML and Markdown to text, with block boundaries for the detectors.
+
+Landing pages and emails arrive as markup. Stripping tags before audit()
+loses the headings, list items and paragraphs that the structural
+detectors look for, so they fall back to guessing from newlines and
+sentence punctuation. The extractors here emit clean text plus one Block
+span per structural unit in a single pass, without building a DOM:
+    - HtmlExtractor is an html.parser.HTMLParser subclass; feed() it chunks
+      as they arrive. Script, style and other non-content elements are
+      dropped, character references decoded, whitespace collapsed.
+    - MarkdownExtractor reads lines; headings, list items, quotes, fenced
+      code and paragraphs become blocks and inline markup is stripped.
+Blocks are separated by a blank line in the output text. A ScanContext
+built from the result splits sentences within blocks and gives
+MemorableDetector one line per block.
+
+Usage:
+    extracted = extract_markup(raw_html)
+    ctx = ScanContext.from_extracted(extracted)
+    report = UnifiedPersuasionAuditor().audit(extracted.text, ctx)
+    # or in one step
+    report = CombinedAuditor().audit_markup(raw_html)
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import List, Optional, Iterable, Tuple
+
+BLOCK_SEPARATOR = "\n\n"
+
+# =============================================================================
+# SECTION 1: OUTPUT
+# =============================================================================
+
+@dataclass
+class Block:
+    """One structural unit: [start, end) in the extracted text."""
+    kind: str
+    start: int
+    end: int
+    level: int = 0
+
+
+@dataclass
+class ExtractedText:
+    """Clean text and its block spans."""
+    text: str
+    blocks: List[Block] = field(default_factory=list)
+    source_format: str = "text"
+
+    def block_texts(self) -> List[str]:
+        return [self.text[block.start:block.end] for block in self.blocks]
+
+
+class _BlockWriter:
+    """Accumulates inline text and closes it into blocks."""
+
+    _SPACE = re.compile(r'\s+')
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.length = 0
+        self.blocks: List[Block] = []
+        self.pending: List[str] = []
+
+    def write(self, data: str) -> None:
+        self.pending.append(data)
+
+    def close_block(self, kind: str, level: int = 0) -> None:
+        content = self._SPACE.sub(" ", "".join(self.pending)).strip()
+        self.pending = []
+        if not content:
+            return
+        if self.parts:
+            self.parts.append(BLOCK_SEPARATOR)
+            self.length += len(BLOCK_SEPARATOR)
+        self.blocks.append(Block(kind, self.length, self.length + len(content), level))
+        self.parts.append(content)
+        self.length += len(content)
+
+    def result(self, source_format: str) -> ExtractedText:
+        return ExtractedText("".join(self.parts), self.blocks, source_format)
+
+
+# =============================================================================
+# SECTION 2: HTML
+# =============================================================================
+
+# Tags whose content is never visible text. <head> itself is not skipped:
+# its end tag is optional, and meta and link are empty anyway.
+HTML_SKIP_TAGS = frozenset({"script", "style", "noscript", "template", "title", "svg", "iframe", "object"})
+
+# Block-level tags and the block kind they open
+HTML_BLOCK_KINDS = {
+    **{f"h{level}": "heading" for level in range(1, 7)},
+    "li": "list_item", "dt": "list_item", "dd": "list_item",
+    "blockquote": "quote", "pre": "code",
+    "td": "cell", "th": "cell", "caption": "heading", "figcaption": "paragraph",
+    "p": "paragraph", "div": "paragraph", "section": "paragraph", "article": "paragraph",
+    "header": "paragraph", "footer": "paragraph", "main": "paragraph", "aside": "paragraph",
+    "nav": "paragraph", "form": "paragraph", "ul": "paragraph", "ol": "paragraph", "dl": "paragraph",
+    "table": "paragraph", "tr": "paragraph", "body": "paragraph", "html": "paragraph",
+    "button": "paragraph", "label": "paragraph", "option": "list_item",
+}
+
+
+class HtmlExtractor(HTMLParser):
+    """Incremental HTML to ExtractedText; feed() chunks, then finish()."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.writer = _BlockWriter()
+        self.skip_depth = 0
+        self.stack: List[Tuple[str, int]] = [("paragraph", 0)]
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in HTML_SKIP_TAGS:
+            self.skip_depth += 1
+            return
+        if tag == "br":
+            self.writer.close_block(*self.stack[-1])
+        elif tag in HTML_BLOCK_KINDS:
+            # Text before a nested block belongs to the enclosing one
+            self.writer.close_block(*self.stack[-1])
+            level = int(tag[1]) if HTML_BLOCK_KINDS[tag] == "heading" and tag[0] == "h" else 0
+            self.stack.append((HTML_BLOCK_KINDS[tag], level))
+        elif tag == "img":
+            alt = dict(attrs).get("alt")
+            if alt and not self.skip_depth:
+                self.writer.write(f" {alt} ")
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        if tag in HTML_SKIP_TAGS:
+            return
+        self.handle_starttag(tag, attrs)
+        if tag in HTML_BLOCK_KINDS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in HTML_SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+            return
+        if tag in HTML_BLOCK_KINDS:
+            self.writer.close_block(*self.stack[-1])
+            if len(self.stack) > 1:
+                self.stack.pop()
+
+    def handle_data(self, data: str) -> None:
+        if not self.skip_depth:
+            self.writer.write(data)
+
+    def finish(self) -> ExtractedText:
+        self.close()
+        self.writer.close_block(*self.stack[-1])
+        return self.writer.result("html")
+
+
+# =============================================================================
+# SECTION 3: MARKDOWN
+# =============================================================================
+
+MD_HEADING = re.compile(r'^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$')
+MD_SETEXT = re.compile(r'^\s{0,3}(=+|-+)\s*$')
+MD_LIST_ITEM = re.compile(r'^\s*(?:[-*+]|\d{1,9}[.)])\s+(.*)$')
+MD_QUOTE = re.compile(r'^\s{0,3}>\s?(.*)$')
+MD_FENCE = re.compile(r'^\s{0,3}(```|~~~)')
+MD_RULE = re.compile(r'^\s{0,3}([-*_])(\s*\1){2,}\s*$')
+
+MD_INLINE = (
+    (re.compile(r'!\[([^\]]*)\]\([^)]*\)'), r'\1'),           # images -> alt text
+    (re.compile(r'\[([^\]]+)\]\([^)]*\)'), r'\1'),            # links -> label
+    (re.compile(r'\[([^\]]+)\]\[[^\]]*\]'), r'\1'),           # reference links
+    (re.compile(r'`([^`]*)`'), r'\1'),                        # inline code
+    (re.compile(r'(\*\*|__)(.+?)\1'), r'\2'),                 # strong
+    (re.compile(r'(?<![\w*])([*_])(?!\s)(.+?)(?<!\s)\1(?![\w*])'), r'\2'),  # emphasis
+    (re.compile(r'~~(.+?)~~'), r'\1'),                        # strikethrough
+    (re.compile(r'<[^>\n]+>'), ''),                           # inline HTML tags
+)
+
+
+def strip_inline_markdown(line: str) -> str:
+    for pattern, replacement in MD_INLINE:
+        line = pattern.sub(replacement, line)
+    return line
+
+
+class MarkdownExtractor:
+    """Line-streaming Markdown to ExtractedText; feed() lines or chunks, then finish()."""
+
+    def __init__(self):
+        self.writer = _BlockWriter()
+        self.kind: Optional[str] = None
+        self.in_fence = False
+        self.buffer = ""
+
+    def _close(self) -> None:
+        if self.kind is not None:
+            self.writer.close_block(self.kind)
+        self.kind = None
+
+    def _open(self, kind: str, content: str, level: int = 0) -> None:
+        self._close()
+        self.writer.write(content)
+        if kind == "heading":
+            self.writer.close_block(kind, level)
+        else:
+            self.kind = kind
+
+    def feed(self, chunk: str) -> None:
+        self.buffer += chunk
+        *lines, self.buffer = self.buffer.split("\n")
+        for line in lines:
+            self._line(line)
+
+    def _line(self, line: str) -> None:
+        if MD_FENCE.match(line):
+            if self.in_fence:
+                self._close()
+            else:
+                self._close()
+                self.kind = "code"
+            self.in_fence = not self.in_fence
+            return
+        if self.in_fence:
+            self.writer.write(line + "\n")
+            return
+        if not line.strip():
+            self._close()
+            return
+        # Before MD_RULE: "---" under a paragraph underlines a heading
+        if self.kind == "paragraph" and MD_SETEXT.match(line):
+            # Underlined heading: the open paragraph was its text
+            self.writer.close_block("heading", 1 if line.strip()[0] == "=" else 2)
+            self.kind = None
+            return
+        if MD_RULE.match(line):
+            self._close()
+            return
+
+        heading = MD_HEADING.match(line)
+        if heading:
+            self._open("heading", strip_inline_markdown(heading.group(2)), len(heading.group(1)))
+            return
+        item = MD_LIST_ITEM.match(line)
+        if item:
+            self._open("list_item", strip_inline_markdown(item.group(1)))
+            return
+        quote = MD_QUOTE.match(line)
+        if quote:
+            if self.kind != "quote":
+                self._open("quote", "")
+            self.writer.write(" " + strip_inline_markdown(quote.group(1)))
+            return
+        if self.kind is None:
+            self.kind = "paragraph"
+        # Continuation lines join the open paragraph, list item or quote
+        self.writer.write(" " + strip_inline_markdown(line))
+
+    def finish(self) -> ExtractedText:
+        if self.buffer:
+            self._line(self.buffer)
+            self.buffer = ""
+        self._close()
+        return self.writer.result("markdown")
+
+
+# =============================================================================
+# SECTION 4: ENTRY POINTS
+# =============================================================================
+
+_HTML_SNIFF = re.compile(r'<(?:!doctype|html|head|body|div|p|h[1-6]|br|span|a|table|ul|ol|li|section|img)\b', re.IGNORECASE)
+
+
+def detect_format(content: str) -> str:
+    """"html" or "markdown", judged from the first few kilobytes."""
+    return "html" if _HTML_SNIFF.search(content[:4096]) else "markdown"
+
+
+def extract_markup(content: str, source_format: str = "auto") -> ExtractedText:
+    """Extract text and blocks from a whole HTML or Markdown document."""
+    return extract_stream([content], detect_format(content) if source_format == "auto" else source_format)
+
+
+def extract_stream(chunks: Iterable[str], source_format: str) -> ExtractedText:
+    """Extract from chunks as they arrive (e.g. a streamed HTTP body)."""
+    if source_format == "html":
+        extractor = HtmlExtractor()
+    elif source_format == "markdown":
+        extractor = MarkdownExtractor()
+    else:
+        raise ValueError(f"Unknown markup format: {source_format}")
+    for chunk in chunks:
+        extractor.feed(chunk)
+    return extractor.finish()
@@ -0,0 +1,265 @@
+"""
+NEAR-DUPLICATE INDEX
+====================
+Optional near-duplicate suppression in front of the auditors.
+
+Copy-paste variants (same text with a different name, number or punctuation)
+are clustered by one-permutation MinHash signatures over word shingles, with
+LSH banding for candidate lookup. Each shingle is hashed once; the hash picks
+a bin and the bin keeps its minimum, so a signature costs one pass over the
+shingles rather than one per permutation. A text whose estimated Jaccard similarity to a cluster
+representative reaches the threshold reuses the representative's audit; only
+the per-document metadata (ids, hash, length, preview) is patched. Everything
+else gets a full audit and starts a new cluster.
+
+Usage:
+    auditor = NearDuplicateAuditor(UnifiedPersuasionAuditor(), threshold=0.9)
+    report = auditor.audit(text)
+    report.get("near_duplicate")   # {"representative_hash": ..., "similarity": ...}
+
+    # Wrappers built with the same index options can share one fingerprint
+    persuasion = NearDuplicateAuditor(UnifiedPersuasionAuditor())
+    integrity = NearDuplicateAuditor(IntegrityPatternAuditor())
+    fingerprint = persuasion.index.fingerprint(text)
+    persuasion.audit(text, ctx, fingerprint=fingerprint)
+    integrity.audit(text, ctx, fingerprint=fingerprint)
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import re
+import hashlib
+import dataclasses
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+
+# =============================================================================
+# SECTION 1: CONFIGURATION CONSTANTS
+# =============================================================================
+
+DEFAULT_THRESHOLD = 0.9      # Minimum estimated Jaccard similarity to reuse an audit
+DEFAULT_NUM_PERM = 64        # MinHash signature length (bins)
+DEFAULT_BANDS = 16           # LSH bands (rows per band = num_perm / bands)
+DEFAULT_SHINGLE_SIZE = 3     # Words per shingle
+DEFAULT_MAX_CLUSTERS = 100000
+
+_MAX_HASH = (1 << 32) - 1
+# Odd constant added per bin skipped when an empty bin borrows a neighbour's value
+_ROTATION = 0x9E3779B1
+
+_NUMBER_RUN = re.compile(r'\d+(?:[.,]\d+)*')
+_WORD = re.compile(r'[^\W_]+')
+
+
+# =============================================================================
+# SECTION 2: SIGNATURES
+# =============================================================================
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> set:
+    """Word shingles over a normalized form that ignores case, numbers and punctuation."""
+    words = _WORD.findall(_NUMBER_RUN.sub(" 0 ", text.lower()))
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """
+    One-permutation MinHash: one keyed 64-bit hash per shingle, split into a
+    bin (low bits) and a 32-bit value (high bits). Empty bins are filled by
+    rotation from the next non-empty bin, so short texts still compare bin
+    for bin.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1):
+        self.num_perm = num_perm
+        self._key = seed.to_bytes(8, "little")
+
+    def _hash(self, shingle: str) -> int:
+        return int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8, key=self._key).digest(), "little")
+
+    def signature(self, shingle_set: set) -> Tuple[int, ...]:
+        if not shingle_set:
+            return tuple([_MAX_HASH] * self.num_perm)
+        bins = self.num_perm
+        mins: List[Optional[int]] = [None] * bins
+        for shingle in shingle_set:
+            h = self._hash(shingle)
+            index, value = h % bins, h >> 32
+            current = mins[index]
+            if current is None or value < current:
+                mins[index] = value
+        if None in mins:
+            filled = list(mins)
+            for index in range(bins):
+                if mins[index] is None:
+                    distance = 1
+                    while mins[(index + distance) % bins] is None:
+                        distance += 1
+                    filled[index] = (mins[(index + distance) % bins] + distance * _ROTATION) & _MAX_HASH
+            mins = filled
+        return tuple(mins)
+
+    @staticmethod
+    def similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of the underlying shingle sets."""
+        return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+# =============================================================================
+# SECTION 3: CLUSTER INDEX
+# =============================================================================
+
+@dataclasses.dataclass
+class Cluster:
+    """One near-duplicate cluster and its representative's audit."""
+    cluster_id: int
+    signature: Tuple[int, ...]
+    representative_hash: str
+    report: Any
+    members: int = 1
+
+
+class NearDuplicateIndex:
+    """LSH index of cluster representatives, bounded by an LRU on clusters."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        max_clusters: int = DEFAULT_MAX_CLUSTERS
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_clusters = max_clusters
+        self.hasher = MinHasher(num_perm)
+        self.clusters: "OrderedDict[int, Cluster]" = OrderedDict()
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self.exact: Dict[str, int] = {}
+        self._next_id = 0
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        return self.hasher.signature(shingles(text, self.shingle_size))
+
+    def fingerprint(self, text: str) -> Tuple[str, Tuple[int, ...]]:
+        """(content hash, signature) for `text`; reusable by indexes built with the same options."""
+        return hashlib.sha256(text.encode()).hexdigest(), self.signature(text)
+
+    def lookup(self, content_hash: str, signature: Tuple[int, ...]) -> Tuple[Optional[Cluster], float]:
+        """Return the most similar cluster at or above the threshold, if any."""
+        cluster_id = self.exact.get(content_hash)
+        if cluster_id is not None and cluster_id in self.clusters:
+            self.clusters.move_to_end(cluster_id)
+            return self.clusters[cluster_id], 1.0
+
+        best, best_similarity = None, 0.0
+        seen = set()
+        for key in self._band_keys(signature):
+            for candidate_id in self.buckets.get(key, ()):
+                if candidate_id in seen:
+                    continue
+                seen.add(candidate_id)
+                cluster = self.clusters[candidate_id]
+                similarity = MinHasher.similarity(signature, cluster.signature)
+                if similarity > best_similarity:
+                    best, best_similarity = cluster, similarity
+        if best is None or best_similarity < self.threshold:
+            return None, best_similarity
+        self.clusters.move_to_end(best.cluster_id)
+        return best, best_similarity
+
+    def add(self, content_hash: str, signature: Tuple[int, ...], report: Any) -> Cluster:
+        cluster = Cluster(self._next_id, signature, content_hash, report)
+        self._next_id += 1
+        self.clusters[cluster.cluster_id] = cluster
+        self.exact[content_hash] = cluster.cluster_id
+        for key in self._band_keys(signature):
+            self.buckets.setdefault(key, []).append(cluster.cluster_id)
+        while len(self.clusters) > self.max_clusters:
+            self._evict(next(iter(self.clusters)))
+        return cluster
+
+    def _evict(self, cluster_id: int) -> None:
+        cluster = self.clusters.pop(cluster_id)
+        if self.exact.get(cluster.representative_hash) == cluster_id:
+            del self.exact[cluster.representative_hash]
+        for key in self._band_keys(cluster.signature):
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                continue
+            bucket.remove(cluster_id)
+            if not bucket:
+                del self.buckets[key]
+
+
+# =============================================================================
+# SECTION 4: AUDITOR WRAPPER
+# =============================================================================
+
+class NearDuplicateAuditor:
+    """
+    Wrap UnifiedPersuasionAuditor or IntegrityPatternAuditor with near-duplicate reuse.
+
+    Reused reports keep the representative's scores, matches and details.
+    Per-document metadata is rewritten and the similarity is recorded under
+    "near_duplicate" (report key for persuasion, summary key for integrity).
+    """
+
+    def __init__(self, auditor: Any, threshold: float = DEFAULT_THRESHOLD, **index_options):
+        self.auditor = auditor
+        self.index = NearDuplicateIndex(threshold=threshold, **index_options)
+        self.stats = {"full_audits": 0, "reused": 0}
+
+    def audit(self, text: str, ctx: Any = None,
+              fingerprint: Optional[Tuple[str, Tuple[int, ...]]] = None) -> Any:
+        """Audit `text`, or reuse a cluster's report; `fingerprint` skips re-hashing (see index.fingerprint)."""
+        content_hash, signature = fingerprint or self.index.fingerprint(text)
+        cluster, similarity = self.index.lookup(content_hash, signature)
+        if cluster is None:
+            report = self.auditor.audit(text, ctx)
+            self.index.add(content_hash, signature, report)
+            self.stats["full_audits"] += 1
+            return report
+
+        cluster.members += 1
+        self.stats["reused"] += 1
+        marker = {
+            "representative_hash": cluster.representative_hash,
+            "similarity": round(similarity, 3),
+            "cluster_size": cluster.members,
+        }
+        return self._patch(cluster.report, text, content_hash, marker)
+
+    def _patch(self, report: Any, text: str, content_hash: str, marker: Dict[str, Any]) -> Any:
+        timestamp = datetime.now().isoformat()
+        if isinstance(report, dict):
+            patched = dict(report)
+            patched["audit_id"] = hashlib.md5(f"{text[:100]}{timestamp}".encode()).hexdigest()[:12]
+            patched["timestamp"] = timestamp
+            patched["content_hash"] = content_hash
+            patched["content_length"] = len(text)
+            patched["content_preview"] = text[:200] + "..." if len(text) > 200 else text
+            patched["near_duplicate"] = marker
+            return patched
+
+        summary = dict(report.summary)
+        summary["near_duplicate"] = marker
+        return dataclasses.replace(
+            report,
+            audit_id=hashlib.md5(text.encode()).hexdigest()[:12],
+            timestamp=timestamp,
+            text_length=len(text),
+            summary=summary
+        )
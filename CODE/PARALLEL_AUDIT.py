@@ -0,0 +1,176 @@
+"""
+PARALLEL AUDIT
+==============
+Audit one very large document on several worker processes.
+
+Batch parallelism does nothing for a single 30 MB report or forum dump.
+Nearly all of a large audit is regex and keyword scanning; the detectors'
+own logic (anaphora, the U-curve, integrity sequence patterns, token and
+sentence features) takes a few percent of the time. So the scans are
+spread across processes and the detectors run once, in this process, on
+a ScanContext primed with the merged results. Every detector therefore
+sees exactly the document-level scan state, and reports are identical to
+a serial audit.
+
+Scans are split two ways:
+    - sentence-local probes (see SENTENCE_CACHE.py) are run over segments
+      of the document. Segments are cut at sentence terminators, the
+      nearest places no local match can cross. A cut at a paragraph break
+      would split matches of patterns like "if\\s+you\\s+know". Each
+      segment's matches are concatenated in document order.
+    - every other regex (lookaround, ".*" spans, terminators in the
+      pattern) runs over the whole document in its own task, so
+      cross-boundary matches are found as usual.
+Workers receive the document once, when the pool starts.
+
+Usage:
+    auditor = ParallelAuditor(CombinedAuditor(), processes=8)
+    report = auditor.audit(huge_text)
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import multiprocessing
+from bisect import bisect_left
+from typing import Dict, List, Optional, Any, Pattern, Tuple
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext, ScanPlan, SENTENCE_BOUNDARY
+    from SENTENCE_CACHE import is_sentence_local, is_local_keyword
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext, ScanPlan, SENTENCE_BOUNDARY
+    from SENTENCE_CACHE import is_sentence_local, is_local_keyword
+
+# Documents shorter than this are scanned in-process
+DEFAULT_MIN_CHARS = 200_000
+# Segments per worker process, so uneven segments still balance
+SEGMENTS_PER_PROCESS = 2
+
+
+# =============================================================================
+# SECTION 1: WORKER
+# =============================================================================
+
+_document: Dict[str, Any] = {}
+
+
+def _init_worker(text: str, lower: str, regexes: List[Tuple[Pattern, bool]], keywords: List[str],
+                 backend: Any) -> None:
+    _document.update(text=text, lower=lower, regexes=regexes, keywords=keywords, backend=backend)
+
+
+def _scan_task(task: Tuple[Any, ...]) -> Tuple[List[List[Any]], List[int]]:
+    """
+    ("segment", raw_start, raw_end, lower_start, lower_end, regex indexes,
+    keyword indexes) scans one segment; ("whole", regex indexes) scans the
+    whole document. Returns matches per regex and the keywords found.
+    """
+    text, lower = _document["text"], _document["lower"]
+    if task[0] == "segment":
+        _, raw_start, raw_end, lower_start, lower_end, regex_ids, keyword_ids = task
+        text, lower = text[raw_start:raw_end], lower[lower_start:lower_end]
+    else:
+        _, regex_ids = task
+        keyword_ids = []
+    regexes, keywords, backend = _document["regexes"], _document["keywords"], _document["backend"]
+    hits = []
+    for index in regex_ids:
+        pattern, is_lower = regexes[index]
+        hits.append(backend.findall(pattern, lower if is_lower else text))
+    return hits, [index for index in keyword_ids if keywords[index] in lower]
+
+
+# =============================================================================
+# SECTION 2: PARALLEL AUDITOR
+# =============================================================================
+
+def segment_cuts(ctx: ScanContext, segments: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    (raw, lowercased) offsets of up to `segments - 1` cuts, each at the start
+    of a terminator run, spaced roughly evenly; None if the text and its
+    lowercased form do not split alike.
+    """
+    raw_runs = [match.start() for match in SENTENCE_BOUNDARY.finditer(ctx.text)]
+    lower_runs = [match.start() for match in SENTENCE_BOUNDARY.finditer(ctx.lower)]
+    if len(raw_runs) != len(lower_runs):
+        return None
+    cuts: List[Tuple[int, int]] = []
+    for part in range(1, segments):
+        run = bisect_left(raw_runs, len(ctx.text) * part // segments)
+        if run < len(raw_runs) and (not cuts or raw_runs[run] > cuts[-1][0]):
+            cuts.append((raw_runs[run], lower_runs[run]))
+    return cuts
+
+
+class ParallelAuditor:
+    """
+    Audit single large documents with scans spread over worker processes.
+
+    Wraps CombinedAuditor, UnifiedPersuasionAuditor or IntegrityPatternAuditor
+    and returns their reports unchanged.
+    """
+
+    def __init__(self, auditor: Any = None, processes: Optional[int] = None,
+                 min_chars: int = DEFAULT_MIN_CHARS):
+        if auditor is None:
+            from COMBINED_AUDITOR import CombinedAuditor
+            auditor = CombinedAuditor()
+        self.auditor = auditor
+        self.processes = processes or os.cpu_count() or 1
+        self.min_chars = min_chars
+        plan = getattr(auditor, "plan", None) or ScanPlan.record(lambda ctx: auditor.audit("", ctx))
+        self.plan = plan
+        self.local_regexes = [index for index, (pattern, _) in enumerate(plan.regexes) if is_sentence_local(pattern)]
+        self.global_regexes = [index for index in range(len(plan.regexes)) if index not in self.local_regexes]
+        self.local_keywords = [index for index, keyword in enumerate(plan.keywords) if is_local_keyword(keyword)]
+
+    def _tasks(self, ctx: ScanContext) -> Optional[List[Tuple[Any, ...]]]:
+        cuts = segment_cuts(ctx, self.processes * SEGMENTS_PER_PROCESS)
+        if cuts is None:
+            return None
+        bounds = [(0, 0)] + cuts + [(len(ctx.text), len(ctx.lower))]
+        tasks: List[Tuple[Any, ...]] = [("whole", [index]) for index in self.global_regexes]
+        for (raw_start, lower_start), (raw_end, lower_end) in zip(bounds, bounds[1:]):
+            tasks.append(("segment", raw_start, raw_end, lower_start, lower_end,
+                          self.local_regexes, self.local_keywords))
+        return tasks
+
+    def context(self, text: str) -> ScanContext:
+        """A ScanContext for `text` with every planned scan already run."""
+        ctx = ScanContext.create(text, getattr(self.auditor, "normalize", False))
+        if self.processes < 2 or len(ctx.text) < self.min_chars:
+            return self.plan.execute(ctx)
+        tasks = self._tasks(ctx)
+        if tasks is None:
+            return self.plan.execute(ctx)
+
+        with multiprocessing.Pool(self.processes, _init_worker,
+                                  (ctx.text, ctx.lower, self.plan.regexes, self.plan.keywords,
+                                   ctx.backend)) as pool:
+            outputs = pool.map(_scan_task, tasks, chunksize=1)
+
+        merged: Dict[int, List[Any]] = {index: [] for index in self.local_regexes}
+        found = set()
+        for task, (hits, keyword_hits) in zip(tasks, outputs):
+            regex_ids = task[1] if task[0] == "whole" else task[5]
+            for index, matches in zip(regex_ids, hits):
+                if task[0] == "whole":
+                    merged[index] = matches
+                else:
+                    merged[index].extend(matches)
+            found.update(keyword_hits)
+        for index, matches in merged.items():
+            ctx._regex_hits[self.plan.regexes[index]] = matches
+        for index in self.local_keywords:
+            ctx._keyword_hits[self.plan.keywords[index]] = index in found
+        # Keywords spanning a terminator, if any, are probed here
+        return self.plan.execute(ctx)
+
+    def audit(self, text: str) -> Any:
+        return self.auditor.audit(text, self.context(text))
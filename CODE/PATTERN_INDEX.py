@@ -0,0 +1,306 @@
+"""
+PATTERN INDEX
+=============
+Inverted index from pattern hits to documents.
+
+As documents are audited, the pattern terms that fired (see
+PATTERN_REGISTRY.py) are read from the audit's ScanContext and the document
+is appended to each term's postings list. The text is not scanned again:
+only probes the audit made are indexed, so wrapping a one-framework auditor
+indexes that framework's terms. Postings are sorted document numbers stored
+as delta-encoded varints.
+
+Queries combine term ids with AND, OR, NOT and parentheses. A keyword-list
+term (e.g. AUTHORITY_CREDENTIALS) matches documents that hit any of its
+keywords. Quote terms that contain spaces.
+
+Usage:
+    index = PatternIndex()
+    auditor = IndexingAuditor(CombinedAuditor(), index)
+    for doc_id, text in corpus:
+        auditor.audit(text, doc_id=doc_id)
+    index.query('SCARCITY_DESTRUCTION AND AUTHORITY_CREDENTIALS')
+    index.query('"EMOTIONAL_PAIN_KEYWORDS.status_anxiety:falling behind" AND NOT NATIVE_AD')
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import re
+import json
+import base64
+from typing import Dict, List, Optional, Any, Iterator
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_REGISTRY import PatternRegistry
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_REGISTRY import PatternRegistry
+
+_QUERY_TOKEN = re.compile(r'"[^"]*"|\(|\)|[^\s()]+')
+_OPERATORS = ("AND", "OR", "NOT")
+
+
+# =============================================================================
+# SECTION 1: POSTINGS
+# =============================================================================
+
+class PostingsList:
+    """Append-only sorted document numbers, delta + varint encoded."""
+
+    __slots__ = ("data", "last", "count")
+
+    def __init__(self, data: bytes = b"", last: int = -1, count: int = 0):
+        self.data = bytearray(data)
+        self.last = last
+        self.count = count
+
+    def append(self, doc: int) -> None:
+        if doc <= self.last:
+            raise ValueError("postings must be appended in increasing document order")
+        delta = doc - self.last - 1 if self.count else doc
+        while delta >= 0x80:
+            self.data.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        self.data.append(delta)
+        self.last = doc
+        self.count += 1
+
+    def __iter__(self) -> Iterator[int]:
+        doc, shift, delta, first = -1, 0, 0, True
+        for byte in self.data:
+            delta |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            doc = delta if first else doc + delta + 1
+            first = False
+            yield doc
+            shift, delta = 0, 0
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def _intersect(a: List[int], b: List[int]) -> List[int]:
+    result, i, j = [], 0, 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            result.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _union(a: List[int], b: List[int]) -> List[int]:
+    result, i, j = [], 0, 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            result.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            result.append(a[i])
+            i += 1
+        else:
+            result.append(b[j])
+            j += 1
+    result.extend(a[i:])
+    result.extend(b[j:])
+    return result
+
+
+def _difference(a: List[int], b: List[int]) -> List[int]:
+    exclude = set(b)
+    return [doc for doc in a if doc not in exclude]
+
+
+# =============================================================================
+# SECTION 2: INDEX
+# =============================================================================
+
+class PatternIndex:
+    """Postings per pattern term, built incrementally from audit contexts."""
+
+    def __init__(self, registry: Optional[PatternRegistry] = None):
+        self.registry = registry or PatternRegistry.default()
+        self.doc_ids: List[str] = []
+        self.postings: Dict[str, PostingsList] = {}
+        # Terms evaluated for every document so far (absent postings = no hits)
+        self.indexed_terms = set(self.registry.terms)
+
+    def add(self, doc_id: str, ctx: ScanContext) -> int:
+        """Record the terms that hit in an audited context; returns the document number."""
+        doc = len(self.doc_ids)
+        self.doc_ids.append(doc_id)
+        for term_id, term in self.registry.terms.items():
+            hit = term.observed(ctx)
+            if hit is None:
+                # Not probed by this audit (other framework, deadline skip)
+                self.indexed_terms.discard(term_id)
+            elif hit:
+                postings = self.postings.get(term_id)
+                if postings is None:
+                    postings = self.postings[term_id] = PostingsList()
+                postings.append(doc)
+        return doc
+
+    def _resolve(self, name: str) -> List[str]:
+        """Term ids for a name; a term some document was never probed for can't be answered."""
+        term_ids = self.registry.resolve(name)
+        missing = [term_id for term_id in term_ids if term_id not in self.indexed_terms]
+        if missing:
+            raise ValueError(f"Pattern term not indexed: {', '.join(missing)}")
+        return term_ids
+
+    def _docs(self, name: str) -> List[int]:
+        docs: List[int] = []
+        for term_id in self._resolve(name):
+            postings = self.postings.get(term_id)
+            if postings is not None:
+                docs = _union(docs, list(postings))
+        return docs
+
+    def lookup(self, name: str) -> List[str]:
+        """Documents that hit a single term."""
+        return [self.doc_ids[doc] for doc in self._docs(name)]
+
+    def term_documents(self, term_id: str) -> Optional[List[str]]:
+        """Documents for a term as indexed, or None if the term was never indexed."""
+        if term_id not in self.indexed_terms:
+            return None
+        return [self.doc_ids[doc] for doc in self.postings.get(term_id, ())]
+
+    def document_frequency(self, name: str) -> int:
+        return sum(len(self.postings.get(term_id, ())) for term_id in self._resolve(name))
+
+    # -------------------------------------------------------------------------
+    # Boolean queries
+    # -------------------------------------------------------------------------
+
+    def query(self, expression: str) -> List[str]:
+        """
+        Documents matching a boolean expression over term ids. Raises
+        ValueError for a term the index does not cover (e.g. NOT NATIVE_AD
+        on a persuasion-only index), rather than answering as if nothing hit.
+        """
+        tokens = _QUERY_TOKEN.findall(expression)
+        position, docs = self._parse_or(tokens, 0)
+        if position != len(tokens):
+            raise ValueError(f"Unexpected token in query: {tokens[position]}")
+        return [self.doc_ids[doc] for doc in docs]
+
+    def _parse_or(self, tokens: List[str], position: int):
+        position, docs = self._parse_and(tokens, position)
+        while position < len(tokens) and tokens[position] == "OR":
+            position, other = self._parse_and(tokens, position + 1)
+            docs = _union(docs, other)
+        return position, docs
+
+    def _parse_and(self, tokens: List[str], position: int):
+        include, exclude = [], []
+        while True:
+            negate = False
+            if position < len(tokens) and tokens[position] == "NOT":
+                negate = True
+                position += 1
+            position, docs = self._parse_factor(tokens, position)
+            (exclude if negate else include).append(docs)
+            if position < len(tokens) and tokens[position] == "AND":
+                position += 1
+                continue
+            break
+
+        if include:
+            # Smallest postings first keeps every intermediate result small
+            include.sort(key=len)
+            docs = include[0]
+            for other in include[1:]:
+                if not docs:
+                    break
+                docs = _intersect(docs, other)
+        else:
+            docs = list(range(len(self.doc_ids)))
+        for other in exclude:
+            docs = _difference(docs, other)
+        return position, docs
+
+    def _parse_factor(self, tokens: List[str], position: int):
+        if position >= len(tokens):
+            raise ValueError("Query ended unexpectedly")
+        token = tokens[position]
+        if token == "(":
+            position, docs = self._parse_or(tokens, position + 1)
+            if position >= len(tokens) or tokens[position] != ")":
+                raise ValueError("Unbalanced parentheses in query")
+            return position + 1, docs
+        if token in _OPERATORS or token == ")":
+            raise ValueError(f"Unexpected token in query: {token}")
+        return position + 1, self._docs(token.strip('"'))
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "doc_ids": self.doc_ids,
+            "terms": sorted(self.indexed_terms),
+            "postings": {
+                term_id: [postings.count, postings.last, base64.b64encode(bytes(postings.data)).decode("ascii")]
+                for term_id, postings in self.postings.items()
+            }
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle)
+
+    @classmethod
+    def load(cls, path: str, registry: Optional[PatternRegistry] = None) -> "PatternIndex":
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        index = cls(registry)
+        index.doc_ids = data["doc_ids"]
+        index.indexed_terms = set(data.get("terms", index.indexed_terms))
+        index.postings = {
+            term_id: PostingsList(base64.b64decode(encoded), last, count)
+            for term_id, (count, last, encoded) in data["postings"].items()
+        }
+        return index
+
+
+# =============================================================================
+# SECTION 3: AUDITOR WRAPPER
+# =============================================================================
+
+class IndexingAuditor:
+    """
+    Audit and index in one pass.
+
+    Works with UnifiedPersuasionAuditor, IntegrityPatternAuditor or
+    CombinedAuditor; the index reads the context the audit already filled.
+    """
+
+    def __init__(self, auditor: Any, index: PatternIndex):
+        self.auditor = auditor
+        self.index = index
+
+    def audit(self, text: str, ctx: Optional[ScanContext] = None, doc_id: Optional[str] = None) -> Any:
+        if ctx is None:
+            context = getattr(self.auditor, "context", None)
+            normalize = getattr(self.auditor, "normalize", False)
+            ctx = context(text) if context else ScanContext.create(text, normalize)
+        report = self.auditor.audit(text, ctx)
+        self.index.add(doc_id if doc_id is not None else str(len(self.index.doc_ids)), ctx)
+        return report
@@ -0,0 +1,483 @@
+"""
+PATTERN PACK
+============
+Detection vocabularies loaded from data files, many per process.
+
+A pattern pack is a JSON file that overrides attributes of Patterns,
+IntegrityPatterns or a detector class (its scoring constants):
+
+    {
+        "name": "retail-eu",
+        "patterns": {
+            "Patterns.SCARCITY_URGENCY": {"regex": "\\\\b(nur heute|last chance)\\\\b",
+                                          "flags": ["IGNORECASE"]},
+            "Patterns.AUTHORITY_CREDENTIALS": ["dr.", "prof.", "certified"],
+            "SyntheticAuthorityDetector.MARKER_SCORES": {"UNVERIFIABLE_CREDENTIALS": 10, ...}
+        }
+    }
+
+Every override is validated against the attribute it replaces: it must
+exist and keep its shape (a regex stays a regex, a keyword list a list of
+strings, a dict keeps all of its keys, an int stays an int). A regex given
+as a plain string keeps the original flags.
+
+A loaded pack builds subclasses of only the classes it changes: the pattern
+class with the overridden attributes, and each detector that reads it. Any
+attribute not overridden is inherited, and untouched detectors are the
+built-in ones, so packs in one process share every unchanged compiled
+regex. Memoized scans, sentence cache entries and prefilters keyed on those
+patterns are shared too. Overriding regexes are interned by (source, flags),
+so identical ones in different packs are one object. A pack is identified
+by the SHA-256 of its canonical JSON. Loading the same content twice returns
+the same pack, along with its recorded scan plan (SCAN_CONTEXT.py).
+
+With a cache directory, the validated overlay is written to
+<cache_dir>/<pack hash>.json, tagged with the built-in pattern-set version
+(PATTERN_VERSION.py). Later loads of that pack, in any process, skip
+validation. Python's `re` has no serialized compiled form, so each regex is
+still compiled once per process.
+
+Long-running services reload packs with a PackWatcher. It polls the pack
+file on a background thread. Each new version is loaded and compiled there,
+and `prepare(pack)` builds whatever the service audits with (fresh
+auditors, say). The result is published as one (pack, prepared) reference.
+A caller reads `watcher.current` once per document, so every document is
+audited entirely on one version and in-flight documents finish on the old
+one. A pack that fails to load or validate is reported in `watcher.error`,
+and the previous version keeps serving. Publish new versions by writing a
+temporary file and renaming it over the watched path.
+
+Usage:
+    pack = PatternPack.load("packs/retail-eu.json", cache_dir="/var/cache/persuasion-packs")
+    auditor = pack.apply(CombinedAuditor())
+    report = auditor.audit(text)
+    print(pack.version, pack.snapshot().version)
+
+    watcher = PackWatcher("packs/retail-eu.json", prepare=lambda p: p.apply(CombinedAuditor())).start()
+    pack, auditor = watcher.current
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import re
+import json
+import hashlib
+import tempfile
+import threading
+from typing import Dict, List, Optional, Any, Callable, Pattern, Tuple
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanPlan
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor
+    from PATTERN_REGISTRY import PATTERN_CLASSES, DETECTOR_GROUPS, iter_detectors, class_attributes
+    from PATTERN_VERSION import PatternSnapshot
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanPlan
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor
+    from PATTERN_REGISTRY import PATTERN_CLASSES, DETECTOR_GROUPS, iter_detectors, class_attributes
+    from PATTERN_VERSION import PatternSnapshot
+
+# Bumped when the cached overlay format changes
+CACHE_FORMAT = 1
+# Seconds between checks of a watched pack file
+DEFAULT_RELOAD_INTERVAL = 5.0
+
+
+# =============================================================================
+# SECTION 1: BUILT-IN CLASSES
+# =============================================================================
+
+_builtins: Dict[str, Any] = {}
+
+
+def _builtin() -> Dict[str, Any]:
+    """Owner classes by name, the built-in detector types and the base pattern-set version."""
+    if not _builtins:
+        auditors = {"persuasion": UnifiedPersuasionAuditor(), "integrity": IntegrityPatternAuditor()}
+        detector_types: List[type] = []
+        for framework, auditor in auditors.items():
+            for _, detector in iter_detectors(framework, auditor):
+                if type(detector) not in detector_types:
+                    detector_types.append(type(detector))
+        owners = {cls.__name__: cls for cls in list(PATTERN_CLASSES) + detector_types}
+        _builtins.update(owners=owners, detector_types=detector_types,
+                         version=PatternSnapshot.capture().version)
+    return _builtins
+
+
+# Overriding regexes by (source, flags), seeded with the built-in ones
+_interned: Dict[Tuple[str, int], Pattern] = {}
+
+
+def _compile(source: str, flags: int) -> Pattern:
+    if not _interned:
+        for owner in _builtin()["owners"].values():
+            for value in class_attributes(owner).values():
+                for pattern in _patterns_in(value):
+                    _interned.setdefault((pattern.pattern, pattern.flags), pattern)
+    pattern = _interned.get((source, flags))
+    if pattern is None:
+        compiled = re.compile(source, flags)
+        # Keyed by the flags as given and as compiled (re adds UNICODE to str patterns)
+        pattern = _interned.setdefault((source, compiled.flags), compiled)
+        _interned[(source, flags)] = pattern
+    return pattern
+
+
+def _patterns_in(value: Any) -> List[Pattern]:
+    if isinstance(value, re.Pattern):
+        return [value]
+    if isinstance(value, dict):
+        return [p for item in value.values() for p in _patterns_in(item)]
+    if isinstance(value, (list, tuple)):
+        return [p for item in value for p in _patterns_in(item)]
+    return []
+
+
+# =============================================================================
+# SECTION 2: VALIDATION
+# =============================================================================
+
+def _flag_bits(flags: Any, path: str) -> int:
+    if isinstance(flags, int) and not isinstance(flags, bool):
+        return flags
+    if not isinstance(flags, (list, tuple)):
+        raise ValueError(f"{path}: flags must be a list of flag names or an integer")
+    bits = 0
+    for name in flags:
+        if not isinstance(name, str):
+            raise ValueError(f"{path}: regex flag names must be strings, got {name!r}")
+        flag = getattr(re.RegexFlag, name.upper(), None)
+        if flag is None:
+            raise ValueError(f"{path}: unknown regex flag {name!r}")
+        bits |= flag
+    return bits
+
+
+def _convert(template: Any, value: Any, path: str) -> Any:
+    """JSON `value` as a replacement for `template`, or ValueError if the shape differs."""
+    if isinstance(template, re.Pattern):
+        if isinstance(value, str):
+            source, flags = value, template.flags
+        elif isinstance(value, dict) and isinstance(value.get("regex"), str):
+            source, flags = value["regex"], _flag_bits(value.get("flags", ()), path)
+        else:
+            raise ValueError(f"{path}: expected a regex string or {{\"regex\": ..., \"flags\": [...]}}")
+        try:
+            return _compile(source, flags)
+        except re.error as exc:
+            raise ValueError(f"{path}: invalid regex: {exc}") from None
+    if isinstance(template, dict):
+        if not isinstance(value, dict):
+            raise ValueError(f"{path}: expected an object")
+        missing = [key for key in template if key not in value]
+        if missing:
+            raise ValueError(f"{path}: missing keys {missing}")
+        sample = next(iter(template.values()), None)
+        return {key: _convert(template.get(key, sample), item, f"{path}.{key}") for key, item in value.items()}
+    if isinstance(template, (list, tuple)):
+        if not isinstance(value, list):
+            raise ValueError(f"{path}: expected a list")
+        sample = next(iter(template), "")
+        items = [_convert(sample, item, f"{path}[{index}]") for index, item in enumerate(value)]
+        return type(template)(items)
+    if isinstance(template, str):
+        if not isinstance(value, str) or not value:
+            raise ValueError(f"{path}: expected a non-empty string")
+        return value
+    if isinstance(template, bool) or not isinstance(template, (int, float)):
+        raise ValueError(f"{path}: attribute cannot be overridden")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{path}: expected a number")
+    if isinstance(template, int) and not isinstance(value, int):
+        raise ValueError(f"{path}: expected an integer")
+    return value
+
+
+def _to_json(value: Any) -> Any:
+    """Normalized JSON form of a converted override (regex flags as ints)."""
+    if isinstance(value, re.Pattern):
+        return {"regex": value.pattern, "flags": int(value.flags)}
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    return value
+
+
+def validate(patterns: Dict[str, Any]) -> Dict[Tuple[str, str], Any]:
+    """Converted overrides by (owner, attribute); ValueError on the first bad entry."""
+    owners = _builtin()["owners"]
+    overrides: Dict[Tuple[str, str], Any] = {}
+    for key, value in patterns.items():
+        owner_name, _, attribute = key.partition(".")
+        owner = owners.get(owner_name)
+        if owner is None:
+            raise ValueError(f"{key}: unknown class {owner_name!r}")
+        template = class_attributes(owner).get(attribute)
+        if not attribute.isupper() or template is None:
+            raise ValueError(f"{key}: {owner_name} has no pattern attribute {attribute!r}")
+        overrides[(owner_name, attribute)] = _convert(template, value, key)
+    return overrides
+
+
+def pack_hash(data: Dict[str, Any]) -> str:
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# SECTION 3: PACKS
+# =============================================================================
+
+# Packs loaded in this process, by pack hash
+_packs: Dict[str, "PatternPack"] = {}
+
+
+class PatternPack:
+    """One validated vocabulary: pattern and detector subclasses plus a shared scan plan."""
+
+    def __init__(self, name: str, digest: str, overrides: Dict[Tuple[str, str], Any]):
+        self.name = name
+        self.digest = digest
+        self.overrides = overrides
+        builtin = _builtin()
+
+        changed: Dict[str, Dict[str, Any]] = {}
+        for (owner_name, attribute), value in overrides.items():
+            changed.setdefault(owner_name, {})[attribute] = value
+
+        # Pattern classes: a subclass holding only the overridden attributes
+        self.holders: Dict[type, type] = {}
+        for base in PATTERN_CLASSES:
+            attributes = changed.get(base.__name__)
+            self.holders[base] = self._subclass(base, attributes) if attributes else base
+
+        # Detectors: subclassed when their pattern class or their constants change
+        self.detector_types: Dict[type, type] = {}
+        for base in builtin["detector_types"]:
+            attributes = dict(changed.get(base.__name__, {}))
+            holder = getattr(base, "patterns", None)
+            if holder in self.holders and self.holders[holder] is not holder:
+                attributes["patterns"] = self.holders[holder]
+            self.detector_types[base] = self._subclass(base, attributes) if attributes else base
+        self._plan: Optional[ScanPlan] = None
+
+    def _subclass(self, base: type, attributes: Dict[str, Any]) -> type:
+        # Same name as the base, so snapshots and registry owners line up across packs
+        cls = type(base.__name__, (base,), dict(attributes, pack_name=self.name))
+        cls.__qualname__ = base.__qualname__
+        return cls
+
+    @property
+    def version(self) -> str:
+        return self.digest[:16]
+
+    # ----- loading -----
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], cache_dir: Optional[str] = None) -> "PatternPack":
+        if not isinstance(data, dict) or not isinstance(data.get("patterns", {}), dict):
+            raise ValueError('A pattern pack is an object with a "patterns" object')
+        digest = pack_hash(data)
+        pack = _packs.get(digest)
+        if pack is not None:
+            return pack
+        name = str(data.get("name") or digest[:16])
+        overrides = _read_cache(cache_dir, digest) if cache_dir else None
+        if overrides is None:
+            overrides = validate(data.get("patterns", {}))
+            if cache_dir:
+                _write_cache(cache_dir, digest, name, overrides)
+        pack = _packs[digest] = cls(name, digest, overrides)
+        return pack
+
+    @classmethod
+    def load(cls, path: str, cache_dir: Optional[str] = None) -> "PatternPack":
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle), cache_dir)
+
+    # ----- use -----
+
+    def _swap(self, auditor: Any) -> None:
+        for group in DETECTOR_GROUPS:
+            detectors = getattr(auditor, group, None)
+            if not detectors:
+                continue
+            for category, detector in detectors.items():
+                base = next((t for t in type(detector).__mro__ if t in self.detector_types), None)
+                if base is not None and type(detector) is not self.detector_types[base]:
+                    detectors[category] = self.detector_types[base]()
+        auditor.pattern_pack = self
+
+    def apply(self, auditor: Any) -> Any:
+        """
+        Switch a UnifiedPersuasionAuditor, IntegrityPatternAuditor or
+        CombinedAuditor to this pack's vocabulary, in place; returns it.
+        """
+        from COMBINED_AUDITOR import CombinedAuditor
+        if isinstance(auditor, CombinedAuditor):
+            self._swap(auditor.persuasion)
+            self._swap(auditor.integrity)
+            if self._plan is None:
+                self._plan = ScanPlan.record(auditor._run)
+            auditor.plan = self._plan
+        self._swap(auditor)
+        return auditor
+
+    def owners(self) -> List[type]:
+        """Pattern and detector classes of this pack, as PatternSnapshot.capture() takes them."""
+        return list(self.holders.values()) + list(self.detector_types.values())
+
+    def snapshot(self) -> PatternSnapshot:
+        return PatternSnapshot.capture(self.owners())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The pack in normalized form (regex flags as ints)."""
+        return {
+            "name": self.name,
+            "patterns": {f"{owner}.{attribute}": _to_json(value)
+                         for (owner, attribute), value in self.overrides.items()},
+        }
+
+
+def loaded_packs() -> List[PatternPack]:
+    return list(_packs.values())
+
+
+# =============================================================================
+# SECTION 4: DISK CACHE
+# =============================================================================
+
+def _cache_path(cache_dir: str, digest: str) -> str:
+    return os.path.join(cache_dir, f"{digest}.json")
+
+
+def _read_cache(cache_dir: str, digest: str) -> Optional[Dict[Tuple[str, str], Any]]:
+    """The cached overlay, or None when missing, unreadable or built against other patterns."""
+    try:
+        with open(_cache_path(cache_dir, digest), encoding="utf-8") as handle:
+            cached = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if (cached.get("format") != CACHE_FORMAT or cached.get("digest") != digest
+            or cached.get("base_version") != _builtin()["version"]):
+        return None
+    owners = _builtin()["owners"]
+    overrides = {}
+    for key, value in cached["patterns"].items():
+        owner_name, _, attribute = key.partition(".")
+        overrides[(owner_name, attribute)] = _restore(class_attributes(owners[owner_name])[attribute], value)
+    return overrides
+
+
+def _restore(template: Any, value: Any) -> Any:
+    """A cached, already validated override back in attribute form."""
+    if isinstance(template, re.Pattern):
+        return _compile(value["regex"], value["flags"])
+    if isinstance(template, dict):
+        sample = next(iter(template.values()), None)
+        return {key: _restore(template.get(key, sample), item) for key, item in value.items()}
+    if isinstance(template, (list, tuple)):
+        sample = next(iter(template), "")
+        return type(template)(_restore(sample, item) for item in value)
+    return value
+
+
+def _write_cache(cache_dir: str, digest: str, name: str, overrides: Dict[Tuple[str, str], Any]) -> None:
+    os.makedirs(cache_dir, exist_ok=True)
+    cached = {
+        "format": CACHE_FORMAT,
+        "digest": digest,
+        "base_version": _builtin()["version"],
+        "name": name,
+        "patterns": {f"{owner}.{attribute}": _to_json(value) for (owner, attribute), value in overrides.items()},
+    }
+    # Write then rename, so concurrent loaders never read a partial file
+    handle, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(handle, "w", encoding="utf-8") as output:
+        json.dump(cached, output, ensure_ascii=False)
+    os.replace(temp_path, _cache_path(cache_dir, digest))
+
+
+# =============================================================================
+# SECTION 5: HOT RELOAD
+# =============================================================================
+
+class PackWatcher:
+    """Load each new version of a pack file in the background and publish it atomically."""
+
+    def __init__(self, path: str, cache_dir: Optional[str] = None,
+                 interval: float = DEFAULT_RELOAD_INTERVAL,
+                 prepare: Optional[Callable[[PatternPack], Any]] = None):
+        self.path = path
+        self.cache_dir = cache_dir
+        self.interval = interval
+        self.prepare = prepare
+        # (pack, prepared) of the newest good version; replaced as a whole
+        self.current: Optional[Tuple[PatternPack, Any]] = None
+        self.error: Optional[str] = None
+        self.reloads = 0
+        self._signature: Optional[Tuple[int, int]] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pack(self) -> Optional[PatternPack]:
+        current = self.current
+        return current[0] if current is not None else None
+
+    def poll(self) -> bool:
+        """Load the file if it changed since the last poll; True if a new version was published."""
+        try:
+            stat = os.stat(self.path)
+        except OSError as exc:
+            self.error = str(exc)
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            pack = PatternPack.load(self.path, self.cache_dir)
+            if self.current is not None and pack is self.current[0]:
+                return False
+            prepared = self.prepare(pack) if self.prepare is not None else pack
+        except Exception as exc:
+            # Keep serving the previous version, whatever went wrong with this one
+            self.error = f"{self.path}: {exc}"
+            return False
+        self.error = None
+        self.current = (pack, prepared)
+        self.reloads += 1
+        return True
+
+    def start(self) -> "PackWatcher":
+        """Load the current version, then keep polling on a daemon thread."""
+        self.poll()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="pack-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as exc:
+                # One bad publish must not stop later reloads
+                self.error = f"{self.path}: {exc}"
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,291 @@
+"""
+PATTERN PROFILE
+===============
+Per-pattern hit counts and scan cost over a sample corpus, dead and
+expensive pattern reports, and profile-guided scan prefilters.
+
+PatternProfiler runs every registered term (see PATTERN_REGISTRY.py) over
+each sample document and records how many documents it hit, how many
+matches it produced and how long its scan took. The resulting PatternProfile
+is saved as JSON alongside the pattern-set version it was taken against.
+
+The profile drives scan prefilters: for each regex that rarely fires, the
+literals one of which must appear in any match are extracted from the
+compiled pattern, and ScanContext skips the scan outright when none of them
+is in the document. The test is a necessary condition, so results are
+unchanged; only the cost of scans that could not have matched is saved.
+
+Usage:
+    profiler = PatternProfiler()
+    for doc_id, text in load_corpus("sample.jsonl"):
+        profiler.observe(text)
+    profile = profiler.profile()
+    profile.save("pattern_profile.json")
+    print(json.dumps(profile.report(), indent=2))
+    profile.apply()          # install prefilters for this process
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import re
+import json
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple, Pattern, Set
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_REGISTRY import PatternRegistry, TERM_REGEX, TERM_KEYWORD_LIST
+    from PATTERN_VERSION import PatternSnapshot
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_REGISTRY import PatternRegistry, TERM_REGEX, TERM_KEYWORD_LIST
+    from PATTERN_VERSION import PatternSnapshot
+
+# Prefilters are only installed for regexes hitting at most this share of documents
+DEFAULT_MAX_HIT_RATE = 0.5
+# Shortest required literal worth testing
+MIN_LITERAL_LENGTH = 2
+# A regex is "expensive" when its mean scan cost is this multiple of the median
+EXPENSIVE_FACTOR = 5.0
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+            getattr(sre_constants, "POSSESSIVE_REPEAT", sre_constants.MAX_REPEAT))
+
+
+# =============================================================================
+# SECTION 1: REQUIRED LITERALS
+# =============================================================================
+
+def _strength(literals: Set[str]) -> Tuple[int, int]:
+    return min(len(lit) for lit in literals), -len(literals)
+
+
+def _required(items: Any, state: Dict[str, bool]) -> Optional[Set[str]]:
+    """A set of lowercase literals, one of which every match of `items` contains."""
+    best: Optional[Set[str]] = None
+    run: List[str] = []
+
+    def consider(candidates: Optional[Set[str]]) -> None:
+        nonlocal best
+        if candidates and (best is None or _strength(candidates) > _strength(best)):
+            best = candidates
+
+    for op, value in items:
+        if op is sre_constants.LITERAL and value < 128:
+            run.append(chr(value).lower())
+            continue
+        consider({"".join(run)} if run else None)
+        run = []
+        if op is sre_constants.SUBPATTERN:
+            if value[1] & sre_constants.SRE_FLAG_IGNORECASE:
+                state["folds_case"] = True
+            consider(_required(value[-1], state))
+        elif op is sre_constants.BRANCH:
+            alternatives = [_required(branch, state) for branch in value[1]]
+            if all(alternatives):
+                consider(set().union(*alternatives))
+        elif op in _REPEATS and value[0] >= 1:
+            consider(_required(value[2], state))
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            consider(_required(value, state))
+    consider({"".join(run)} if run else None)
+    return best
+
+
+def required_literals(pattern: Pattern) -> Optional[Tuple[Tuple[str, ...], bool]]:
+    """
+    (literals, folds_case) such that any match contains one of the literals
+    when lowercased, or None if no useful set exists.
+    """
+    state = {"folds_case": bool(pattern.flags & re.IGNORECASE)}
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except (re.error, TypeError):
+        return None
+    literals = _required(parsed, state)
+    if not literals or min(len(lit) for lit in literals) < MIN_LITERAL_LENGTH:
+        return None
+    return tuple(sorted(literals)), state["folds_case"]
+
+
+# =============================================================================
+# SECTION 2: PROFILE
+# =============================================================================
+
+@dataclass
+class TermStats:
+    """Sample-corpus statistics for one term."""
+    kind: str
+    documents_hit: int = 0
+    matches: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class PatternProfile:
+    """Hit counts and scan costs per term over a sample corpus."""
+    pattern_version: str
+    documents: int
+    terms: Dict[str, TermStats]
+
+    def hit_rate(self, term_id: str) -> float:
+        stats = self.terms.get(term_id)
+        return stats.documents_hit / self.documents if stats and self.documents else 0.0
+
+    def dead(self) -> List[str]:
+        """Regexes and keyword lists that never fired on the sample."""
+        return sorted(term_id for term_id, stats in self.terms.items()
+                      if stats.kind in (TERM_REGEX, TERM_KEYWORD_LIST) and not stats.documents_hit)
+
+    def expensive(self, factor: float = EXPENSIVE_FACTOR) -> List[Tuple[str, float]]:
+        """Regexes whose mean cost per document is `factor` times the median, costliest first."""
+        costs = sorted((stats.seconds / max(self.documents, 1), term_id)
+                       for term_id, stats in self.terms.items() if stats.kind == TERM_REGEX)
+        if not costs:
+            return []
+        median = costs[len(costs) // 2][0]
+        return [(term_id, cost) for cost, term_id in reversed(costs) if cost > median * factor]
+
+    def report(self, factor: float = EXPENSIVE_FACTOR) -> Dict[str, Any]:
+        regex_seconds = sum(stats.seconds for stats in self.terms.values() if stats.kind == TERM_REGEX)
+        return {
+            "pattern_version": self.pattern_version,
+            "documents": self.documents,
+            "dead": self.dead(),
+            "expensive": [
+                {"term": term_id,
+                 "microseconds_per_document": round(cost * 1e6, 2),
+                 "share_of_regex_time": round(self.terms[term_id].seconds / regex_seconds, 4) if regex_seconds else 0.0,
+                 "hit_rate": round(self.hit_rate(term_id), 4)}
+                for term_id, cost in self.expensive(factor)
+            ],
+            "hot": sorted((term_id for term_id, stats in self.terms.items()
+                           if stats.kind != TERM_REGEX and self.hit_rate(term_id) >= 0.5),
+                          key=lambda term_id: -self.hit_rate(term_id)),
+        }
+
+    def prefilters(self, registry: Optional[PatternRegistry] = None,
+                   max_hit_rate: float = DEFAULT_MAX_HIT_RATE) -> Dict[Pattern, Tuple[Tuple[str, ...], bool]]:
+        """Prefilters for regexes that fire on at most `max_hit_rate` of the sample."""
+        registry = registry or PatternRegistry.default()
+        table = {}
+        for term_id, term in registry.terms.items():
+            if term.kind != TERM_REGEX or term_id not in self.terms:
+                continue
+            if self.hit_rate(term_id) > max_hit_rate:
+                continue
+            prefilter = required_literals(term.pattern)
+            if prefilter is not None:
+                table[term.pattern] = prefilter
+        return table
+
+    def apply(self, registry: Optional[PatternRegistry] = None,
+              max_hit_rate: float = DEFAULT_MAX_HIT_RATE) -> int:
+        """Install this profile's prefilters on ScanContext; returns how many."""
+        table = self.prefilters(registry, max_hit_rate)
+        ScanContext.prefilters = table
+        return len(table)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "pattern_version": self.pattern_version,
+            "documents": self.documents,
+            "terms": {term_id: asdict(stats) for term_id, stats in self.terms.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PatternProfile":
+        return cls(data["pattern_version"], data["documents"],
+                   {term_id: TermStats(**stats) for term_id, stats in data["terms"].items()})
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle, indent=2, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "PatternProfile":
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
+
+
+def clear_prefilters() -> None:
+    ScanContext.prefilters = {}
+
+
+# =============================================================================
+# SECTION 3: PROFILER
+# =============================================================================
+
+class PatternProfiler:
+    """Accumulates per-term hits and regex scan time over sample documents."""
+
+    def __init__(self, registry: Optional[PatternRegistry] = None):
+        self.registry = registry or PatternRegistry.default()
+        self.documents = 0
+        self.stats: Dict[str, TermStats] = {
+            term_id: TermStats(term.kind) for term_id, term in self.registry.terms.items()
+        }
+
+    def observe(self, text: str) -> None:
+        self.documents += 1
+        ctx = ScanContext(text)
+        clock = time.perf_counter
+        for term_id, term in self.registry.terms.items():
+            stats = self.stats[term_id]
+            if term.kind == TERM_REGEX:
+                subject = ctx.lower if term.lower else text
+                started = clock()
+                found = term.pattern.findall(subject)
+                stats.seconds += clock() - started
+                if found:
+                    stats.documents_hit += 1
+                    stats.matches += len(found)
+            elif term.hit(ctx):
+                stats.documents_hit += 1
+                stats.matches += 1
+
+    def profile(self) -> PatternProfile:
+        return PatternProfile(PatternSnapshot.capture().version, self.documents,
+                              {term_id: TermStats(**asdict(stats)) for term_id, stats in self.stats.items()})
+
+
+def main():
+    import argparse
+    try:
+        from AUDIT_COORDINATOR import load_corpus
+    except ImportError:
+        import sys
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        from AUDIT_COORDINATOR import load_corpus
+
+    parser = argparse.ArgumentParser(description="Profile detector patterns over a sample corpus")
+    parser.add_argument("corpus", help="JSONL corpus of {\"id\", \"text\"} records")
+    parser.add_argument("output", help="Where to write the profile")
+    parser.add_argument("--limit", type=int, default=None, help="Profile at most this many documents")
+    args = parser.parse_args()
+
+    profiler = PatternProfiler()
+    for position, (_, text) in enumerate(load_corpus(args.corpus)):
+        if args.limit is not None and position >= args.limit:
+            break
+        profiler.observe(text)
+    profile = profiler.profile()
+    profile.save(args.output)
+    print(json.dumps(profile.report(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
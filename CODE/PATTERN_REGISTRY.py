@@ -0,0 +1,239 @@
+"""
+PATTERN REGISTRY
+================
+Stable names for every regex and keyword the detectors probe.
+
+The registry records which probes each detector makes (by running it once
+against an empty ScanContext) and names them after the attributes that hold
+them: regexes by attribute ("SCARCITY_DESTRUCTION", "PASSIVE_PATTERNS[1]"),
+keyword lists by attribute ("AUTHORITY_CREDENTIALS",
+"EMOTIONAL_PAIN_KEYWORDS.status") and single keywords as
+"<list>:<keyword>" ("EMOTIONAL_PAIN_KEYWORDS.status:falling behind").
+Regexes a detector runs over part of the text (MemorableDetector's opening
+and closing thirds) are region terms. Each term knows the detectors that
+use it and can test itself against a ScanContext, reusing whatever the
+audit already memoized; observed() reads only the probes the audit made.
+
+Usage:
+    registry = PatternRegistry.default()
+    term = registry.terms["ARTIFICIAL_CONSENSUS"]
+    term.detectors          # ["integrity/SYNTHETIC_AUTHORITY"]
+    term.hit(ctx)           # True if the pattern matched the audited text
+    term.observed(ctx)      # the same, or None if the audit never probed it
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple, Pattern, Iterator
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext
+    from UNIFIED_AUDITOR import Patterns, UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatterns, IntegrityPatternAuditor
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext
+    from UNIFIED_AUDITOR import Patterns, UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatterns, IntegrityPatternAuditor
+
+PATTERN_CLASSES = (Patterns, IntegrityPatterns)
+# Auditor attributes holding {category: detector}
+DETECTOR_GROUPS = ("tactical_detectors", "psychological_detectors", "linguistic_detectors", "detectors")
+
+TERM_REGEX = "regex"
+TERM_KEYWORD_LIST = "keyword_list"
+TERM_KEYWORD = "keyword"
+TERM_REGION = "region"
+
+
+# =============================================================================
+# SECTION 1: TERMS
+# =============================================================================
+
+@dataclass
+class PatternTerm:
+    """One named regex, keyword list or keyword."""
+    term_id: str
+    kind: str
+    owner: str
+    attribute: str
+    pattern: Optional[Pattern] = None
+    lower: bool = False
+    keywords: Tuple[str, ...] = ()
+    detectors: List[str] = field(default_factory=list)
+
+    def hit(self, ctx: ScanContext) -> bool:
+        if self.kind == TERM_REGEX:
+            return bool(ctx.findall(self.pattern, self.lower))
+        if self.kind == TERM_REGION:
+            # Without the detector's own split, search the whole text
+            seen = self.observed(ctx)
+            return seen if seen is not None else bool(ctx.backend.findall(self.pattern, ctx.text))
+        return any(ctx.contains(kw) for kw in self.keywords)
+
+    def observed(self, ctx: ScanContext) -> Optional[bool]:
+        """hit() from the probes already memoized in ctx, or None if they were not all made."""
+        if self.kind == TERM_REGEX:
+            hits = ctx._regex_hits.get((self.pattern, self.lower))
+            return None if hits is None else bool(hits)
+        if self.kind == TERM_REGION:
+            found = [hits for (pattern, _), hits in ctx._region_hits.items() if pattern is self.pattern]
+            return any(found) if found else None
+        known = [ctx._keyword_hits.get(kw) for kw in self.keywords]
+        if any(known):
+            return True
+        return None if None in known else False
+
+
+def iter_detectors(framework: str, auditor: Any) -> Iterator[Tuple[str, Any]]:
+    """("persuasion/SCARCITY", detector) pairs for either auditor."""
+    for group in DETECTOR_GROUPS:
+        for category, detector in getattr(auditor, group, {}).items():
+            yield f"{framework}/{category}", detector
+
+
+def class_attributes(owner: type) -> Dict[str, Any]:
+    """Upper-case attributes of a class, inherited ones included (pattern packs subclass)."""
+    attributes: Dict[str, Any] = {}
+    for klass in reversed(owner.__mro__):
+        attributes.update((name, value) for name, value in vars(klass).items() if name.isupper())
+    return attributes
+
+
+def pattern_owners(auditors: Dict[str, Any]) -> List[type]:
+    """Pattern classes the auditors' detectors read, then the detector classes."""
+    holders: List[type] = []
+    detector_types: List[type] = []
+    for framework, auditor in auditors.items():
+        for _, detector in iter_detectors(framework, auditor):
+            holder = getattr(detector, "patterns", None)
+            if holder is not None and holder not in holders:
+                holders.append(holder)
+            if type(detector) not in detector_types:
+                detector_types.append(type(detector))
+    holders.extend(cls for cls in PATTERN_CLASSES if not any(issubclass(h, cls) for h in holders))
+    return holders + detector_types
+
+
+def _walk(owner: type) -> Iterator[Tuple[str, Any]]:
+    """(attribute path, value) for every regex and keyword list on a class."""
+    def visit(path: str, value: Any) -> Iterator[Tuple[str, Any]]:
+        if isinstance(value, re.Pattern):
+            yield path, value
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                yield from visit(f"{path}.{key}", item)
+        elif isinstance(value, (list, tuple)) and value:
+            if all(isinstance(item, str) for item in value):
+                yield path, tuple(value)
+            else:
+                for index, item in enumerate(value):
+                    if isinstance(item, re.Pattern):
+                        yield f"{path}[{index}]", item
+
+    for attribute, value in class_attributes(owner).items():
+        yield from visit(attribute, value)
+
+
+# =============================================================================
+# SECTION 2: REGISTRY
+# =============================================================================
+
+class PatternRegistry:
+    """Named terms for every probe made by the given auditors' detectors."""
+
+    def __init__(self, auditors: Dict[str, Any]):
+        self.terms: Dict[str, PatternTerm] = {}
+        self.detectors: Dict[str, List[str]] = {}
+        self._names: Dict[Any, Tuple[str, str]] = {}
+        self._lists: Dict[Tuple[str, ...], Tuple[str, str]] = {}
+
+        for owner in pattern_owners(auditors):
+            for path, value in _walk(owner):
+                if isinstance(value, re.Pattern):
+                    self._names.setdefault(value, (owner.__name__, path))
+                else:
+                    self._lists.setdefault(value, (owner.__name__, path))
+
+        for framework, auditor in auditors.items():
+            for detector_name, detector in iter_detectors(framework, auditor):
+                self.detectors[detector_name] = self._record(detector_name, detector)
+
+    @classmethod
+    def default(cls) -> "PatternRegistry":
+        return cls({"persuasion": UnifiedPersuasionAuditor(), "integrity": IntegrityPatternAuditor()})
+
+    def _term(self, term_id: str, detector_name: str, **kwargs) -> PatternTerm:
+        term = self.terms.get(term_id)
+        if term is None:
+            term = PatternTerm(term_id=term_id, **kwargs)
+            self.terms[term_id] = term
+        if detector_name not in term.detectors:
+            term.detectors.append(detector_name)
+        return term
+
+    def _add_list(self, detector_name: str, keywords: Tuple[str, ...], owner: str, path: str) -> List[str]:
+        ids = [self._term(path, detector_name, kind=TERM_KEYWORD_LIST, owner=owner,
+                          attribute=path, keywords=keywords).term_id]
+        for kw in keywords:
+            ids.append(self._term(f"{path}:{kw}", detector_name, kind=TERM_KEYWORD, owner=owner,
+                                  attribute=path, keywords=(kw,)).term_id)
+        return ids
+
+    def _record(self, detector_name: str, detector: Any) -> List[str]:
+        ctx = ScanContext("")
+        detector.detect("", ctx)
+        ids: List[str] = []
+
+        for pattern, lower in ctx._regex_hits:
+            owner, path = self._names.get(pattern, (type(detector).__name__, pattern.pattern[:40]))
+            ids.append(self._term(path, detector_name, kind=TERM_REGEX, owner=owner,
+                                  attribute=path, pattern=pattern, lower=lower).term_id)
+        for pattern in dict.fromkeys(pattern for pattern, _ in ctx._region_hits):
+            owner, path = self._names.get(pattern, (type(detector).__name__, pattern.pattern[:40]))
+            ids.append(self._term(path, detector_name, kind=TERM_REGION, owner=owner,
+                                  attribute=path, pattern=pattern).term_id)
+
+        covered = set()
+        for keywords in ctx._list_hits:
+            owner, path = self._lists.get(keywords, (type(detector).__name__, detector_name))
+            ids.extend(self._add_list(detector_name, keywords, owner, path))
+            covered.update(keywords)
+
+        # Keywords probed one at a time (e.g. the contrastable pairs)
+        probed = set(ctx._keyword_hits)
+        for keywords, (owner, path) in self._lists.items():
+            if not covered.issuperset(keywords) and probed.issuperset(keywords):
+                ids.extend(self._add_list(detector_name, keywords, owner, path))
+                covered.update(keywords)
+        for kw in ctx._keyword_hits:
+            if kw in covered:
+                continue
+            owner, path = next(
+                (name for keywords, name in self._lists.items()
+                 if kw in keywords and name[0] == type(detector).__name__),
+                (type(detector).__name__, detector_name)
+            )
+            ids.append(self._term(f"{path}:{kw}", detector_name, kind=TERM_KEYWORD, owner=owner,
+                                  attribute=path, keywords=(kw,)).term_id)
+        return ids
+
+    def resolve(self, name: str) -> List[str]:
+        """
+        Term ids for a query name: a term id, or "<framework>/<CATEGORY>/<term>"
+        restricted to one detector.
+        """
+        if name in self.terms:
+            return [name]
+        if name.count("/") == 2:
+            detector_name, term_id = name.rsplit("/", 1)
+            if term_id in self.detectors.get(detector_name, ()):
+                return [term_id]
+        raise KeyError(f"Unknown pattern term: {name}")
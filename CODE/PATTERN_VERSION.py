@@ -0,0 +1,281 @@
+"""
+PATTERN VERSION
+===============
+Content-derived pattern-set versions, per-pattern diffs and targeted re-audit.
+
+A PatternSnapshot fingerprints every regex and keyword list on Patterns,
+IntegrityPatterns and the detector classes, plus the detectors' scoring
+constants. Its version is a hash of that content. Diffing two snapshots gives
+the changed attributes down to individual keywords.
+
+ReauditPlanner turns a diff into the set of documents whose results can
+change:
+    - documents that hit a removed or changed pattern under the old set
+      (read from a PatternIndex when available, otherwise scanned);
+    - documents that hit an added keyword or a changed regex under the new
+      set (a scan of only those probes, not a full audit);
+    - every document when a scoring constant changed.
+Everything else is guaranteed to audit identically and is skipped.
+
+Usage:
+    before = PatternSnapshot.load("patterns-2026-10-12.json")
+    after = PatternSnapshot.capture()
+    change = diff_snapshots(before, after)
+    planner = ReauditPlanner(index)
+    for doc_id, report in planner.reaudit(change, lambda: load_corpus("archive.jsonl"), auditor):
+        store.add(doc_id, report)
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import re
+import json
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator, Set, Callable, Union
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_REGISTRY import pattern_owners, class_attributes, _walk
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_REGISTRY import pattern_owners, class_attributes, _walk
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor
+
+
+def _default_owners() -> List[type]:
+    return pattern_owners({"persuasion": UnifiedPersuasionAuditor(), "integrity": IntegrityPatternAuditor()})
+
+
+def _is_constant(value: Any) -> bool:
+    """Scoring constants: numbers and (nested) dicts of numbers."""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    if isinstance(value, dict) and value:
+        return all(isinstance(v, (int, float)) or _is_constant(v) for v in value.values())
+    return False
+
+
+# =============================================================================
+# SECTION 1: SNAPSHOTS
+# =============================================================================
+
+@dataclass
+class PatternSnapshot:
+    """Fingerprint of a pattern set: regexes, keyword lists and scoring constants."""
+    regexes: Dict[str, Tuple[str, int]]
+    keyword_lists: Dict[str, List[str]]
+    constants: Dict[str, str]
+
+    @classmethod
+    def capture(cls, owners: Optional[List[type]] = None) -> "PatternSnapshot":
+        regexes, keyword_lists, constants = {}, {}, {}
+        for owner in owners or _default_owners():
+            for path, value in _walk(owner):
+                if isinstance(value, re.Pattern):
+                    regexes.setdefault(path, (value.pattern, value.flags))
+                else:
+                    keyword_lists.setdefault(path, list(value))
+            for attribute, value in class_attributes(owner).items():
+                if _is_constant(value):
+                    constants[f"{owner.__name__}.{attribute}"] = json.dumps(value, sort_keys=True)
+        return cls(regexes, keyword_lists, constants)
+
+    @property
+    def version(self) -> str:
+        payload = json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "regexes": {path: list(value) for path, value in self.regexes.items()},
+            "keyword_lists": self.keyword_lists,
+            "constants": self.constants,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PatternSnapshot":
+        return cls(
+            {path: (value[0], value[1]) for path, value in data["regexes"].items()},
+            data["keyword_lists"],
+            data["constants"],
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(dict(self.to_dict(), version=self.version), handle, indent=2, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "PatternSnapshot":
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
+
+
+# =============================================================================
+# SECTION 2: DIFF
+# =============================================================================
+
+@dataclass
+class PatternDiff:
+    """Per-pattern differences between two snapshots."""
+    old_version: str
+    new_version: str
+    regex_changes: Dict[str, Tuple[Optional[Tuple[str, int]], Optional[Tuple[str, int]]]] = field(default_factory=dict)
+    keywords_added: Dict[str, List[str]] = field(default_factory=dict)
+    keywords_removed: Dict[str, List[str]] = field(default_factory=dict)
+    reordered: Dict[str, List[str]] = field(default_factory=dict)
+    constants_changed: List[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.regex_changes or self.keywords_added or self.keywords_removed
+                    or self.reordered or self.constants_changed)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "old_version": self.old_version,
+            "new_version": self.new_version,
+            "regexes_changed": sorted(self.regex_changes),
+            "keywords_added": {path: kws for path, kws in self.keywords_added.items()},
+            "keywords_removed": {path: kws for path, kws in self.keywords_removed.items()},
+            "lists_reordered": sorted(self.reordered),
+            "constants_changed": self.constants_changed,
+        }
+
+
+def diff_snapshots(old: PatternSnapshot, new: PatternSnapshot) -> PatternDiff:
+    result = PatternDiff(old.version, new.version)
+
+    for path in sorted(set(old.regexes) | set(new.regexes)):
+        before, after = old.regexes.get(path), new.regexes.get(path)
+        if before != after:
+            result.regex_changes[path] = (before, after)
+
+    for path in sorted(set(old.keyword_lists) | set(new.keyword_lists)):
+        before, after = old.keyword_lists.get(path, []), new.keyword_lists.get(path, [])
+        if before == after:
+            continue
+        added = [kw for kw in after if kw not in before]
+        removed = [kw for kw in before if kw not in after]
+        if added:
+            result.keywords_added[path] = added
+        if removed:
+            result.keywords_removed[path] = removed
+        kept_before = [kw for kw in before if kw in after]
+        kept_after = [kw for kw in after if kw in before]
+        if kept_before != kept_after:
+            result.reordered[path] = kept_after
+
+    for key in sorted(set(old.constants) | set(new.constants)):
+        if old.constants.get(key) != new.constants.get(key):
+            result.constants_changed.append(key)
+    return result
+
+
+# =============================================================================
+# SECTION 3: TARGETED RE-AUDIT
+# =============================================================================
+
+Documents = Union[Iterable[Tuple[str, str]], Callable[[], Iterable[Tuple[str, str]]]]
+
+
+def _open(documents: Documents) -> Iterable[Tuple[str, str]]:
+    return documents() if callable(documents) else documents
+
+
+class ReauditPlanner:
+    """Minimal document sets for a pattern diff, using postings where available."""
+
+    def __init__(self, index: Any = None):
+        self.index = index
+
+    def _postings(self, term_id: str) -> Optional[Set[str]]:
+        if self.index is None:
+            return None
+        docs = self.index.term_documents(term_id)
+        return None if docs is None else set(docs)
+
+    def affected(self, change: PatternDiff, documents: Documents,
+                 normalize: bool = False) -> Set[str]:
+        """
+        Document ids whose audit results can differ under the new pattern set.
+
+        `documents` yields (doc_id, text) for the archive, or is a callable
+        that opens it; it is streamed, never held. Texts are only read when a
+        probe has to be evaluated (new keywords, changed regexes, or old hits
+        with no postings available). Pass the archive's normalize setting so
+        probes see the same text the detectors saw.
+        """
+        if change.constants_changed:
+            return {doc_id for doc_id, _ in _open(documents)}
+
+        affected: Set[str] = set()
+        keyword_probes: Set[str] = set()
+        regex_probes: List[re.Pattern] = []
+
+        # Old hits: from postings when indexed, otherwise re-probed below
+        for path, (before, after) in change.regex_changes.items():
+            docs = self._postings(path)
+            if docs is not None:
+                affected |= docs
+            elif before is not None:
+                regex_probes.append(re.compile(before[0], before[1]))
+            if after is not None:
+                regex_probes.append(re.compile(after[0], after[1]))
+
+        for path, keywords in change.keywords_removed.items():
+            for kw in keywords:
+                docs = self._postings(f"{path}:{kw}")
+                if docs is not None:
+                    affected |= docs
+                else:
+                    keyword_probes.add(kw)
+
+        for path, keywords in change.reordered.items():
+            docs = self._postings(path)
+            if docs is not None:
+                affected |= docs
+            else:
+                keyword_probes.update(keywords)
+
+        # New hits: only the added keywords and changed regexes are scanned
+        for keywords in change.keywords_added.values():
+            keyword_probes.update(keywords)
+
+        if keyword_probes or regex_probes:
+            for doc_id, text in _open(documents):
+                if doc_id in affected:
+                    continue
+                ctx = ScanContext.create(text, normalize)
+                if any(ctx.contains(kw) for kw in keyword_probes) or \
+                        any(p.search(ctx.text) or p.search(ctx.lower) for p in regex_probes):
+                    affected.add(doc_id)
+        return affected
+
+    def reaudit(self, change: PatternDiff, documents: Documents, auditor: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Audit only the affected documents; yields (doc_id, report).
+
+        The archive is read twice (plan, then audit), so `documents` must be a
+        callable that re-opens it or a re-iterable collection, not an iterator.
+        """
+        if not callable(documents) and iter(documents) is documents:
+            raise ValueError("reaudit reads the archive twice; pass a callable that re-opens it")
+        return self._reaudit(change, documents, auditor)
+
+    def _reaudit(self, change: PatternDiff, documents: Documents, auditor: Any) -> Iterator[Tuple[str, Any]]:
+        affected = self.affected(change, documents, getattr(auditor, "normalize", False))
+        for doc_id, text in _open(documents):
+            if doc_id in affected:
+                yield doc_id, auditor.audit(text)
@@ -0,0 +1,450 @@
+"""
+REGEX BACKEND
+=============
+Pluggable regex engine behind the detector patterns.
+
+Every detector scan goes through ScanContext, which hands the compiled
+`re` pattern and the subject text to the active backend. ReBackend (the
+default) calls pattern.findall() directly. Re2Backend runs the same pattern
+on a linear-time RE2 engine when the `re2` module is installed, bounding
+scan time on hostile input.
+
+RE2's \s, \d, \w and \b are ASCII-only, unlike `re` on str patterns. Each
+pattern is translated once so that RE2 gives the results `re` gives:
+    - \s and \S become explicit classes of every character `re` treats as
+      whitespace (including \x0b, \x1c-\x1f, \x85 and the Unicode spaces);
+      \d and \D become \p{Nd} and \P{Nd}.
+    - word patterns (\b, \B, \w, \W) run on a copy of the subject in which
+      every non-ASCII word character is replaced by "_", an ASCII word
+      character. The copy has the same length, so the matched text is cut
+      from the original subject at the same offsets.
+A pattern falls back to `re` only for subjects that would still differ:
+\d in a word pattern with non-ASCII digits in the subject, case-insensitive
+patterns with one of the four characters `re` folds onto ASCII letters
+(dotted and dotless i, long s, the Kelvin sign), and word patterns that spell out "_" or a non-ASCII word
+character themselves. Back-references, lookaround, atomic groups,
+possessive repeats, conditionals, verbose syntax and a bare `$` are
+always scanned with `re`.
+conformance() replays a reference corpus through both engines and disables
+RE2 for any pattern whose matches differ, so scores never change.
+
+Usage:
+    backend = Re2Backend()
+    report = conformance(backend, (text for _, text in load_corpus("reference.jsonl")))
+    set_backend(backend)
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Any, Iterable, Pattern, Tuple
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+PORTABLE = "portable"
+WORD = "word"
+UNSUPPORTED = "unsupported"
+
+_UNSUPPORTED_OPS = {
+    getattr(sre_constants, name) for name in
+    ("GROUPREF", "GROUPREF_EXISTS", "GROUPREF_IGNORE", "ASSERT", "ASSERT_NOT",
+     "ATOMIC_GROUP", "POSSESSIVE_REPEAT")
+    if hasattr(sre_constants, name)
+}
+_WORD_AT = {sre_constants.AT_BOUNDARY, sre_constants.AT_NON_BOUNDARY}
+_WORD_CATEGORIES = {sre_constants.CATEGORY_WORD, sre_constants.CATEGORY_NOT_WORD}
+_DIGIT_CATEGORIES = {sre_constants.CATEGORY_DIGIT, sre_constants.CATEGORY_NOT_DIGIT}
+
+# Subject features that can make RE2 differ from `re` after translation
+DIGITS = "digits"      # non-ASCII decimal digits (lost in the word mapping)
+FOLDS = "folds"        # characters `re` case-folds onto ASCII letters
+WORDS = "words"        # non-ASCII word characters (mapped to "_")
+
+_NON_ASCII_WORD = re.compile(r'[^\W\x00-\x7f]')
+_NON_ASCII_DIGIT = re.compile(r'[^\D\x00-\x7f]')
+_FOLD_SPECIAL = re.compile('[\u0130\u0131\u017f\u212a]')
+_WORD_STAND_IN = "_"
+
+
+def _space_class() -> str:
+    """Every character str.isspace() accepts (what `re` calls \\s), as RE2 class items."""
+    points = [point for point in range(0x3001) if chr(point).isspace()]
+    items, start = [], points[0]
+    for previous, point in zip(points, points[1:] + [None]):
+        if point != previous + 1:
+            items.append(f"\\x{{{start:x}}}" if start == previous else f"\\x{{{start:x}}}-\\x{{{previous:x}}}")
+            start = point
+    return "".join(items)
+
+
+_SPACE_ITEMS = _space_class()
+
+
+# =============================================================================
+# SECTION 1: PATTERN CLASSIFICATION
+# =============================================================================
+
+def analyze(pattern: Pattern) -> Tuple[str, frozenset]:
+    """
+    (verdict, subject features that send this pattern back to `re`): PORTABLE,
+    WORD or UNSUPPORTED for running `pattern` on RE2.
+    """
+    if pattern.flags & (re.VERBOSE | re.LOCALE) or isinstance(pattern.pattern, bytes):
+        return UNSUPPORTED, frozenset()
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except re.error:
+        return UNSUPPORTED, frozenset()
+
+    multiline = bool(pattern.flags & re.MULTILINE)
+    found = {"word": False, "digit": False, "unmappable": False}
+
+    def literal(code: int) -> None:
+        # "_" or a non-ASCII word character in the pattern cannot tell a real
+        # one from a mapped one
+        if code == ord(_WORD_STAND_IN) or (code > 0x7f and chr(code).isalnum()):
+            found["unmappable"] = True
+
+    def visit(items: Any) -> bool:
+        """True if anything below is unsupported."""
+        for op, value in items:
+            if op in _UNSUPPORTED_OPS:
+                return True
+            if op is sre_constants.AT:
+                if value is sre_constants.AT_END and not multiline:
+                    return True
+                if value in _WORD_AT:
+                    found["word"] = True
+            elif op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL):
+                literal(value)
+            elif op is sre_constants.IN:
+                for item_op, item in value:
+                    if item_op is sre_constants.CATEGORY:
+                        found["word"] |= item in _WORD_CATEGORIES
+                        found["digit"] |= item in _DIGIT_CATEGORIES
+                    elif item_op is sre_constants.LITERAL:
+                        literal(item)
+                    elif item_op is sre_constants.RANGE:
+                        low, high = item
+                        if low <= ord(_WORD_STAND_IN) <= high or high > 0x7f:
+                            found["unmappable"] = True
+            elif op is sre_constants.CATEGORY:
+                found["word"] |= value in _WORD_CATEGORIES
+                found["digit"] |= value in _DIGIT_CATEGORIES
+            elif op is sre_constants.SUBPATTERN:
+                if value[1] & (re.IGNORECASE | re.VERBOSE | re.MULTILINE) or value[2]:
+                    return True
+                if visit(value[-1]):
+                    return True
+            elif op is sre_constants.BRANCH:
+                if any(visit(branch) for branch in value[1]):
+                    return True
+            elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+                if visit(value[2]):
+                    return True
+        return False
+
+    if visit(parsed) or _re2_source(pattern) is None:
+        return UNSUPPORTED, frozenset()
+    needs = set()
+    if pattern.flags & re.IGNORECASE:
+        needs.add(FOLDS)
+    if not found["word"]:
+        return PORTABLE, frozenset(needs)
+    if found["digit"]:
+        needs.add(DIGITS)
+    if found["unmappable"]:
+        needs.add(WORDS)
+    return WORD, frozenset(needs)
+
+
+def classify(pattern: Pattern) -> str:
+    """PORTABLE, WORD or UNSUPPORTED for running `pattern` on RE2."""
+    return analyze(pattern)[0]
+
+
+def subject_features(subject: str) -> frozenset:
+    """DIGITS, FOLDS and WORDS present in `subject` (none for ASCII text)."""
+    if subject.isascii():
+        return frozenset()
+    features = set()
+    if _NON_ASCII_WORD.search(subject):
+        features.add(WORDS)
+        if _NON_ASCII_DIGIT.search(subject):
+            features.add(DIGITS)
+        if _FOLD_SPECIAL.search(subject):
+            features.add(FOLDS)
+    return frozenset(features)
+
+
+def _re2_source(pattern: Pattern) -> Optional[str]:
+    """
+    Pattern text for RE2: global flags written inline, \\s/\\S and \\d/\\D
+    spelled out with `re`'s Unicode meaning. None if it cannot be written.
+    """
+    source, out, index = pattern.pattern, [], 0
+    in_class, class_body = False, 0
+    while index < len(source):
+        char = source[index]
+        if char == "\\" and index + 1 < len(source):
+            escape = source[index + 1]
+            if escape in "sS":
+                if in_class:
+                    if escape == "S":
+                        return None
+                    out.append(_SPACE_ITEMS)
+                else:
+                    out.append(f"[{'^' if escape == 'S' else ''}{_SPACE_ITEMS}]")
+            elif escape in "dD":
+                out.append("\\p{Nd}" if escape == "d" else "\\P{Nd}")
+            else:
+                out.append(source[index:index + 2])
+            index += 2
+            continue
+        if in_class:
+            if char == "]" and index > class_body:
+                in_class = False
+        elif char == "[":
+            in_class = True
+            class_body = index + 1
+            if source[class_body:class_body + 1] == "^":
+                class_body += 1
+            out.append(source[index:class_body])
+            index = class_body
+            continue
+        out.append(char)
+        index += 1
+
+    flags = ""
+    if pattern.flags & re.IGNORECASE:
+        flags += "i"
+    if pattern.flags & re.MULTILINE:
+        flags += "m"
+    if pattern.flags & re.DOTALL:
+        flags += "s"
+    body = "".join(out)
+    return f"(?{flags}){body}" if flags else body
+
+
+def findall_item(match: Any) -> Any:
+    """What pattern.findall() returns for one match object."""
+    groups = match.re.groups
+    if groups == 0:
+        return match.group(0)
+    if groups == 1:
+        return match.group(1) or ''
+    return tuple(group or '' for group in match.groups())
+
+
+def _item_from(match: Any, groups: int, subject: str) -> Any:
+    """findall_item() cut from `subject` at the match's offsets."""
+    if groups == 0:
+        return subject[match.start():match.end()]
+    spans = [match.span(group) for group in range(1, groups + 1)]
+    items = [subject[start:end] if start >= 0 else '' for start, end in spans]
+    return items[0] if groups == 1 else tuple(items)
+
+
+# =============================================================================
+# SECTION 2: BACKENDS
+# =============================================================================
+
+class ReBackend:
+    """Python's backtracking `re` engine."""
+
+    name = "re"
+
+    def findall(self, pattern: Pattern, subject: str) -> List[Any]:
+        return pattern.findall(subject)
+
+    def locate(self, pattern: Pattern, subject: str) -> Tuple[List[Any], List[int]]:
+        """findall() results and the start offset of each match."""
+        items, starts = [], []
+        for match in pattern.finditer(subject):
+            items.append(findall_item(match))
+            starts.append(match.start())
+        return items, starts
+
+
+class Re2Backend(ReBackend):
+    """
+    Linear-time RE2 where it is known to agree with `re`, `re` elsewhere.
+
+    Raises ImportError if no `re2` module (google-re2 or pyre2) is installed.
+    """
+
+    name = "re2"
+
+    def __init__(self, module: Any = None):
+        if module is None:
+            import re2 as module
+        self.module = module
+        self._compiled: Dict[Pattern, Tuple[Optional[Any], str, frozenset]] = {}
+        self.disabled: Dict[Pattern, str] = {}
+        # Features and word-mapped copy of the last subject; detectors scan
+        # the same text and lowercased text many times in a row
+        self._subject: Tuple[Optional[str], frozenset, Optional[str]] = (None, frozenset(), None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Sent to worker processes without the module or compiled programs
+        return {"module": self.module.__name__, "disabled": self.disabled}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        import importlib
+        self.__init__(importlib.import_module(state["module"]))
+        for pattern, reason in state["disabled"].items():
+            self.disable(pattern, reason)
+
+    def _engine(self, pattern: Pattern) -> Tuple[Optional[Any], str, frozenset]:
+        entry = self._compiled.get(pattern)
+        if entry is None:
+            verdict, needs = analyze(pattern)
+            compiled = None
+            if verdict != UNSUPPORTED and pattern not in self.disabled:
+                try:
+                    compiled = self.module.compile(_re2_source(pattern))
+                except Exception:
+                    verdict = UNSUPPORTED
+            entry = self._compiled[pattern] = (compiled, verdict, needs)
+        return entry
+
+    def _features(self, subject: str) -> Tuple[frozenset, Optional[str]]:
+        cached = self._subject
+        if cached[0] is subject:
+            return cached[1], cached[2]
+        features = subject_features(subject)
+        mapped = _NON_ASCII_WORD.sub(_WORD_STAND_IN, subject) if WORDS in features else None
+        self._subject = (subject, features, mapped)
+        return features, mapped
+
+    def disable(self, pattern: Pattern, reason: str) -> None:
+        """Route a pattern back to `re` (e.g. after a conformance mismatch)."""
+        self.disabled[pattern] = reason
+        self._compiled[pattern] = (None, UNSUPPORTED, frozenset())
+
+    def _subject_for(self, pattern: Pattern, subject: str) -> Tuple[Optional[Any], Optional[str]]:
+        """(RE2 program, text to run it on), or (None, None) to use `re`."""
+        compiled, verdict, needs = self._engine(pattern)
+        if compiled is None:
+            return None, None
+        features, mapped = self._features(subject)
+        if needs & features:
+            return None, None
+        return compiled, mapped if verdict == WORD and mapped is not None else subject
+
+    def uses_re2(self, pattern: Pattern, subject: str) -> bool:
+        return self._subject_for(pattern, subject)[0] is not None
+
+    def findall(self, pattern: Pattern, subject: str) -> List[Any]:
+        compiled, target = self._subject_for(pattern, subject)
+        if compiled is None:
+            return pattern.findall(subject)
+        if target is subject:
+            return compiled.findall(subject)
+        groups = pattern.groups
+        return [_item_from(match, groups, subject) for match in compiled.finditer(target)]
+
+    def locate(self, pattern: Pattern, subject: str) -> Tuple[List[Any], List[int]]:
+        compiled, target = self._subject_for(pattern, subject)
+        if compiled is None:
+            return super().locate(pattern, subject)
+        items, starts, groups = [], [], pattern.groups
+        for match in compiled.finditer(target):
+            items.append(_item_from(match, groups, subject))
+            starts.append(match.start())
+        return items, starts
+
+
+def get_backend(name: str = "re") -> ReBackend:
+    """A backend by name; "re2" falls back to `re` when RE2 is not installed."""
+    if name == "re":
+        return ReBackend()
+    if name == "re2":
+        try:
+            return Re2Backend()
+        except ImportError:
+            return ReBackend()
+    raise ValueError(f"Unknown regex backend: {name}")
+
+
+def set_backend(backend: ReBackend) -> None:
+    """Install a backend for every ScanContext in this process."""
+    from SCAN_CONTEXT import ScanContext
+    ScanContext.backend = backend
+
+
+# =============================================================================
+# SECTION 3: CONFORMANCE
+# =============================================================================
+
+def conformance(backend: ReBackend, corpus: Iterable[str], patterns: Optional[List[Pattern]] = None,
+                disable: bool = True) -> Dict[str, Any]:
+    """
+    Compare the backend with `re` on every detector pattern over a reference
+    corpus, as the detectors scan it (raw and lowercased text). Mismatching
+    patterns are disabled on the backend unless `disable` is False.
+    """
+    if patterns is None:
+        from PATTERN_REGISTRY import PatternRegistry, TERM_REGEX
+        patterns = [term.pattern for term in PatternRegistry.default().terms.values() if term.kind == TERM_REGEX]
+
+    names = {pattern: pattern.pattern[:60] for pattern in patterns}
+    mismatches: Dict[str, int] = {}
+    disabled_before = set(getattr(backend, "disabled", ()))
+    engine_counts = {"re2": 0, "re": 0}
+    documents = 0
+    for text in corpus:
+        documents += 1
+        for subject in (text, text.lower()):
+            for pattern in patterns:
+                if getattr(backend, "uses_re2", None) and backend.uses_re2(pattern, subject):
+                    engine_counts["re2"] += 1
+                else:
+                    engine_counts["re"] += 1
+                if backend.findall(pattern, subject) != pattern.findall(subject):
+                    mismatches[names[pattern]] = mismatches.get(names[pattern], 0) + 1
+                    if disable and hasattr(backend, "disable"):
+                        backend.disable(pattern, "conformance mismatch")
+
+    return {
+        "backend": backend.name,
+        "documents": documents,
+        "patterns": len(patterns),
+        "classification": {names[p]: classify(p) for p in patterns},
+        "scans": engine_counts,
+        "mismatches": mismatches,
+        "fallback": sorted(names[p] for p in getattr(backend, "disabled", ()) if p not in disabled_before),
+        "conformant": not mismatches,
+    }
+
+
+def main():
+    import json
+    import argparse
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from AUDIT_COORDINATOR import load_corpus
+
+    parser = argparse.ArgumentParser(description="Check a regex backend against re on a reference corpus")
+    parser.add_argument("corpus", help="JSONL corpus of {\"id\", \"text\"} records")
+    parser.add_argument("--backend", default="re2")
+    args = parser.parse_args()
+
+    try:
+        # No silent fallback here: checking `re` against itself would pass
+        backend = Re2Backend() if args.backend == "re2" else get_backend(args.backend)
+    except ImportError as error:
+        parser.error(f"RE2 backend unavailable: {error}")
+    report = conformance(backend, (text for _, text in load_corpus(args.corpus)))
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if report["conformant"] else 1)
+
+
+if __name__ == "__main__":
+    main()
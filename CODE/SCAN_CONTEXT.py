@@ -0,0 +1,316 @@
+"""
+SCAN CONTEXT
+============
+Per-document scan state shared by the detectors of both auditors.
+
+A ScanContext lowercases the text once and memoizes every regex scan and
+keyword probe. A pattern or keyword list used by several detectors, or by
+both UnifiedPersuasionAuditor and IntegrityPatternAuditor, runs once per
+document.
+
+Usage:
+    ctx = ScanContext(text)
+    persuasion = UnifiedPersuasionAuditor().audit(text, ctx=ctx)
+    integrity = IntegrityPatternAuditor().audit(text, ctx=ctx)
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import re
+from array import array
+from typing import Dict, List, Optional, Any, Callable, Pattern, Sequence, Tuple
+
+# Import from companion module
+try:
+    from REGEX_BACKEND import ReBackend, findall_item
+    from TEXT_NORMALIZER import NormalizedText, normalize_text
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from REGEX_BACKEND import ReBackend, findall_item
+    from TEXT_NORMALIZER import NormalizedText, normalize_text
+
+# Sentence boundary shared by every detector that splits on terminators
+SENTENCE_BOUNDARY = re.compile(r'[.!?]+')
+
+# One match per whitespace-separated word; the group is its first a-z letter
+WORD_INITIAL = re.compile(r'(?=\S)[^\sa-z]*([a-z]?)\S*')
+WORD_RUN = re.compile(r'\w+')
+# Three or more consecutive words sharing an initial
+ALLITERATION_RUN = re.compile(r'([a-z])\1\1+')
+
+
+def _is_word(ch: str) -> bool:
+    """The \\w test re applies to str patterns."""
+    return ch.isalnum() or ch == '_'
+
+
+class TokenStream:
+    """
+    Word-level views of one document, each built once on first use.
+
+    initials holds one character per whitespace-separated word of the
+    lowercased text (its first a-z letter, or a space), so runs of shared
+    initials are found by one scan of a short string. Word runs are the
+    maximal \\w+ sequences of the text.
+    """
+
+    def __init__(self, ctx: "ScanContext"):
+        self._ctx = ctx
+        self._initials = None
+        self._runs = None
+        self._sentence_word_counts = None
+
+    @property
+    def initials(self) -> str:
+        if self._initials is None:
+            self._initials = "".join(letter or " " for letter in WORD_INITIAL.findall(self._ctx.lower))
+        return self._initials
+
+    def alliteration_count(self) -> int:
+        """Word positions starting three consecutive words with the same a-z letter."""
+        return sum(len(run.group()) - 2 for run in ALLITERATION_RUN.finditer(self.initials))
+
+    @property
+    def runs(self) -> List[str]:
+        """Word runs; lowercased when the whole text is ASCII (runs are then unchanged by lowering)."""
+        if self._runs is None:
+            ctx = self._ctx
+            self._runs = WORD_RUN.findall(ctx.lower if ctx.text.isascii() else ctx.text)
+        return self._runs
+
+    def suffix_count(self, endings: Sequence[str], patterns: Sequence[Pattern]) -> int:
+        """
+        Total findall() hits of case-insensitive r'\\w+<ending>\\b' patterns.
+        Each pattern matches a word run at most once, at its end, so ASCII
+        runs are tested with endswith(); other runs go through the pattern
+        itself to keep Unicode case folding exact.
+        """
+        endings = tuple(endings)
+        count = 0
+        for run in self.runs:
+            if run.isascii():
+                folded = run.lower()
+                if folded.endswith(endings):
+                    count += sum(1 for ending in endings if len(folded) > len(ending) and folded.endswith(ending))
+            else:
+                count += sum(1 for pattern in patterns if pattern.search(run))
+        return count
+
+    def contraction_count(self) -> int:
+        """
+        findall() hits of r"\\b\\w+'\\w+\\b": apostrophes with word characters
+        on both sides, except where the left word already closed the
+        previous hit (matches do not overlap).
+        """
+        text = self._ctx.text
+        count, previous = 0, -1
+        position = text.find("'", 1)
+        while 0 < position < len(text) - 1:
+            if _is_word(text[position - 1]) and _is_word(text[position + 1]):
+                if previous < 0 or not WORD_RUN.fullmatch(text, previous + 1, position):
+                    count += 1
+                    previous = position
+            position = text.find("'", position + 1)
+        return count
+
+    @property
+    def sentence_word_counts(self) -> array:
+        """Whitespace word count of each non-blank sentence piece."""
+        if self._sentence_word_counts is None:
+            counts = array("l")
+            for sentence in self._ctx.sentences:
+                words = len(sentence.split())
+                if words:
+                    counts.append(words)
+            self._sentence_word_counts = counts
+        return self._sentence_word_counts
+
+
+class ScanContext:
+    """Memoized regex scans and keyword probes over one document."""
+
+    # Required literals per pattern, installed from a pattern profile
+    # (PATTERN_PROFILE.py). A scan is skipped when none of them occurs.
+    prefilters: Dict[Pattern, Tuple[Tuple[str, ...], bool]] = {}
+    # Regex engine for every scan (REGEX_BACKEND.py); `re` unless replaced
+    backend = ReBackend()
+
+    def __init__(self, text: str):
+        self.text = text
+        # Set when `text` is a normalized form of the caller's document
+        self.source: Optional[NormalizedText] = None
+        # Block spans [start, end) in `text` when built from markup (MARKUP_EXTRACTOR.py)
+        self.blocks: Optional[List[Any]] = None
+        self._lines = None
+        self._tokens = None
+        self._lower = None
+        self._sentences = None
+        self._regex_hits: Dict[Tuple[Pattern, bool], List[Any]] = {}
+        self._keyword_hits: Dict[str, bool] = {}
+        self._list_hits: Dict[Tuple[str, ...], List[str]] = {}
+        self._region_hits: Dict[Tuple[Pattern, str], List[Any]] = {}
+
+    @classmethod
+    def normalized(cls, original: str) -> "ScanContext":
+        """Context over the normalized text (TEXT_NORMALIZER.py); keyword probes use its casefold."""
+        source = normalize_text(original)
+        ctx = cls(source.text)
+        ctx.source = source
+        ctx._lower = source.folded
+        return ctx
+
+    @classmethod
+    def create(cls, text: str, normalize: bool = False) -> "ScanContext":
+        return cls.normalized(text) if normalize else cls(text)
+
+    @classmethod
+    def from_extracted(cls, extracted: Any, normalize: bool = False) -> "ScanContext":
+        """Context over extracted markup text that keeps its block boundaries."""
+        ctx = cls.create(extracted.text, normalize)
+        blocks = extracted.blocks
+        if ctx.source is not None:
+            blocks = [type(block)(block.kind, ctx._normalized_offset(block.start),
+                                  ctx._normalized_offset(block.end), block.level) for block in blocks]
+        ctx.blocks = blocks
+        return ctx
+
+    def _normalized_offset(self, position: int) -> int:
+        """First normalized offset whose original offset is at or past `position`."""
+        low, high = 0, len(self.text)
+        while low < high:
+            middle = (low + high) // 2
+            if self.source.to_original(middle) < position:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    @property
+    def original(self) -> str:
+        """The document as supplied, before any normalization."""
+        return self.source.original if self.source is not None else self.text
+
+    def original_span(self, start: int, end: int) -> Tuple[int, int]:
+        """Offsets in `original` for a [start, end) span of `text`."""
+        return self.source.original_span(start, end) if self.source is not None else (start, end)
+
+    @property
+    def lower(self) -> str:
+        """Lowercased text, computed once."""
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def sentences(self) -> List[str]:
+        """
+        Raw re.split(r'[.!?]+') pieces of the text, including empty ones.
+        With block boundaries, each block is split separately so headings and
+        list items never run into the next sentence.
+        """
+        if self._sentences is None:
+            if self.blocks is None:
+                self._sentences = SENTENCE_BOUNDARY.split(self.text)
+            else:
+                self._sentences = [piece for line in self.lines for piece in SENTENCE_BOUNDARY.split(line)]
+        return self._sentences
+
+    @property
+    def tokens(self) -> TokenStream:
+        """Word-level views (initials, word runs, sentence lengths), built lazily once."""
+        if self._tokens is None:
+            self._tokens = TokenStream(self)
+        return self._tokens
+
+    @property
+    def lines(self) -> List[str]:
+        """text.split('\\n'), or one entry per block when block boundaries are known."""
+        if self._lines is None:
+            if self.blocks is None:
+                self._lines = self.text.split('\n')
+            else:
+                self._lines = [self.text[block.start:block.end] for block in self.blocks]
+        return self._lines
+
+    def findall(self, pattern: Pattern, lower: bool = False) -> List[Any]:
+        """pattern.findall() over the text (or its lowercased form), run once."""
+        key = (pattern, lower)
+        hits = self._regex_hits.get(key)
+        if hits is None:
+            hits = self._scan(pattern, lower)
+            self._regex_hits[key] = hits
+        return list(hits)
+
+    def findall_in(self, pattern: Pattern, subject: str) -> List[Any]:
+        """pattern.findall() over part of the text (e.g. its opening third), run once per subject."""
+        key = (pattern, subject)
+        hits = self._region_hits.get(key)
+        if hits is None:
+            hits = self.backend.findall(pattern, subject)
+            self._region_hits[key] = hits
+        return list(hits)
+
+    def _scan(self, pattern: Pattern, lower: bool) -> List[Any]:
+        if self._ruled_out(pattern):
+            return []
+        return self.backend.findall(pattern, self.lower if lower else self.text)
+
+    def _ruled_out(self, pattern: Pattern) -> bool:
+        """True if a prefilter proves the pattern cannot match this document."""
+        prefilter = self.prefilters.get(pattern)
+        if prefilter is None:
+            return False
+        literals, folds_case = prefilter
+        # Case-insensitive matching folds some non-ASCII letters onto
+        # ASCII ones, so the literal test is only exact on ASCII text
+        return (not folds_case or self.lower.isascii()) and not any(lit in self.lower for lit in literals)
+
+    def contains(self, keyword: str) -> bool:
+        """Substring test against the lowercased text, run once per keyword."""
+        hit = self._keyword_hits.get(keyword)
+        if hit is None:
+            hit = keyword in self.lower
+            self._keyword_hits[keyword] = hit
+        return hit
+
+    def keywords(self, keywords: Sequence[str]) -> List[str]:
+        """Keywords from the list present in the lowercased text, in list order."""
+        key = tuple(keywords)
+        hits = self._list_hits.get(key)
+        if hits is None:
+            hits = [kw for kw in key if self.contains(kw)]
+            self._list_hits[key] = hits
+        return list(hits)
+
+
+class ScanPlan:
+    """
+    Merged, de-duplicated list of the scans a set of auditors performs.
+
+    The plan is recorded by running the auditors once on an empty document,
+    where no probe is skipped by short-circuiting, so it stays in sync with
+    the detector code without a hand-maintained list.
+    """
+
+    def __init__(self, regexes: List[Tuple[Pattern, bool]], keywords: List[str]):
+        self.regexes = regexes
+        self.keywords = keywords
+
+    @classmethod
+    def record(cls, run: Callable[[ScanContext], Any]) -> "ScanPlan":
+        """Build a plan from the probes `run(ctx)` makes against an empty document."""
+        ctx = ScanContext("")
+        run(ctx)
+        return cls(list(ctx._regex_hits), list(ctx._keyword_hits))
+
+    def execute(self, ctx: ScanContext) -> ScanContext:
+        """Run every scan in the plan against the context, once each."""
+        for keyword in self.keywords:
+            ctx.contains(keyword)
+        for pattern, lower in self.regexes:
+            ctx.findall(pattern, lower)
+        return ctx
@@ -0,0 +1,224 @@
+"""
+SENTENCE ATTRIBUTION
+====================
+Per-sentence contributions to every detector score and the composite,
+from the same single audit pass.
+
+The audit runs on a TrackingContext, which records where each regex match
+starts while scanning; keyword hits are located in the lowercased text.
+The pattern registry says which probes belong to which detector, so every
+hit becomes evidence for its detectors at a sentence. Each detector's
+document score is then allocated across sentences in proportion to that
+evidence (by sentence length for scores built from non-pattern features,
+such as sentence-length ratios). Allocations sum exactly to the detector
+scores (a document with no sentence is one span), and the composite is allocated through the scorer's linear
+weights, so the per-sentence composite sums to the unrounded overall
+influence index. The document report itself is unchanged.
+
+The allocation explains where a score's evidence sits; it is not a
+counterfactual (removing a sentence can move a capped or thresholded
+score by a different amount).
+
+Usage:
+    attributor = SentenceAttributor()
+    report, heatmap = attributor.audit(draft)
+    for index in heatmap.top(5):
+        start, end = heatmap.span(index)
+        print(round(heatmap.composite[index], 2), draft[start:end])
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, Pattern
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext, SENTENCE_BOUNDARY
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from PATTERN_REGISTRY import PatternRegistry, TERM_REGEX, TERM_KEYWORD
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext, SENTENCE_BOUNDARY
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from PATTERN_REGISTRY import PatternRegistry, TERM_REGEX, TERM_KEYWORD
+
+DETECTOR_GROUPS = (
+    ("tactical", "tactical_detectors", "tactical_stimulus"),
+    ("psychological", "psychological_detectors", "psychological_principles"),
+    ("linguistic", "linguistic_detectors", "linguistic_patterns"),
+)
+
+
+# =============================================================================
+# SECTION 1: TRACKING CONTEXT
+# =============================================================================
+
+class TrackingContext(ScanContext):
+    """ScanContext that also keeps the start offset of every regex match."""
+
+    def __init__(self, text: str):
+        super().__init__(text)
+        self.match_starts: Dict[Tuple[Pattern, bool], List[int]] = {}
+        self._lower_offsets: Optional[array] = None
+
+    def _scan(self, pattern: Pattern, lower: bool) -> List[Any]:
+        starts: List[int] = []
+        self.match_starts[(pattern, lower)] = starts
+        if self._ruled_out(pattern):
+            return []
+        # One scan gives both the findall() result and the offsets
+        hits, found = self.backend.locate(pattern, self.lower if lower else self.text)
+        starts.extend(found)
+        return hits
+
+    def keyword_starts(self, keyword: str) -> List[int]:
+        """Offsets of every occurrence of a probed keyword in the lowercased text."""
+        if not self._keyword_hits.get(keyword):
+            return []
+        starts, position = [], self.lower.find(keyword)
+        while position != -1:
+            starts.append(position)
+            position = self.lower.find(keyword, position + 1)
+        return starts
+
+    def text_offsets(self, positions: List[int]) -> List[int]:
+        """
+        Offsets in text for offsets in the lowercased text. Lowercasing maps
+        each character on its own but can lengthen it (e.g. "\u0130", or "\u00df"
+        when casefolded), so a per-character map is built when lengths differ.
+        """
+        if len(self.lower) == len(self.text):
+            return list(positions)
+        if self._lower_offsets is None:
+            fold = str.casefold if self.source is not None else str.lower
+            offsets = array("l")
+            for index, ch in enumerate(self.text):
+                offsets.extend([index] * len(fold(ch)))
+            offsets.append(len(self.text))
+            self._lower_offsets = offsets
+        return [self._lower_offsets[position] for position in positions]
+
+
+# =============================================================================
+# SECTION 2: SENTENCES
+# =============================================================================
+
+def sentence_spans(ctx: ScanContext) -> Tuple[array, array]:
+    """[start, end) of each non-blank sentence piece of ctx.text, whitespace trimmed."""
+    starts, ends = array("l"), array("l")
+    regions = [(block.start, block.end) for block in ctx.blocks] if ctx.blocks is not None else [(0, len(ctx.text))]
+    text = ctx.text
+    for region_start, region_end in regions:
+        position = region_start
+        boundaries = [(m.start(), m.end()) for m in SENTENCE_BOUNDARY.finditer(text, region_start, region_end)]
+        boundaries.append((region_end, region_end))
+        for boundary_start, boundary_end in boundaries:
+            piece = text[position:boundary_start]
+            stripped = piece.strip()
+            if stripped:
+                offset = position + (len(piece) - len(piece.lstrip()))
+                starts.append(offset)
+                ends.append(offset + len(stripped))
+            position = boundary_end
+    return starts, ends
+
+
+# =============================================================================
+# SECTION 3: ATTRIBUTION
+# =============================================================================
+
+@dataclass
+class SentenceAttribution:
+    """Per-sentence arrays, indexed like `starts`/`ends` (offsets in the original text)."""
+    starts: array
+    ends: array
+    detectors: Dict[str, array]
+    composite: array
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def span(self, index: int) -> Tuple[int, int]:
+        return self.starts[index], self.ends[index]
+
+    def top(self, n: int = 5) -> List[int]:
+        """Sentence indexes with the largest composite contribution."""
+        return sorted(range(len(self.composite)), key=lambda i: -self.composite[i])[:n]
+
+    def to_dict(self, digits: int = 3) -> Dict[str, Any]:
+        return {
+            "starts": list(self.starts),
+            "ends": list(self.ends),
+            "detectors": {name: [round(v, digits) for v in values] for name, values in self.detectors.items()},
+            "composite": [round(v, digits) for v in self.composite],
+        }
+
+
+class SentenceAttributor:
+    """Audit once and allocate every persuasion detector score to sentences."""
+
+    def __init__(self, auditor: Optional[UnifiedPersuasionAuditor] = None,
+                 registry: Optional[PatternRegistry] = None):
+        self.auditor = auditor or UnifiedPersuasionAuditor()
+        self.registry = registry or PatternRegistry({"persuasion": self.auditor})
+
+    def audit(self, text: str) -> Tuple[Dict[str, Any], SentenceAttribution]:
+        ctx = TrackingContext.create(text, self.auditor.normalize)
+        report = self.auditor.audit(text, ctx)
+        return report, self.attribute(report, ctx)
+
+    def _evidence(self, detector: str, ctx: TrackingContext) -> List[int]:
+        """Offsets in ctx.text of every hit made by one detector's probes."""
+        positions: List[int] = []
+        for term_id in self.registry.detectors.get(f"persuasion/{detector}", ()):
+            term = self.registry.terms[term_id]
+            if term.kind == TERM_REGEX:
+                starts = ctx.match_starts.get((term.pattern, term.lower), ())
+                positions.extend(ctx.text_offsets(starts) if term.lower else starts)
+            elif term.kind == TERM_KEYWORD:
+                positions.extend(ctx.text_offsets(ctx.keyword_starts(term.keywords[0])))
+        return positions
+
+    def attribute(self, report: Dict[str, Any], ctx: TrackingContext) -> SentenceAttribution:
+        starts, ends = sentence_spans(ctx)
+        count = len(starts)
+        lengths = [len(ctx.text[starts[i]:ends[i]].split()) for i in range(count)]
+        if not count:
+            # A blank document still carries scores (e.g. MEMORABLE's brevity bonus)
+            starts, ends, count, lengths = array("l", [0]), array("l", [len(ctx.text)]), 1, [1]
+        total_length = sum(lengths)
+
+        detectors: Dict[str, array] = {}
+        composite = array("d", [0.0] * count)
+        for group, attribute, section in DETECTOR_GROUPS:
+            names = list(getattr(self.auditor, attribute))
+            weight = self.auditor.scorer.WEIGHTS[group] / len(names) if names else 0.0
+            for name in names:
+                score = report[section][name]["score"]
+                shares = array("d", [0.0] * count)
+                if score and count:
+                    evidence = [0] * count
+                    for position in self._evidence(name, ctx):
+                        evidence[max(0, bisect_right(starts, position) - 1)] += 1
+                    total = sum(evidence)
+                    if not total:
+                        evidence, total = lengths, total_length
+                    if total:
+                        for i in range(count):
+                            shares[i] = score * evidence[i] / total
+                detectors[name] = shares
+                for i in range(count):
+                    composite[i] += shares[i] * weight
+
+        if ctx.source is not None:
+            mapped = [ctx.original_span(starts[i], ends[i]) for i in range(count)]
+            starts = array("l", (span[0] for span in mapped))
+            ends = array("l", (span[1] for span in mapped))
+        return SentenceAttribution(starts, ends, detectors, composite)
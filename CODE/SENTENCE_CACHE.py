@@ -0,0 +1,272 @@
+"""
+SENTENCE CACHE
+==============
+Bounded cross-document cache of per-sentence scan results.
+
+Corpora repeat the same legal footers, unsubscribe blocks, testimonials and
+calls to action across many documents. Whole-document caching misses them
+because the surrounding text differs. SentenceCache splits each document at
+the shared sentence boundary ([.!?]+) and stores, per distinct sentence, the
+regex matches and keyword hits of every sentence-local probe in a ScanPlan.
+A document's scans are assembled from cached sentences. Only the sentences
+not seen before are scanned, in one pass per pattern over their
+concatenation.
+
+A probe is sentence-local when its result over the document is exactly the
+concatenation of its results over the sentences:
+    - regexes that always consume at least one character, never consume a
+      sentence terminator, and use no anchors (^, $, \\A, \\Z) or lookaround.
+      \\b behaves the same at a terminator as at the end of a string.
+    - keywords without a terminator character.
+Other probes (e.g. "dr. ", "...", lookbehinds), document-global features
+(word counts, token streams, sentence lengths) and scoring stay per
+document, so reports are unchanged.
+
+Entries are keyed by a 128-bit digest of the sentence and its lowercased
+form, so memory per entry is a digest plus its (usually empty) hits. The
+least recently used entries are evicted once `max_entries` is reached.
+
+Usage:
+    auditor = CombinedAuditor(sentence_cache=SentenceCache(max_entries=200_000))
+    for doc_id, text in load_corpus("emails.jsonl"):
+        auditor.audit(text)
+    print(auditor.sentence_cache.stats())
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import hashlib
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Pattern, Tuple
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext, ScanPlan, SENTENCE_BOUNDARY, findall_item
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext, ScanPlan, SENTENCE_BOUNDARY, findall_item
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Characters SENTENCE_BOUNDARY splits on; joins uncached sentences for scanning
+TERMINATORS = ".!?"
+_TERMINATOR_CODES = frozenset(map(ord, TERMINATORS))
+_JOIN = TERMINATORS[0]
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+            getattr(sre_constants, "POSSESSIVE_REPEAT", sre_constants.MAX_REPEAT))
+# Categories that match ASCII punctuation
+_PUNCTUATION_CATEGORIES = {sre_constants.CATEGORY_NOT_DIGIT, sre_constants.CATEGORY_NOT_SPACE,
+                           sre_constants.CATEGORY_NOT_WORD}
+_BOUNDARY_ASSERTIONS = {sre_constants.AT_BOUNDARY, sre_constants.AT_NON_BOUNDARY}
+
+
+# =============================================================================
+# SECTION 1: SENTENCE-LOCAL PROBES
+# =============================================================================
+
+def _set_matches_terminator(items: Any) -> bool:
+    """Whether a character class [...] can match any sentence terminator."""
+    negate = False
+    members = set()
+    for op, value in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            members.add(value)
+        elif op is sre_constants.RANGE:
+            members.update(code for code in _TERMINATOR_CODES if value[0] <= code <= value[1])
+        elif op is sre_constants.CATEGORY:
+            if value in _PUNCTUATION_CATEGORIES:
+                members.update(_TERMINATOR_CODES)
+        else:
+            return True
+    matched = members & _TERMINATOR_CODES
+    return bool(matched) if not negate else matched != _TERMINATOR_CODES
+
+
+def _local(items: Any) -> bool:
+    for op, value in items:
+        if op is sre_constants.LITERAL:
+            if value in _TERMINATOR_CODES:
+                return False
+        elif op is sre_constants.IN:
+            if _set_matches_terminator(value):
+                return False
+        elif op is sre_constants.AT:
+            if value not in _BOUNDARY_ASSERTIONS:
+                return False
+        elif op is sre_constants.SUBPATTERN:
+            if not _local(value[-1]):
+                return False
+        elif op is sre_constants.BRANCH:
+            if not all(_local(branch) for branch in value[1]):
+                return False
+        elif op in _REPEATS:
+            if not _local(value[2]):
+                return False
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            if not _local(value):
+                return False
+        else:
+            # ANY, NOT_LITERAL, lookaround, back-references, conditionals
+            return False
+    return True
+
+
+def is_sentence_local(pattern: Pattern) -> bool:
+    """True if findall() over a document equals findall() over its sentences, concatenated."""
+    if isinstance(pattern.pattern, bytes):
+        return False
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return False
+    return parsed.getwidth()[0] > 0 and _local(parsed)
+
+
+def is_local_keyword(keyword: str) -> bool:
+    return bool(keyword) and not any(ch in keyword for ch in TERMINATORS)
+
+
+# =============================================================================
+# SECTION 2: CACHE
+# =============================================================================
+
+# Cached state of one sentence: matches per plan regex index (non-empty
+# only) and the plan indexes of the keywords it contains
+SentenceState = Tuple[Dict[int, List[Any]], Tuple[int, ...]]
+
+
+class SentenceCache:
+    """LRU cache of sentence-local scan results, shared across documents."""
+
+    def __init__(self, plan: Optional[ScanPlan] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if plan is None:
+            from COMBINED_AUDITOR import CombinedAuditor
+            plan = CombinedAuditor().plan
+        self.regexes: List[Tuple[Pattern, bool]] = [
+            (pattern, lower) for pattern, lower in plan.regexes if is_sentence_local(pattern)
+        ]
+        self.keywords: List[str] = [kw for kw in plan.keywords if is_local_keyword(kw)]
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[bytes, SentenceState]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(sentence: str, lowered: str) -> bytes:
+        digest = hashlib.blake2b(sentence.encode("utf-8", "surrogatepass"), digest_size=16)
+        if lowered != sentence:
+            digest.update(b"\x00" + lowered.encode("utf-8", "surrogatepass"))
+        return digest.digest()
+
+    def prime(self, ctx: ScanContext) -> ScanContext:
+        """Fill the context's scans for every sentence-local probe in the plan."""
+        sentences = SENTENCE_BOUNDARY.split(ctx.text)
+        lowered = SENTENCE_BOUNDARY.split(ctx.lower)
+        if len(sentences) != len(lowered):
+            return ctx
+
+        states: List[Optional[SentenceState]] = []
+        pending: Dict[bytes, Tuple[str, str]] = {}
+        keys: List[Optional[bytes]] = []
+        for sentence, lower in zip(sentences, lowered):
+            if not sentence:
+                keys.append(None)
+                continue
+            key = self._key(sentence, lower)
+            keys.append(key)
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            elif key not in pending:
+                pending[key] = (sentence, lower)
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        fresh = self._scan(list(pending.values())) if pending else []
+        computed = dict(zip(pending, fresh))
+        for key in keys:
+            states.append(None if key is None else computed.get(key) or self.entries[key])
+        for key, state in computed.items():
+            self._store(key, state)
+
+        matches: List[List[Any]] = [[] for _ in self.regexes]
+        found = set()
+        for state in states:
+            if state is None:
+                continue
+            regex_hits, keyword_hits = state
+            for index, hits in regex_hits.items():
+                matches[index].extend(hits)
+            found.update(keyword_hits)
+        for index, key in enumerate(self.regexes):
+            ctx._regex_hits.setdefault(key, matches[index])
+        for index, keyword in enumerate(self.keywords):
+            ctx._keyword_hits.setdefault(keyword, index in found)
+        return ctx
+
+    def _scan(self, sentences: List[Tuple[str, str]]) -> List[SentenceState]:
+        """Scan new sentences joined by a terminator, one pass per probe."""
+        raw = _JOIN.join(sentence for sentence, _ in sentences)
+        lower = _JOIN.join(lowered for _, lowered in sentences)
+        raw_starts, lower_starts, raw_at, lower_at = [], [], 0, 0
+        for sentence, lowered in sentences:
+            raw_starts.append(raw_at)
+            lower_starts.append(lower_at)
+            raw_at += len(sentence) + 1
+            lower_at += len(lowered) + 1
+
+        regex_hits: List[Dict[int, List[Any]]] = [{} for _ in sentences]
+        for index, (pattern, is_lower) in enumerate(self.regexes):
+            starts = lower_starts if is_lower else raw_starts
+            for match in pattern.finditer(lower if is_lower else raw):
+                owner = regex_hits[bisect_right(starts, match.start()) - 1]
+                owner.setdefault(index, []).append(findall_item(match))
+
+        keyword_hits: List[List[int]] = [[] for _ in sentences]
+        for index, keyword in enumerate(self.keywords):
+            position = lower.find(keyword)
+            while position != -1:
+                sentence = bisect_right(lower_starts, position) - 1
+                keyword_hits[sentence].append(index)
+                if sentence + 1 == len(sentences):
+                    break
+                position = lower.find(keyword, lower_starts[sentence + 1])
+        return [(regex_hits[i], tuple(keyword_hits[i])) for i in range(len(sentences))]
+
+    def _store(self, key: bytes, state: SentenceState) -> None:
+        self.entries[key] = state
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "local_regexes": len(self.regexes),
+            "local_keywords": len(self.keywords),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,369 @@
+"""
+SYNTHETIC CORPUS
+================
+Seeded synthetic corpora with planted detector hits, for offline benchmarks
+and equivalence tests.
+
+Customer data cannot go to CI, and real corpora give no control over how
+often each detector fires. SyntheticCorpusBuilder writes neutral filler
+text and plants known hits in it at a chosen density per detector category
+(hits per 1,000 words). The planted phrases come from the detectors' own
+vocabulary:
+    - keywords from Patterns, IntegrityPatterns and the detector classes,
+      via the pattern registry;
+    - strings each registered regex matches (DIFFERENTIAL_HARNESS.sample_match);
+    - filled phrases from the GenerationTemplates tables of the matching
+      persuasion technique.
+Every document records what was planted: hits per category and
+occurrences per registry term.
+
+Only phrases that hit a probe of their category are planted. Regex samples
+and keywords are checked against their own term. Each template is filled
+a few times at start-up. A fill is kept only if it hits a term of its
+category, and its plants are credited to the first such term. Categories with no
+registered probes (MEMORABLE works on whole lines) get no plants.
+
+Filler words that trigger any probe on their own are dropped at start-up.
+Each planted phrase is a sentence of its own that ends its line, so a probe
+cannot merge two plants into one match. The planted counts are therefore
+lower bounds on what the probes see. Filler can still complete a pattern
+across a plant's boundary and add to the counts. measure() scans a
+document for exact per-term counts when a test needs them.
+
+Document i depends only on (seed, i), so corpora are reproducible at any
+size. They can also be generated in slices on several machines. write_jsonl()
+streams records in the {"id", "text"} format load_corpus() reads, up to a
+document count or a byte size (kilobytes to gigabytes), and writes a
+manifest with the totals next to it.
+
+This is test data for the detectors only; it is not meant to be read as
+persuasive content.
+
+Usage:
+    builder = SyntheticCorpusBuilder(seed=7, densities={"persuasion/SCARCITY": 5.0})
+    manifest = builder.write_jsonl("bench.jsonl", target_bytes=50_000_000)
+    for doc in builder.documents(100):
+        counts = builder.measure(doc)      # exact per-term counts, >= doc.planted_terms
+
+    python SYNTHETIC_CORPUS.py bench.jsonl --size 1GB --seed 7 --density 2 --density-for persuasion/SCARCITY=5
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import re
+import json
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+
+# Import from companion modules
+try:
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_REGISTRY import PatternRegistry, TERM_REGEX, TERM_KEYWORD
+    from DIFFERENTIAL_HARNESS import sample_match
+    from UNIFIED_GENERATOR import GenerationTemplates
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext
+    from PATTERN_REGISTRY import PatternRegistry, TERM_REGEX, TERM_KEYWORD
+    from DIFFERENTIAL_HARNESS import sample_match
+    from UNIFIED_GENERATOR import GenerationTemplates
+
+# Planted hits per 1,000 words for categories without their own density
+DEFAULT_DENSITY = 2.0
+# Words per document, drawn uniformly
+DEFAULT_WORDS = (200, 800)
+# Share of a persuasion category's plants drawn from GenerationTemplates
+DEFAULT_TEMPLATE_SHARE = 0.3
+# Verified strings kept per regex
+SAMPLES_PER_REGEX = 16
+# Fills tried per GenerationTemplates template
+FILLS_PER_TEMPLATE = 3
+INTENSITIES = ("LOW", "MODERATE", "HIGH", "EXTREME")
+
+FILLER_WORDS = (
+    "the", "a", "an", "of", "to", "in", "on", "for", "with", "at", "by", "from", "and", "or",
+    "report", "team", "review", "results", "plan", "people", "quarter", "notes", "market", "data",
+    "project", "meeting", "office", "schedule", "update", "summary", "page", "table", "figure",
+    "section", "item", "list", "group", "member", "client", "method", "sample", "level", "area",
+    "period", "morning", "evening", "month", "year", "city", "river", "garden", "kitchen", "paper",
+    "pencil", "chair", "desk", "lamp", "green", "blue", "yellow", "simple", "regular", "ordinary",
+    "several", "written", "listed", "shown", "noted", "held", "kept", "placed", "moved", "opened",
+)
+
+# Placeholder fills for GenerationTemplates; others read as their own name
+FILL_VALUES = {
+    "count": ["1,200", "10,000", "57", "3 million"],
+    "institution": ["Harvard", "Stanford", "the Mayo Clinic"],
+    "institution2": ["MIT", "Oxford"],
+    "institution3": ["Yale", "Cambridge"],
+    "timeframe": ["24 hours", "this week", "today"],
+    "deadline": ["midnight", "tomorrow", "Friday"],
+    "percentage": ["20", "45", "90"],
+    "benefit": ["success", "peace of mind"],
+    "action": ["act now", "sign up"],
+    "reason": ["demand is high"],
+    "positive": ["freedom", "growth"],
+    "negative": ["decline", "chaos"],
+    "problem": ["burnout", "debt"],
+    "enemy": ["the old guard", "the competition"],
+    "identity": ["builders", "parents"],
+    "topic": ["the plan", "this policy"],
+    "claim": ["this works"],
+}
+
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+
+# =============================================================================
+# SECTION 1: DOCUMENTS
+# =============================================================================
+
+@dataclass
+class SyntheticDocument:
+    """One generated document and what was planted in it."""
+    doc_id: str
+    text: str
+    words: int
+    planted: Dict[str, int] = field(default_factory=dict)        # category -> hits planted
+    planted_terms: Dict[str, int] = field(default_factory=dict)  # term id -> occurrences planted
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.doc_id, "text": self.text, "words": self.words,
+                "planted": self.planted, "planted_terms": self.planted_terms}
+
+
+# =============================================================================
+# SECTION 2: BUILDER
+# =============================================================================
+
+class SyntheticCorpusBuilder:
+    """Deterministic documents with planted hits at per-category densities."""
+
+    def __init__(self, seed: int = 0, densities: Optional[Dict[str, float]] = None,
+                 default_density: float = DEFAULT_DENSITY, words: Tuple[int, int] = DEFAULT_WORDS,
+                 template_share: float = DEFAULT_TEMPLATE_SHARE, intensities: Tuple[str, ...] = INTENSITIES,
+                 registry: Optional[PatternRegistry] = None):
+        self.seed = seed
+        self.registry = registry or PatternRegistry.default()
+        unknown = set(densities or {}) - set(self.registry.detectors)
+        if unknown:
+            raise ValueError(f"Unknown detector categories: {sorted(unknown)}")
+        self.densities = {category: (densities or {}).get(category, default_density)
+                          for category in self.registry.detectors}
+        self.words = words
+        self.template_share = template_share
+        self.intensities = intensities
+
+        rng = random.Random(f"{seed}:vocabulary")
+        # term id -> phrases that hit it
+        self.phrases: Dict[str, List[str]] = {}
+        for term_id, term in self.registry.terms.items():
+            if term.kind == TERM_KEYWORD:
+                self.phrases[term_id] = [term.keywords[0]]
+            elif term.kind == TERM_REGEX:
+                samples = {sample_match(term.pattern, rng) for _ in range(SAMPLES_PER_REGEX)} - {None}
+                if samples:
+                    self.phrases[term_id] = sorted(samples)
+        # Keep only phrases that hit their term on their own (e.g. not mixed-case keywords)
+        for term_id, phrases in list(self.phrases.items()):
+            term = self.registry.terms[term_id]
+            phrases = [phrase for phrase in phrases if term.hit(ScanContext(f"{phrase}.\n"))]
+            if phrases:
+                self.phrases[term_id] = phrases
+            else:
+                del self.phrases[term_id]
+        self.vocabulary: Dict[str, List[str]] = {
+            category: [term_id for term_id in term_ids if term_id in self.phrases]
+            for category, term_ids in self.registry.detectors.items()
+        }
+        # category -> (term id, filled template) pairs, each verified to hit that term
+        self.templates: Dict[str, List[Tuple[str, str]]] = {}
+        templates = GenerationTemplates.get_all_templates()
+        for category, term_ids in self.registry.detectors.items():
+            framework, name = category.split("/", 1)
+            if framework != "persuasion" or name not in templates:
+                continue
+            verified = []
+            for subtype in sorted(templates[name]):
+                for level in self.intensities:
+                    for template in templates[name][subtype].get(level, ()):
+                        for phrase in sorted({self._fill(template, rng) for _ in range(FILLS_PER_TEMPLATE)}):
+                            term_id = self._first_hit(phrase, term_ids)
+                            if term_id is not None:
+                                verified.append((term_id, phrase))
+            if verified:
+                self.templates[category] = verified
+        self.filler = [word for word in FILLER_WORDS if not self._hits_anything(f" {word} ")]
+
+    def _hits_anything(self, text: str) -> bool:
+        ctx = ScanContext(text)
+        return any(term.hit(ctx) for term in self.registry.terms.values()
+                   if term.kind in (TERM_REGEX, TERM_KEYWORD))
+
+    # ----- planting -----
+
+    @staticmethod
+    def _fill(template: str, rng: random.Random) -> str:
+        return _PLACEHOLDER.sub(
+            lambda m: rng.choice(FILL_VALUES.get(m.group(1), [m.group(1).rstrip("0123456789").replace("_", " ")])),
+            template)
+
+    def _first_hit(self, phrase: str, term_ids: List[str]) -> Optional[str]:
+        """The first regex or keyword term in `term_ids` that `phrase` hits on its own."""
+        ctx = ScanContext(f"{phrase}.\n")
+        for term_id in term_ids:
+            term = self.registry.terms[term_id]
+            if term.kind in (TERM_REGEX, TERM_KEYWORD) and term.hit(ctx):
+                return term_id
+        return None
+
+    def _plant(self, category: str, rng: random.Random) -> Optional[Tuple[str, str]]:
+        """(term id, phrase) for one hit in `category`, or None if it has no vocabulary."""
+        terms = self.vocabulary.get(category)
+        if category in self.templates and (not terms or rng.random() < self.template_share):
+            return rng.choice(self.templates[category])
+        if not terms:
+            return None
+        term_id = rng.choice(terms)
+        return term_id, rng.choice(self.phrases[term_id])
+
+    def document(self, index: int) -> SyntheticDocument:
+        """Document `index`; the same (seed, index) always gives the same document."""
+        rng = random.Random(f"{self.seed}:{index}")
+        count = rng.randint(*self.words)
+        words = [rng.choice(self.filler) for _ in range(count)]
+        sentences, start = [], 0
+        while start < len(words):
+            end = start + rng.randint(8, 20)
+            sentences.append(" ".join(words[start:end]) + ". ")
+            start = end
+
+        planted: Dict[str, int] = {}
+        planted_terms: Dict[str, int] = {}
+        plants: List[str] = []
+        for category, density in self.densities.items():
+            expected = density * count / 1000
+            hits = int(expected) + (rng.random() < expected - int(expected))
+            for _ in range(hits):
+                plant = self._plant(category, rng)
+                if plant is None:
+                    break
+                term_id, phrase = plant
+                plants.append(phrase)
+                planted[category] = planted.get(category, 0) + 1
+                planted_terms[term_id] = planted_terms.get(term_id, 0) + 1
+
+        # Each plant is a sentence that ends its line, so ".*" spans in the
+        # probes cannot run from one plant into the next
+        positions = sorted((rng.randint(0, len(sentences)) for _ in plants), reverse=True)
+        for position, phrase in zip(positions, plants):
+            sentences.insert(position, f"{phrase}.\n")
+        return SyntheticDocument(f"synthetic-{self.seed}-{index}", "".join(sentences).rstrip(), count,
+                                 planted, planted_terms)
+
+    def documents(self, count: int, start: int = 0) -> Iterator[SyntheticDocument]:
+        for index in range(start, start + count):
+            yield self.document(index)
+
+    def measure(self, document: SyntheticDocument) -> Dict[str, int]:
+        """Actual per-term counts: regex matches and keyword occurrences."""
+        ctx = ScanContext(document.text)
+        counts = {}
+        for term_id, term in self.registry.terms.items():
+            if term.kind == TERM_REGEX:
+                hits = len(ctx.findall(term.pattern, term.lower))
+            elif term.kind == TERM_KEYWORD:
+                hits = ctx.lower.count(term.keywords[0]) if ctx.contains(term.keywords[0]) else 0
+            else:
+                continue
+            if hits:
+                counts[term_id] = hits
+        return counts
+
+    # ----- output -----
+
+    def write_jsonl(self, path: str, documents: Optional[int] = None,
+                    target_bytes: Optional[int] = None, start: int = 0) -> Dict[str, Any]:
+        """
+        Stream documents to a JSONL file until `documents` are written or the
+        file reaches `target_bytes`. Writes <path>.manifest.json and returns it.
+        """
+        if documents is None and target_bytes is None:
+            raise ValueError("Give documents, target_bytes or both")
+        written, size, words = 0, 0, 0
+        planted: Dict[str, int] = {}
+        with open(path, "w", encoding="utf-8") as handle:
+            index = start
+            while (documents is None or written < documents) and (target_bytes is None or size < target_bytes):
+                document = self.document(index)
+                line = json.dumps(document.to_dict(), ensure_ascii=False) + "\n"
+                handle.write(line)
+                size += len(line.encode("utf-8"))
+                words += document.words
+                for category, hits in document.planted.items():
+                    planted[category] = planted.get(category, 0) + hits
+                written += 1
+                index += 1
+
+        manifest = {
+            "seed": self.seed,
+            "start": start,
+            "documents": written,
+            "bytes": size,
+            "filler_words": words,
+            "densities": self.densities,
+            "planted": planted,
+        }
+        with open(f"{path}.manifest.json", "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2)
+        return manifest
+
+
+# =============================================================================
+# SECTION 3: COMMAND LINE
+# =============================================================================
+
+_SIZE_UNITS = {"": 1, "B": 1, "KB": 10 ** 3, "MB": 10 ** 6, "GB": 10 ** 9}
+
+
+def parse_size(size: str) -> int:
+    """"500KB", "20MB", "1.5GB" or a plain byte count."""
+    match = re.fullmatch(r'\s*([\d.]+)\s*([KMG]?B?)\s*', size.upper())
+    if not match:
+        raise ValueError(f"Unrecognized size: {size}")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic corpus with planted detector hits")
+    parser.add_argument("output", help="JSONL file to write")
+    parser.add_argument("--documents", type=int)
+    parser.add_argument("--size", help="Target file size, e.g. 500KB, 20MB, 1GB")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", type=int, default=0, help="First document index (for slices)")
+    parser.add_argument("--density", type=float, default=DEFAULT_DENSITY,
+                        help="Planted hits per 1,000 words per category")
+    parser.add_argument("--density-for", action="append", default=[], metavar="CATEGORY=DENSITY",
+                        help="Density for one category, e.g. persuasion/SCARCITY=5")
+    args = parser.parse_args()
+
+    densities = {}
+    for item in args.density_for:
+        category, _, value = item.partition("=")
+        densities[category] = float(value)
+    builder = SyntheticCorpusBuilder(seed=args.seed, densities=densities, default_density=args.density)
+    target = parse_size(args.size) if args.size else None
+    documents = args.documents if args.documents or target else 1000
+    manifest = builder.write_jsonl(args.output, documents, target, args.start)
+    print(json.dumps({k: v for k, v in manifest.items() if k != "densities"}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+TEXT NORMALIZER
+===============
+One-pass Unicode normalization with a compact map back to original offsets.
+
+Scraped content defeats the ASCII-oriented patterns: curly quotes break
+"you'll", non-breaking spaces break "if\\s+you\\s+know", zero-width
+characters split keywords. normalize_text() applies, in a single pass:
+    - NFKC per grapheme (base character plus combining marks)
+    - quote folding (curly and prime quotes to ' and ")
+    - dash folding (hyphen, en/em dash, minus to -)
+    - zero-width and bidi control stripping
+    - whitespace collapsing (runs become one space, or one/two newlines
+      when the run held line breaks, so paragraph structure survives)
+    - casefolding into a separate `folded` form used for keyword probes
+The offset map stores only the points where normalized and original
+offsets stop advancing together, so unchanged ASCII text costs one entry.
+
+Normalization is off by default. Enable it per auditor:
+    auditor = CombinedAuditor(normalize=True)
+    ctx = ScanContext.normalized(raw_text)
+    ctx.original_span(start, end)     # offsets in the raw text
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import unicodedata
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Tuple
+
+QUOTE_FOLDS = {
+    "‘": "'", "’": "'", "‚": "'", "‛": "'", "′": "'", "ʼ": "'",
+    "“": '"', "”": '"', "„": '"', "‟": '"', "″": '"', "«": '"', "»": '"',
+}
+DASH_FOLDS = {ch: "-" for ch in "‐‑‒–—―−"}
+FOLDS = {**QUOTE_FOLDS, **DASH_FOLDS}
+
+# Invisible format characters removed outright
+ZERO_WIDTH = frozenset(
+    "­᠎​‌‍‎‏⁠⁡⁢⁣⁤﻿"
+    "‪‫‬‭‮⁦⁧⁨⁩"
+)
+
+# Characters NFKC would rewrite but the patterns match literally (g/m², lb/yd²)
+NFKC_EXEMPT = frozenset("²³")
+
+
+@dataclass
+class NormalizedText:
+    """Normalized text, its casefolded form and the map back to the original."""
+    original: str
+    text: str
+    folded: str
+    norm_index: array
+    orig_index: array
+
+    @property
+    def changed(self) -> bool:
+        return self.text != self.original
+
+    def to_original(self, position: int) -> int:
+        """Original offset of the character at a normalized offset."""
+        if position >= len(self.text):
+            return len(self.original)
+        anchor = bisect_right(self.norm_index, position) - 1
+        if anchor < 0:
+            return position
+        return self.orig_index[anchor] + (position - self.norm_index[anchor])
+
+    def original_span(self, start: int, end: int) -> Tuple[int, int]:
+        """Original [start, end) covering a normalized [start, end)."""
+        if end <= start:
+            position = self.to_original(start)
+            return position, position
+        orig_end = self.to_original(end - 1) + 1
+        # Extend over combining marks composed into the last character
+        while orig_end < len(self.original) and unicodedata.combining(self.original[orig_end]):
+            orig_end += 1
+        return self.to_original(start), orig_end
+
+
+def normalize_text(text: str) -> NormalizedText:
+    out = []
+    norm_index = array("l")
+    orig_index = array("l")
+    delta = 0                  # original - normalized offset on the current run
+    pending_space = -1         # original offset where a whitespace run began
+    pending_newlines = 0
+    n = len(text)
+    i = 0
+
+    def emit(chars: str, origin: int) -> None:
+        nonlocal delta
+        for ch in chars:
+            position = len(out)
+            # Anchor only where offsets stop advancing in step (dropped,
+            # collapsed or expanded characters); plain runs need no entries
+            if origin - position != delta:
+                norm_index.append(position)
+                orig_index.append(origin)
+                delta = origin - position
+            out.append(ch)
+
+    while i < n:
+        ch = text[i]
+        start = i
+        i += 1
+        if ch < "\x80":
+            chars = ch
+        else:
+            if ch in ZERO_WIDTH:
+                continue
+            while i < n and unicodedata.combining(text[i]):
+                i += 1
+            cluster = text[start:i]
+            chars = cluster if ch in NFKC_EXEMPT else unicodedata.normalize("NFKC", cluster)
+            chars = "".join(FOLDS.get(c, c) for c in chars if c not in ZERO_WIDTH)
+            if not chars:
+                continue
+
+        if chars.isspace():
+            if pending_space < 0:
+                pending_space = start
+            pending_newlines += chars.count("\n")
+            continue
+        if pending_space >= 0:
+            if out:
+                emit("\n\n" if pending_newlines > 1 else "\n" if pending_newlines else " ", pending_space)
+            pending_space, pending_newlines = -1, 0
+        emit(chars, start)
+
+    normalized = "".join(out)
+    return NormalizedText(text, normalized, normalized.casefold(), norm_index, orig_index)
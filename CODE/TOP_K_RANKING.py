@@ -0,0 +1,294 @@
+"""
+TOP-K RANKING
+=============
+Streaming top-K tables over audit scores with bounded memory.
+
+A TopK keeps a min-heap of the K best items for one score: overall
+influence index, integrity composite index, or any persuasion detector or
+integrity category score. Reports that fall out of the top K are dropped
+immediately, so memory stays proportional to K whatever the stream length.
+Tables serialize to JSON and merge, so workers and nodes can each rank their
+share and a coordinator combines the results (AUDIT_COORDINATOR.py ranks on
+the workers when given a TopKTracker).
+
+Score names:
+    "overall_influence_index"         persuasion composite
+    "composite_index"                 integrity composite
+    "SCARCITY", "EMOTIONAL", ...      persuasion detector score
+    "SUSCEPTIBILITY_TARGETING", ...   integrity category score
+    "persuasion.summary.overall_score"  any dotted path into the report
+
+Usage:
+    tracker = TopKTracker(1000, ["overall_influence_index", "composite_index", "SCARCITY"])
+    for doc_id, text in corpus:
+        tracker.offer(doc_id, auditor.audit(text))
+    tracker.rankings["SCARCITY"].results()
+
+Author: Persuasion Max Project
+Version: 1.0.0
+"""
+
+import os
+import heapq
+import json
+import dataclasses
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+
+# Import from companion modules
+try:
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor, IntegrityAuditReport
+    from COMBINED_AUDITOR import CombinedAuditReport
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from UNIFIED_AUDITOR import UnifiedPersuasionAuditor
+    from INTEGRITY_VIOLATION_DETECTOR import IntegrityPatternAuditor, IntegrityAuditReport
+    from COMBINED_AUDITOR import CombinedAuditReport
+
+# =============================================================================
+# SECTION 1: SCORE PATHS
+# =============================================================================
+
+SCORE_ALIASES = {
+    "overall_influence_index": "persuasion.composite_scores.overall_influence_index",
+    "composite_index": "integrity.composite_index",
+}
+
+_integrity_serializer = IntegrityPatternAuditor()
+
+
+def _persuasion_groups() -> Dict[str, str]:
+    auditor = UnifiedPersuasionAuditor()
+    groups = {}
+    for group, detectors in (("tactical_stimulus", auditor.tactical_detectors),
+                             ("psychological_principles", auditor.psychological_detectors),
+                             ("linguistic_patterns", auditor.linguistic_detectors)):
+        for category in detectors:
+            groups[category] = group
+    return groups
+
+
+PERSUASION_GROUPS = _persuasion_groups()
+
+
+def resolve_score_path(name: str) -> Tuple[str, ...]:
+    """Dotted report path for a score name (see module docstring)."""
+    if name in SCORE_ALIASES:
+        name = SCORE_ALIASES[name]
+    elif name in IntegrityPatternAuditor.CATEGORY_WEIGHTS:
+        name = f"integrity.detections.{name}.score"
+    elif name in PERSUASION_GROUPS:
+        name = f"persuasion.{PERSUASION_GROUPS[name]}.{name}.score"
+    elif "." not in name:
+        raise KeyError(f"Unknown score name: {name}")
+    return tuple(name.split("."))
+
+
+def framework_view(report: Any) -> Dict[str, Any]:
+    """
+    Any report shape as {"persuasion": ..., "integrity": ...} dicts.
+
+    Accepts persuasion report dicts, IntegrityAuditReport (or its dict form),
+    CombinedAuditReport and AuditWorker result records.
+    """
+    if isinstance(report, CombinedAuditReport):
+        return {"persuasion": report.persuasion, "integrity": report.integrity, "summary": report.summary}
+    if isinstance(report, IntegrityAuditReport):
+        return {"integrity": _integrity_serializer.to_dict(report)}
+    if "persuasion" in report or "integrity" in report:
+        return report
+    if "detections" in report:
+        return {"integrity": report}
+    return {"persuasion": report}
+
+
+def serializable(report: Any) -> Any:
+    """JSON-ready form of a retained report."""
+    if isinstance(report, CombinedAuditReport):
+        return report.to_dict()
+    if isinstance(report, IntegrityAuditReport):
+        return _integrity_serializer.to_dict(report)
+    return report
+
+
+def score_at(view: Dict[str, Any], path: Tuple[str, ...]) -> Optional[float]:
+    value: Any = view
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value if isinstance(value, (int, float)) else None
+
+
+# =============================================================================
+# SECTION 2: TOP-K TABLE
+# =============================================================================
+
+@dataclasses.dataclass(order=True)
+class RankedItem:
+    """Heap entry; ordering is (score, doc_id) so ties break deterministically."""
+    score: float
+    doc_id: str
+    report: Any = dataclasses.field(compare=False, default=None)
+
+
+class TopK:
+    """The K highest-scoring items for one score name."""
+
+    def __init__(self, k: int, score: str, keep_reports: bool = True):
+        self.k = k
+        self.score = score
+        self.path = resolve_score_path(score)
+        self.keep_reports = keep_reports
+        self.heap: List[RankedItem] = []
+        self.members: Dict[str, RankedItem] = {}
+        self.seen = 0
+
+    def threshold(self) -> Optional[float]:
+        """Lowest score currently in the table once it is full."""
+        return self.heap[0].score if len(self.heap) >= self.k else None
+
+    def offer(self, doc_id: str, report: Any, view: Optional[Dict[str, Any]] = None) -> bool:
+        """Consider one item; returns True if it entered the table."""
+        view = view if view is not None else framework_view(report)
+        score = score_at(view, self.path)
+        if score is None:
+            return False
+        self.seen += 1
+        return self._push(RankedItem(score, doc_id, report if self.keep_reports else None))
+
+    def _push(self, item: RankedItem) -> bool:
+        current = self.members.get(item.doc_id)
+        if current is not None:
+            # Re-audited document: keep the newer entry
+            self.heap.remove(current)
+            heapq.heapify(self.heap)
+            del self.members[item.doc_id]
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, item)
+        elif item > self.heap[0]:
+            dropped = heapq.heapreplace(self.heap, item)
+            del self.members[dropped.doc_id]
+        else:
+            return False
+        self.members[item.doc_id] = item
+        return True
+
+    def merge(self, other: "TopK") -> "TopK":
+        """Fold another table for the same score into this one."""
+        if other.path != self.path:
+            raise ValueError("cannot merge rankings over different scores")
+        self.seen += other.seen
+        for item in other.heap:
+            current = self.members.get(item.doc_id)
+            if current is not None and current >= item:
+                # Ranked in both tables: keep the higher entry
+                continue
+            self._push(RankedItem(item.score, item.doc_id, item.report))
+        return self
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Items best first."""
+        return [
+            {"doc_id": item.doc_id, "score": item.score, "report": item.report}
+            for item in sorted(self.heap, reverse=True)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "k": self.k,
+            "score": self.score,
+            "keep_reports": self.keep_reports,
+            "seen": self.seen,
+            "items": [[item.score, item.doc_id, serializable(item.report)] for item in self.heap],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TopK":
+        table = cls(data["k"], data["score"], data["keep_reports"])
+        table.seen = data["seen"]
+        for score, doc_id, report in data["items"]:
+            table._push(RankedItem(score, doc_id, report))
+        return table
+
+
+# =============================================================================
+# SECTION 3: MULTI-SCORE TRACKER
+# =============================================================================
+
+class TopKTracker:
+    """Several TopK tables fed from one stream of reports."""
+
+    def __init__(self, k: int, scores: Iterable[str], keep_reports: bool = True):
+        self.rankings: Dict[str, TopK] = {score: TopK(k, score, keep_reports) for score in scores}
+
+    def offer(self, doc_id: str, report: Any) -> None:
+        view = framework_view(report)
+        for ranking in self.rankings.values():
+            ranking.offer(doc_id, report, view)
+
+    def offer_results(self, results: Iterable[Dict[str, Any]]) -> None:
+        """Feed AuditWorker result records, e.g. from AUDIT_COORDINATOR.iter_results()."""
+        for record in results:
+            self.offer(record["id"], record)
+
+    def threshold(self, score: str) -> Optional[float]:
+        return self.rankings[score].threshold()
+
+    def merge(self, other: "TopKTracker") -> "TopKTracker":
+        for score, ranking in other.rankings.items():
+            if score in self.rankings:
+                self.rankings[score].merge(ranking)
+            else:
+                self.rankings[score] = ranking
+        return self
+
+    def empty(self) -> "TopKTracker":
+        """Tables for the same scores and sizes, with nothing ranked yet."""
+        tracker = TopKTracker(0, [])
+        tracker.rankings = {score: TopK(ranking.k, score, ranking.keep_reports)
+                            for score, ranking in self.rankings.items()}
+        return tracker
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {score: ranking.to_dict() for score, ranking in self.rankings.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TopKTracker":
+        tracker = cls(0, [])
+        tracker.rankings = {score: TopK.from_dict(table) for score, table in data.items()}
+        return tracker
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), default=str)
+
+    @classmethod
+    def from_json(cls, payload: str) -> "TopKTracker":
+        return cls.from_dict(json.loads(payload))
+
+
+# =============================================================================
+# SECTION 4: STREAM WRAPPER
+# =============================================================================
+
+class RankingAuditor:
+    """
+    Audit and rank in one pass.
+
+    Works with UnifiedPersuasionAuditor, IntegrityPatternAuditor,
+    CombinedAuditor or NearDuplicateAuditor; returns each report unchanged.
+    """
+
+    def __init__(self, auditor: Any, tracker: TopKTracker):
+        self.auditor = auditor
+        self.tracker = tracker
+        self.count = 0
+
+    def audit(self, text: str, ctx: Any = None, doc_id: Optional[str] = None) -> Any:
+        report = self.auditor.audit(text) if ctx is None else self.auditor.audit(text, ctx)
+        self.tracker.offer(doc_id if doc_id is not None else str(self.count), report)
+        self.count += 1
+        return report
+
@@ -18,6 +18,7 @@ Version: 1.1.0
 """
 
 import re
+import os
 import json
 import hashlib
 from typing import Dict, List, Optional, Any, Tuple
@@ -25,6 +26,19 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 from collections import Counter
 
+# Import from companion module
+try:
+    from SCAN_CONTEXT import ScanContext
+    from AUDIT_BUDGET import DetectorCosts, SCORE_BOUNDS, run_until, fixed_label, reachable_labels
+    from COMBINATION_RULES import RuleSet, PERSUASION_COMBINATION_RULES
+except ImportError:
+    # Fallback if running from different directory
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from SCAN_CONTEXT import ScanContext
+    from AUDIT_BUDGET import DetectorCosts, SCORE_BOUNDS, run_until, fixed_label, reachable_labels
+    from COMBINATION_RULES import RuleSet, PERSUASION_COMBINATION_RULES
+
 # =============================================================================
 # SECTION 1: PATTERN CONSTANTS
 # =============================================================================
@@ -331,6 +345,10 @@ class Patterns:
         re.IGNORECASE
     )
 
+    TRICOLON_PATTERN = re.compile(
+        r'(\w+(?:\s+\w+)?),\s+(\w+(?:\s+\w+)?),\s+and\s+(\w+(?:\s+\w+)?)'
+    )
+
     # -------------------------------------------------------------------------
     # LINGUISTIC: HEDGING & CERTAINTY
     # -------------------------------------------------------------------------
@@ -369,6 +387,9 @@ class Patterns:
     CONTRAST_MARKERS = ["but", "however", "although", "yet", "nevertheless", "despite"]
     URGENCY_MARKERS = ["now", "immediately", "urgent", "critical", "important", "must"]
 
+    # Reason clause after "because", matched against lowercased text
+    BECAUSE_CLAUSE = re.compile(r'because\s+([^.!?]+)')
+
     # -------------------------------------------------------------------------
     # LINGUISTIC: CONCEPTUAL METAPHORS (from LINGUISTIC_PERSUASION_RESEARCH.md)
     # Effectiveness: 88/100, Awareness: LOW
@@ -463,28 +484,29 @@ class AuditReport:
 
 class PersonalStimulusDetector:
     """Detect self-centered targeting patterns."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Exclusion language (20 pts each, max 40)
-        exclusion_matches = Patterns.PERSONAL_EXCLUSION.findall(text)
+        exclusion_matches = ctx.findall(self.patterns.PERSONAL_EXCLUSION)
         exclusion_score = min(len(exclusion_matches) * 20, 40)
         if exclusion_matches:
             matches.extend(exclusion_matches)
             details["exclusion_language"] = exclusion_matches
 
         # Status threat (30 pts each, max 100)
-        status_matches = [kw for kw in Patterns.PERSONAL_STATUS_THREAT if kw in text_lower]
+        status_matches = ctx.keywords(self.patterns.PERSONAL_STATUS_THREAT)
         status_score = min(len(status_matches) * 30, 100)
         if status_matches:
             matches.extend(status_matches)
             details["status_threat"] = status_matches
 
         # Tribal safety (25 pts each)
-        tribal_matches = [kw for kw in Patterns.PERSONAL_TRIBAL_SAFETY if kw in text_lower]
+        tribal_matches = ctx.keywords(self.patterns.PERSONAL_TRIBAL_SAFETY)
         tribal_score = len(tribal_matches) * 25
         if tribal_matches:
             matches.extend(tribal_matches)
@@ -518,31 +540,32 @@ class PersonalStimulusDetector:
 
 class ContrastableDetector:
     """Detect binary ideological framing."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {"pairs_detected": []}
         pairs_score = 0
 
         # Binary pairs (30 pts each if BOTH present)
-        for pair_name, pair_words in Patterns.CONTRASTABLE_PAIRS.items():
-            neg_found = any(w in text_lower for w in pair_words["negative"])
-            pos_found = any(w in text_lower for w in pair_words["positive"])
+        for pair_name, pair_words in self.patterns.CONTRASTABLE_PAIRS.items():
+            neg_found = any(ctx.contains(w) for w in pair_words["negative"])
+            pos_found = any(ctx.contains(w) for w in pair_words["positive"])
             if neg_found and pos_found:
                 pairs_score += 30
                 details["pairs_detected"].append(pair_name)
                 matches.append(pair_name)
 
         # Contrast markers (10 pts each, max 30)
-        marker_matches = Patterns.CONTRASTABLE_MARKERS.findall(text)
+        marker_matches = ctx.findall(self.patterns.CONTRASTABLE_MARKERS)
         marker_score = min(len(marker_matches) * 10, 30)
         if marker_matches:
             matches.extend(marker_matches)
             details["contrast_markers"] = marker_matches
 
         # Spectrum penalty (-8 pts each)
-        spectrum_matches = [kw for kw in Patterns.CONTRASTABLE_SPECTRUM_PENALTY if kw in text_lower]
+        spectrum_matches = ctx.keywords(self.patterns.CONTRASTABLE_SPECTRUM_PENALTY)
         spectrum_penalty = len(spectrum_matches) * 8
         if spectrum_matches:
             details["spectrum_penalty"] = spectrum_matches
@@ -574,21 +597,22 @@ class ContrastableDetector:
 
 class TangibleDetector:
     """Detect concrete vs. abstract language."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Weight specifications (20 pts each)
-        weight_matches = Patterns.TANGIBLE_WEIGHT.findall(text)
+        weight_matches = ctx.findall(self.patterns.TANGIBLE_WEIGHT)
         weight_score = len(weight_matches) * 20
         if weight_matches:
             matches.extend([f"{m[0]} {m[1]}" for m in weight_matches])
             details["weight_specs"] = weight_matches
 
         # Location (10-25 pts based on specificity)
-        location_matches = Patterns.TANGIBLE_LOCATION.findall(text)
+        location_matches = ctx.findall(self.patterns.TANGIBLE_LOCATION)
         location_score = 0
         if location_matches:
             for match in location_matches:
@@ -601,14 +625,14 @@ class TangibleDetector:
             details["locations"] = location_matches
 
         # Decay/change (20 pts with timeline, 5 pts vague)
-        decay_matches = Patterns.TANGIBLE_DECAY.findall(text)
+        decay_matches = ctx.findall(self.patterns.TANGIBLE_DECAY)
         decay_score = len(decay_matches) * 20
         if decay_matches:
             matches.extend([m[0] for m in decay_matches])
             details["decay_processes"] = decay_matches
 
         # Sensory details (15 pts specific, 3 pts vague)
-        sensory_matches = Patterns.TANGIBLE_SENSORY.findall(text)
+        sensory_matches = ctx.findall(self.patterns.TANGIBLE_SENSORY)
         sensory_score = 0
         for match in sensory_matches:
             desc = match[2] if len(match) > 2 else ""
@@ -618,14 +642,14 @@ class TangibleDetector:
             details["sensory_details"] = sensory_matches
 
         # Production artifacts (15 pts each, max 30)
-        artifact_matches = [kw for kw in Patterns.TANGIBLE_ARTIFACTS if kw in text_lower]
+        artifact_matches = ctx.keywords(self.patterns.TANGIBLE_ARTIFACTS)
         artifact_score = min(len(artifact_matches) * 15, 30)
         if artifact_matches:
             matches.extend(artifact_matches)
             details["artifacts"] = artifact_matches
 
         # Abstract penalty (-5 pts each)
-        abstract_matches = [kw for kw in Patterns.TANGIBLE_ABSTRACT_PENALTY if kw in text_lower]
+        abstract_matches = ctx.keywords(self.patterns.TANGIBLE_ABSTRACT_PENALTY)
         abstract_penalty = len(abstract_matches) * 5
         if abstract_matches:
             details["abstract_penalty"] = abstract_matches
@@ -659,14 +683,15 @@ class TangibleDetector:
 
 class MemorableDetector:
     """Detect U-curve memory structure."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Split into thirds
-        lines = text.split('\n')
+        lines = ctx.lines
         lines = [l.strip() for l in lines if l.strip()]
         if len(lines) < 3:
             lines = text.split('. ')
@@ -677,7 +702,7 @@ class MemorableDetector:
         closing = ' '.join(lines[2*third:])
 
         # Opening strength (20 pts each)
-        opening_matches = Patterns.MEMORABLE_OPENING_SIGNALS.findall(opening)
+        opening_matches = ctx.findall_in(self.patterns.MEMORABLE_OPENING_SIGNALS, opening)
         opening_score = len(opening_matches) * 20
         if len(opening) < 100:  # Brevity bonus
             opening_score += 10
@@ -686,7 +711,7 @@ class MemorableDetector:
             details["opening_signals"] = opening_matches
 
         # Closing strength (20 pts each)
-        closing_matches = Patterns.MEMORABLE_CLOSING_SIGNALS.findall(closing)
+        closing_matches = ctx.findall_in(self.patterns.MEMORABLE_CLOSING_SIGNALS, closing)
         closing_score = len(closing_matches) * 20
         if closing.strip().endswith('?'):
             closing_score += 10
@@ -695,7 +720,7 @@ class MemorableDetector:
             details["closing_signals"] = closing_matches
 
         # Middle weakness (filler penalty, -5 pts each)
-        filler_matches = [kw for kw in Patterns.MEMORABLE_FILLER if kw in middle.lower()]
+        filler_matches = [kw for kw in self.patterns.MEMORABLE_FILLER if kw in middle.lower()]
         middle_weakness = len(filler_matches) * 5
         if filler_matches:
             details["middle_filler"] = filler_matches
@@ -736,35 +761,36 @@ class MemorableDetector:
 
 class VisualDetector:
     """Detect anti-aesthetic vs. polished visual language."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Anti-aesthetic (15 pts each)
-        anti_matches = [kw for kw in Patterns.VISUAL_ANTI_AESTHETIC if kw in text_lower]
+        anti_matches = ctx.keywords(self.patterns.VISUAL_ANTI_AESTHETIC)
         anti_score = len(anti_matches) * 15
         if anti_matches:
             matches.extend(anti_matches)
             details["anti_aesthetic"] = anti_matches
 
         # No-styling (15 pts each)
-        nostyling_matches = [kw for kw in Patterns.VISUAL_NO_STYLING if kw in text_lower]
+        nostyling_matches = ctx.keywords(self.patterns.VISUAL_NO_STYLING)
         nostyling_score = len(nostyling_matches) * 15
         if nostyling_matches:
             matches.extend(nostyling_matches)
             details["no_styling"] = nostyling_matches
 
         # Mood board (10 pts each)
-        mood_matches = [kw for kw in Patterns.VISUAL_MOOD_BOARD if kw in text_lower]
+        mood_matches = ctx.keywords(self.patterns.VISUAL_MOOD_BOARD)
         mood_score = len(mood_matches) * 10
         if mood_matches:
             matches.extend(mood_matches)
             details["mood_board"] = mood_matches
 
         # Polished penalty (-10 pts each)
-        polished_matches = [kw for kw in Patterns.VISUAL_POLISHED_PENALTY if kw in text_lower]
+        polished_matches = ctx.keywords(self.patterns.VISUAL_POLISHED_PENALTY)
         polished_penalty = len(polished_matches) * 10
         if polished_matches:
             details["polished_penalty"] = polished_matches
@@ -796,20 +822,20 @@ class VisualDetector:
 
 class EmotionalDetector:
     """Detect pain→relief emotional arc."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Pain detection (15 pts each)
         pain_score = 0
         pain_matches = []
-        for category, keywords in Patterns.EMOTIONAL_PAIN_KEYWORDS.items():
-            for kw in keywords:
-                if kw in text_lower:
-                    pain_score += 15
-                    pain_matches.append(kw)
+        for category, keywords in self.patterns.EMOTIONAL_PAIN_KEYWORDS.items():
+            for kw in ctx.keywords(keywords):
+                pain_score += 15
+                pain_matches.append(kw)
         if pain_matches:
             matches.extend(pain_matches)
             details["pain_triggers"] = pain_matches
@@ -817,11 +843,10 @@ class EmotionalDetector:
         # Relief detection (15 pts each)
         relief_score = 0
         relief_matches = []
-        for category, keywords in Patterns.EMOTIONAL_RELIEF_KEYWORDS.items():
-            for kw in keywords:
-                if kw in text_lower:
-                    relief_score += 15
-                    relief_matches.append(kw)
+        for category, keywords in self.patterns.EMOTIONAL_RELIEF_KEYWORDS.items():
+            for kw in ctx.keywords(keywords):
+                relief_score += 15
+                relief_matches.append(kw)
         if relief_matches:
             matches.extend(relief_matches)
             details["relief_signals"] = relief_matches
@@ -862,35 +887,36 @@ class EmotionalDetector:
 
 class AuthorityDetector:
     """Detect authority and credibility signals."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Credentials (15 pts each)
-        cred_matches = [kw for kw in Patterns.AUTHORITY_CREDENTIALS if kw in text_lower]
+        cred_matches = ctx.keywords(self.patterns.AUTHORITY_CREDENTIALS)
         cred_score = len(cred_matches) * 15
         if cred_matches:
             matches.extend(cred_matches)
             details["credentials"] = cred_matches
 
         # Institutions (20 pts each)
-        inst_matches = [kw for kw in Patterns.AUTHORITY_INSTITUTIONS if kw in text_lower]
+        inst_matches = ctx.keywords(self.patterns.AUTHORITY_INSTITUTIONS)
         inst_score = len(inst_matches) * 20
         if inst_matches:
             matches.extend(inst_matches)
             details["institutions"] = inst_matches
 
         # Confidence markers (10 pts each, max 80)
-        conf_matches = Patterns.AUTHORITY_CONFIDENCE.findall(text)
+        conf_matches = ctx.findall(self.patterns.AUTHORITY_CONFIDENCE)
         conf_score = min(len(conf_matches) * 10, 80)
         if conf_matches:
             matches.extend(conf_matches)
             details["confidence_markers"] = conf_matches
 
         # Threat penalty (-20 pts each)
-        threat_matches = [kw for kw in Patterns.AUTHORITY_THREAT_PENALTY if kw in text_lower]
+        threat_matches = ctx.keywords(self.patterns.AUTHORITY_THREAT_PENALTY)
         threat_penalty = len(threat_matches) * 20
         if threat_matches:
             details["threat_penalty"] = threat_matches
@@ -936,28 +962,29 @@ class AuthorityDetector:
 
 class SocialProofDetector:
     """Detect social proof and consensus signals."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Consensus language (15 pts each)
-        consensus_matches = [kw for kw in Patterns.SOCIAL_PROOF_CONSENSUS if kw in text_lower]
+        consensus_matches = ctx.keywords(self.patterns.SOCIAL_PROOF_CONSENSUS)
         consensus_score = len(consensus_matches) * 15
         if consensus_matches:
             matches.extend(consensus_matches)
             details["consensus_signals"] = consensus_matches
 
         # Similarity language (12 pts each)
-        similarity_matches = [kw for kw in Patterns.SOCIAL_PROOF_SIMILARITY if kw in text_lower]
+        similarity_matches = ctx.keywords(self.patterns.SOCIAL_PROOF_SIMILARITY)
         similarity_score = len(similarity_matches) * 12
         if similarity_matches:
             matches.extend(similarity_matches)
             details["similarity_signals"] = similarity_matches
 
         # Numbers (15 pts each)
-        number_matches = Patterns.SOCIAL_PROOF_NUMBERS.findall(text)
+        number_matches = ctx.findall(self.patterns.SOCIAL_PROOF_NUMBERS)
         number_score = len(number_matches) * 15
         if number_matches:
             matches.extend(number_matches)
@@ -984,21 +1011,22 @@ class SocialProofDetector:
 
 class ReciprocityDetector:
     """Detect reciprocity and obligation signals."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Free signals (20 pts each)
-        free_matches = [kw for kw in Patterns.RECIPROCITY_FREE if kw in text_lower]
+        free_matches = ctx.keywords(self.patterns.RECIPROCITY_FREE)
         free_score = len(free_matches) * 20
         if free_matches:
             matches.extend(free_matches)
             details["free_signals"] = free_matches
 
         # Obligation language (25 pts each)
-        obligation_matches = [kw for kw in Patterns.RECIPROCITY_OBLIGATION if kw in text_lower]
+        obligation_matches = ctx.keywords(self.patterns.RECIPROCITY_OBLIGATION)
         obligation_score = len(obligation_matches) * 25
         if obligation_matches:
             matches.extend(obligation_matches)
@@ -1025,28 +1053,29 @@ class ReciprocityDetector:
 
 class CommitmentDetector:
     """Detect commitment and consistency patterns."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Small asks (15 pts each)
-        small_matches = [kw for kw in Patterns.COMMITMENT_SMALL_ASK if kw in text_lower]
+        small_matches = ctx.keywords(self.patterns.COMMITMENT_SMALL_ASK)
         small_score = len(small_matches) * 15
         if small_matches:
             matches.extend(small_matches)
             details["small_asks"] = small_matches
 
         # Escalation (20 pts each)
-        escalation_matches = [kw for kw in Patterns.COMMITMENT_ESCALATION if kw in text_lower]
+        escalation_matches = ctx.keywords(self.patterns.COMMITMENT_ESCALATION)
         escalation_score = len(escalation_matches) * 20
         if escalation_matches:
             matches.extend(escalation_matches)
             details["escalation"] = escalation_matches
 
         # Public commitment (25 pts each)
-        public_matches = [kw for kw in Patterns.COMMITMENT_PUBLIC if kw in text_lower]
+        public_matches = ctx.keywords(self.patterns.COMMITMENT_PUBLIC)
         public_score = len(public_matches) * 25
         if public_matches:
             matches.extend(public_matches)
@@ -1077,34 +1106,36 @@ class CommitmentDetector:
 
 class ScarcityDetector:
     """Detect scarcity and urgency signals."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Limitation (15 pts each)
-        limitation_matches = Patterns.SCARCITY_LIMITATION.findall(text)
+        limitation_matches = ctx.findall(self.patterns.SCARCITY_LIMITATION)
         limitation_score = len(limitation_matches) * 15
         if limitation_matches:
             matches.extend(limitation_matches)
             details["limitation_signals"] = limitation_matches
 
         # Competition (20 pts each)
-        competition_matches = Patterns.SCARCITY_COMPETITION.findall(text)
+        competition_matches = ctx.findall(self.patterns.SCARCITY_COMPETITION)
         competition_score = len(competition_matches) * 20
         if competition_matches:
             matches.extend(competition_matches)
             details["competition_signals"] = competition_matches
 
         # Destruction (30 pts each)
-        destruction_matches = Patterns.SCARCITY_DESTRUCTION.findall(text)
+        destruction_matches = ctx.findall(self.patterns.SCARCITY_DESTRUCTION)
         destruction_score = len(destruction_matches) * 30
         if destruction_matches:
             matches.extend(destruction_matches)
             details["destruction_signals"] = destruction_matches
 
         # Urgency (15 pts each)
-        urgency_matches = Patterns.SCARCITY_URGENCY.findall(text)
+        urgency_matches = ctx.findall(self.patterns.SCARCITY_URGENCY)
         urgency_score = len(urgency_matches) * 15
         if urgency_matches:
             matches.extend(urgency_matches)
@@ -1144,28 +1175,29 @@ class ScarcityDetector:
 
 class LikingDetector:
     """Detect liking and rapport signals."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Similarity (15 pts each)
-        similarity_matches = [kw for kw in Patterns.LIKING_SIMILARITY if kw in text_lower]
+        similarity_matches = ctx.keywords(self.patterns.LIKING_SIMILARITY)
         similarity_score = len(similarity_matches) * 15
         if similarity_matches:
             matches.extend(similarity_matches)
             details["similarity_signals"] = similarity_matches
 
         # Compliments (12 pts each)
-        compliment_matches = [kw for kw in Patterns.LIKING_COMPLIMENTS if kw in text_lower]
+        compliment_matches = ctx.keywords(self.patterns.LIKING_COMPLIMENTS)
         compliment_score = len(compliment_matches) * 12
         if compliment_matches:
             matches.extend(compliment_matches)
             details["compliments"] = compliment_matches
 
         # Familiarity (10 pts each)
-        familiarity_matches = [kw for kw in Patterns.LIKING_FAMILIARITY if kw in text_lower]
+        familiarity_matches = ctx.keywords(self.patterns.LIKING_FAMILIARITY)
         familiarity_score = len(familiarity_matches) * 10
         if familiarity_matches:
             matches.extend(familiarity_matches)
@@ -1192,21 +1224,22 @@ class LikingDetector:
 
 class UnityDetector:
     """Detect unity and in-group signals."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # In-group language (10 pts each)
-        ingroup_matches = [kw for kw in Patterns.UNITY_INGROUP if kw in text_lower]
+        ingroup_matches = ctx.keywords(self.patterns.UNITY_INGROUP)
         ingroup_score = len(ingroup_matches) * 10
         if ingroup_matches:
             matches.extend(ingroup_matches)
             details["ingroup_language"] = ingroup_matches
 
         # Shared identity (15 pts each)
-        identity_matches = [kw for kw in Patterns.UNITY_SHARED_IDENTITY if kw in text_lower]
+        identity_matches = ctx.keywords(self.patterns.UNITY_SHARED_IDENTITY)
         identity_score = len(identity_matches) * 15
         if identity_matches:
             matches.extend(identity_matches)
@@ -1233,28 +1266,29 @@ class UnityDetector:
 
 class FramingDetector:
     """Detect gain/loss framing and anchoring."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Loss framing (20 pts per marker)
-        loss_matches = [kw for kw in Patterns.LOSS_FRAME_MARKERS if kw in text_lower]
+        loss_matches = ctx.keywords(self.patterns.LOSS_FRAME_MARKERS)
         loss_score = len(loss_matches) * 20
         if loss_matches:
             matches.extend(loss_matches)
             details["loss_frame"] = loss_matches
 
         # Gain framing (10 pts per marker)
-        gain_matches = [kw for kw in Patterns.GAIN_FRAME_MARKERS if kw in text_lower]
+        gain_matches = ctx.keywords(self.patterns.GAIN_FRAME_MARKERS)
         gain_score = len(gain_matches) * 10
         if gain_matches:
             matches.extend(gain_matches)
             details["gain_frame"] = gain_matches
 
         # Anchoring (15 pts if found)
-        anchor_matches = Patterns.ANCHORING_PATTERN.findall(text)
+        anchor_matches = ctx.findall(self.patterns.ANCHORING_PATTERN)
         anchor_score = 15 if anchor_matches else 0
         if anchor_matches:
             matches.extend(anchor_matches)
@@ -1293,6 +1327,7 @@ class FramingDetector:
 
 class RhetoricalDeviceDetector:
     """Detect rhetorical devices in text."""
+    patterns = Patterns
 
     DEVICE_SCORES = {
         "anaphora": 25,
@@ -1302,13 +1337,14 @@ class RhetoricalDeviceDetector:
         "alliteration": 10,
     }
 
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {"devices_found": []}
         total_score = 0
 
         # Rhetorical questions
-        rq_matches = Patterns.RHETORICAL_QUESTION.findall(text)
+        rq_matches = ctx.findall(self.patterns.RHETORICAL_QUESTION)
         if rq_matches:
             score = len(rq_matches) * self.DEVICE_SCORES["rhetorical_question"]
             total_score += score
@@ -1316,7 +1352,7 @@ class RhetoricalDeviceDetector:
             details["devices_found"].append({"type": "rhetorical_question", "count": len(rq_matches)})
 
         # Antithesis
-        anti_matches = Patterns.ANTITHESIS_PATTERN.findall(text)
+        anti_matches = ctx.findall(self.patterns.ANTITHESIS_PATTERN)
         if anti_matches:
             score = len(anti_matches) * self.DEVICE_SCORES["antithesis"]
             total_score += score
@@ -1324,8 +1360,7 @@ class RhetoricalDeviceDetector:
             details["devices_found"].append({"type": "antithesis", "count": len(anti_matches)})
 
         # Anaphora (repeated sentence openings)
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = [s.strip() for s in ctx.sentences if s.strip()]
         if len(sentences) >= 3:
             openings = [' '.join(s.split()[:2]).lower() for s in sentences if len(s.split()) >= 2]
             opening_counts = Counter(openings)
@@ -1336,22 +1371,14 @@ class RhetoricalDeviceDetector:
                     details["devices_found"].append({"type": "anaphora", "pattern": opening, "count": count})
 
         # Tricolon (three-part lists)
-        tricolon_pattern = r'(\w+(?:\s+\w+)?),\s+(\w+(?:\s+\w+)?),\s+and\s+(\w+(?:\s+\w+)?)'
-        tricolon_matches = re.findall(tricolon_pattern, text)
+        tricolon_matches = ctx.findall(self.patterns.TRICOLON_PATTERN)
         if tricolon_matches:
             total_score += len(tricolon_matches) * self.DEVICE_SCORES["tricolon"]
             matches.extend([', '.join(m) for m in tricolon_matches])
             details["devices_found"].append({"type": "tricolon", "count": len(tricolon_matches)})
 
-        # Alliteration
-        words = text.lower().split()
-        alliteration_count = 0
-        for i in range(len(words) - 2):
-            w1 = re.sub(r'[^a-z]', '', words[i])
-            w2 = re.sub(r'[^a-z]', '', words[i+1])
-            w3 = re.sub(r'[^a-z]', '', words[i+2])
-            if w1 and w2 and w3 and w1[0] == w2[0] == w3[0]:
-                alliteration_count += 1
+        # Alliteration (three consecutive words sharing a first a-z letter)
+        alliteration_count = ctx.tokens.alliteration_count()
         if alliteration_count:
             total_score += alliteration_count * self.DEVICE_SCORES["alliteration"]
             details["devices_found"].append({"type": "alliteration", "count": alliteration_count})
@@ -1376,22 +1403,30 @@ class RhetoricalDeviceDetector:
 
 class SyntacticPatternDetector:
     """Detect syntactic patterns affecting persuasion."""
+    patterns = Patterns
 
     PASSIVE_PATTERNS = [
-        r'\b(?:was|were|been|being)\s+\w+ed\b',
-        r'\b(?:has|have|had)\s+been\s+\w+ed\b',
-        r'\b(?:is|are)\s+being\s+\w+ed\b',
+        re.compile(r'\b(?:was|were|been|being)\s+\w+ed\b', re.IGNORECASE),
+        re.compile(r'\b(?:has|have|had)\s+been\s+\w+ed\b', re.IGNORECASE),
+        re.compile(r'\b(?:is|are)\s+being\s+\w+ed\b', re.IGNORECASE),
     ]
 
     NOMINALIZATION_SUFFIXES = ['-tion', '-ment', '-ness', '-ity', '-ance', '-ence']
 
+    NOMINALIZATION_ENDINGS = tuple(suffix.replace('-', '') for suffix in NOMINALIZATION_SUFFIXES)
+    NOMINALIZATION_PATTERNS = [
+        re.compile(r'\w+' + ending + r'\b', re.IGNORECASE)
+        for ending in NOMINALIZATION_ENDINGS
+    ]
+
     NEGATIVE_CONTEXT = [
         'error', 'mistake', 'failure', 'problem', 'issue', 'fault',
         'loss', 'damage', 'harm', 'delay', 'decline', 'criticism'
     ]
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
+        text_lower = ctx.lower
         matches = []
         details = {}
 
@@ -1399,7 +1434,7 @@ class SyntacticPatternDetector:
         passive_count = 0
         passive_in_negative = 0
         for pattern in self.PASSIVE_PATTERNS:
-            passive_matches = re.findall(pattern, text, re.IGNORECASE)
+            passive_matches = ctx.findall(pattern)
             passive_count += len(passive_matches)
             # Check if in negative context
             for match in passive_matches:
@@ -1417,22 +1452,17 @@ class SyntacticPatternDetector:
         details["passive_in_negative_context"] = passive_in_negative
 
         # Nominalization detection
-        nominalization_count = 0
-        for suffix in self.NOMINALIZATION_SUFFIXES:
-            pattern = r'\w+' + suffix.replace('-', '') + r'\b'
-            nom_matches = re.findall(pattern, text, re.IGNORECASE)
-            nominalization_count += len(nom_matches)
+        nominalization_count = ctx.tokens.suffix_count(self.NOMINALIZATION_ENDINGS, self.NOMINALIZATION_PATTERNS)
 
         nominalization_score = nominalization_count * 3
         details["nominalization_count"] = nominalization_count
 
         # Sentence length analysis
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        if sentences:
-            avg_length = sum(len(s.split()) for s in sentences) / len(sentences)
-            short_sentences = sum(1 for s in sentences if len(s.split()) <= 5)
-            short_ratio = short_sentences / len(sentences)
+        word_counts = ctx.tokens.sentence_word_counts
+        if word_counts:
+            avg_length = sum(word_counts) / len(word_counts)
+            short_sentences = sum(1 for count in word_counts if count <= 5)
+            short_ratio = short_sentences / len(word_counts)
 
             # Short declarative sentences = confidence (5 pts each if >30% short)
             short_score = 5 * short_sentences if short_ratio > 0.3 else 0
@@ -1462,21 +1492,22 @@ class SyntacticPatternDetector:
 
 class FramingEffectDetector:
     """Detect semantic framing effects."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Loss framing (20 pts each)
-        loss_matches = [kw for kw in Patterns.LOSS_FRAME_MARKERS if kw in text_lower]
+        loss_matches = ctx.keywords(self.patterns.LOSS_FRAME_MARKERS)
         loss_score = len(loss_matches) * 20
         if loss_matches:
             matches.extend(loss_matches)
             details["loss_frame_markers"] = loss_matches
 
         # Gain framing (10 pts each)
-        gain_matches = [kw for kw in Patterns.GAIN_FRAME_MARKERS if kw in text_lower]
+        gain_matches = ctx.keywords(self.patterns.GAIN_FRAME_MARKERS)
         gain_score = len(gain_matches) * 10
         if gain_matches:
             matches.extend(gain_matches)
@@ -1484,21 +1515,19 @@ class FramingEffectDetector:
 
         # Euphemism detection (15 pts each)
         euphemism_count = 0
-        for harsh, softs in Patterns.EUPHEMISM_PAIRS.items():
-            for soft in softs:
-                if soft in text_lower:
-                    euphemism_count += 1
-                    matches.append(f"euphemism: {soft}")
+        for harsh, softs in self.patterns.EUPHEMISM_PAIRS.items():
+            for soft in ctx.keywords(softs):
+                euphemism_count += 1
+                matches.append(f"euphemism: {soft}")
         euphemism_score = euphemism_count * 15
         details["euphemism_count"] = euphemism_count
 
         # Dysphemism detection (15 pts each)
         dysphemism_count = 0
-        for neutral, harshes in Patterns.DYSPHEMISM_PAIRS.items():
-            for harsh in harshes:
-                if harsh in text_lower:
-                    dysphemism_count += 1
-                    matches.append(f"dysphemism: {harsh}")
+        for neutral, harshes in self.patterns.DYSPHEMISM_PAIRS.items():
+            for harsh in ctx.keywords(harshes):
+                dysphemism_count += 1
+                matches.append(f"dysphemism: {harsh}")
         dysphemism_score = dysphemism_count * 15
         details["dysphemism_count"] = dysphemism_count
 
@@ -1523,6 +1552,7 @@ class FramingEffectDetector:
 
 class PragmaticPatternDetector:
     """Detect pragmatic patterns (presuppositions, indirect directives)."""
+    patterns = Patterns
 
     PRESUPPOSITION_MARKERS = [
         "the", "your", "when", "realize", "discover", "finally",
@@ -1534,25 +1564,29 @@ class PragmaticPatternDetector:
         "picture", "envision", "what if"
     ]
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    # "The X that/which/you..." and "Your X", matched against lowercased text
+    THE_PRESUPPOSITION = re.compile(r'\bthe\s+(\w+(?:\s+\w+)?)\s+(?:you|that|which)')
+    YOUR_PRESUPPOSITION = re.compile(r'\byour\s+(\w+)')
+
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Presupposition patterns (10 pts each for loaded presuppositions)
         presup_count = 0
         # "The X" presupposes X exists
-        the_patterns = re.findall(r'\bthe\s+(\w+(?:\s+\w+)?)\s+(?:you|that|which)', text_lower)
+        the_patterns = ctx.findall(self.THE_PRESUPPOSITION, lower=True)
         presup_count += len(the_patterns)
         # "Your X" presupposes you have X
-        your_patterns = re.findall(r'\byour\s+(\w+)', text_lower)
+        your_patterns = ctx.findall(self.YOUR_PRESUPPOSITION, lower=True)
         presup_count += len(your_patterns)
         # "Finally" presupposes previous failed attempts
-        if "finally" in text_lower:
+        if ctx.contains("finally"):
             presup_count += 1
             matches.append("finally (presupposes prior attempts)")
         # "Discover" presupposes something exists to be discovered
-        if "discover" in text_lower:
+        if ctx.contains("discover"):
             presup_count += 1
             matches.append("discover (presupposes existence)")
 
@@ -1560,7 +1594,7 @@ class PragmaticPatternDetector:
         details["presupposition_count"] = presup_count
 
         # Indirect directives (8 pts each)
-        directive_matches = [kw for kw in self.INDIRECT_DIRECTIVE_MARKERS if kw in text_lower]
+        directive_matches = ctx.keywords(self.INDIRECT_DIRECTIVE_MARKERS)
         directive_score = len(directive_matches) * 8
         if directive_matches:
             matches.extend(directive_matches)
@@ -1587,21 +1621,22 @@ class PragmaticPatternDetector:
 
 class DiscourseMarkerDetector:
     """Detect discourse markers and their effects."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Causal markers (5 pts each)
-        causal_matches = [kw for kw in Patterns.CAUSAL_MARKERS if kw in text_lower]
+        causal_matches = ctx.keywords(self.patterns.CAUSAL_MARKERS)
         causal_score = len(causal_matches) * 5
         if causal_matches:
             matches.extend(causal_matches)
             details["causal_markers"] = causal_matches
 
         # Check for pseudo-reasoning (because + weak reason = 15 pts)
-        because_matches = re.findall(r'because\s+([^.!?]+)', text_lower)
+        because_matches = ctx.findall(self.patterns.BECAUSE_CLAUSE, lower=True)
         pseudo_reason_score = 0
         for reason in because_matches:
             # Weak reasons are short or circular
@@ -1611,14 +1646,14 @@ class DiscourseMarkerDetector:
         details["pseudo_reasoning_count"] = pseudo_reason_score // 15
 
         # Contrast markers (3 pts each)
-        contrast_matches = [kw for kw in Patterns.CONTRAST_MARKERS if kw in text_lower]
+        contrast_matches = ctx.keywords(self.patterns.CONTRAST_MARKERS)
         contrast_score = len(contrast_matches) * 3
         if contrast_matches:
             matches.extend(contrast_matches)
             details["contrast_markers"] = contrast_matches
 
         # Urgency markers (12 pts each)
-        urgency_matches = [kw for kw in Patterns.URGENCY_MARKERS if kw in text_lower]
+        urgency_matches = ctx.keywords(self.patterns.URGENCY_MARKERS)
         urgency_score = len(urgency_matches) * 12
         if urgency_matches:
             matches.extend(urgency_matches)
@@ -1645,21 +1680,22 @@ class DiscourseMarkerDetector:
 
 class HedgingCertaintyDetector:
     """Detect hedging and certainty markers."""
+    patterns = Patterns
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Hedging (weak certainty) - 3 pts each
-        hedge_matches = [kw for kw in Patterns.HEDGING_WEAK if kw in text_lower]
+        hedge_matches = ctx.keywords(self.patterns.HEDGING_WEAK)
         hedge_score = len(hedge_matches) * 3
         if hedge_matches:
             matches.extend(hedge_matches)
             details["hedges"] = hedge_matches
 
         # Boosters (strong certainty) - 5 pts each
-        booster_matches = [kw for kw in Patterns.CERTAINTY_BOOSTERS if kw in text_lower]
+        booster_matches = ctx.keywords(self.patterns.CERTAINTY_BOOSTERS)
         booster_score = len(booster_matches) * 5
         if booster_matches:
             matches.extend(booster_matches)
@@ -1699,6 +1735,7 @@ class HedgingCertaintyDetector:
 
 class RegisterFormalityDetector:
     """Detect register and formality patterns."""
+    patterns = Patterns
 
     FORMAL_MARKERS = [
         "utilize", "commence", "furthermore", "moreover", "whereas",
@@ -1715,36 +1752,39 @@ class RegisterFormalityDetector:
         "I'll be real", "let me tell you", "trust me", "friend"
     ]
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    # Counted from the token stream (ScanContext.tokens.contraction_count)
+    CONTRACTION_PATTERN = re.compile(r"\b\w+'\w+\b")
+
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {}
 
         # Formal markers (5 pts each)
-        formal_matches = [kw for kw in self.FORMAL_MARKERS if kw in text_lower]
+        formal_matches = ctx.keywords(self.FORMAL_MARKERS)
         formal_score = len(formal_matches) * 5
         if formal_matches:
             matches.extend(formal_matches)
             details["formal_markers"] = formal_matches
 
         # Informal markers (3 pts each)
-        informal_matches = [kw for kw in self.INFORMAL_MARKERS if kw in text_lower]
+        informal_matches = ctx.keywords(self.INFORMAL_MARKERS)
         informal_score = len(informal_matches) * 3
         if informal_matches:
             matches.extend(informal_matches)
             details["informal_markers"] = informal_matches
 
         # Intimacy markers (10 pts each - creates false closeness)
-        intimacy_matches = [kw for kw in self.INTIMACY_MARKERS if kw in text_lower]
+        intimacy_matches = ctx.keywords(self.INTIMACY_MARKERS)
         intimacy_score = len(intimacy_matches) * 10
         if intimacy_matches:
             matches.extend(intimacy_matches)
             details["intimacy_markers"] = intimacy_matches
 
         # Contractions count (informal indicator)
-        contractions = re.findall(r"\b\w+'\w+\b", text)
-        contraction_score = min(len(contractions) * 2, 20)
-        details["contraction_count"] = len(contractions)
+        contraction_count = ctx.tokens.contraction_count()
+        contraction_score = min(contraction_count * 2, 20)
+        details["contraction_count"] = contraction_count
 
         # Determine register
         if formal_score > informal_score + intimacy_score:
@@ -1782,6 +1822,7 @@ class ConceptualMetaphorDetector:
     Based on Lakoff & Johnson (1980) and Thibodeau & Boroditsky (2011).
     Effectiveness: 88/100, Awareness: LOW
     """
+    patterns = Patterns
 
     METAPHOR_SCORES = {
         "war": 12,        # Highest - activates conflict mindset
@@ -1791,14 +1832,14 @@ class ConceptualMetaphorDetector:
         "machine": 6,     # Lower - dehumanization
     }
 
-    def detect(self, text: str) -> DetectionResult:
-        text_lower = text.lower()
+    def detect(self, text: str, ctx: Optional[ScanContext] = None) -> DetectionResult:
+        ctx = ctx or ScanContext(text)
         matches = []
         details = {"metaphor_domains": {}}
         total_score = 0
 
         # War/Battle metaphors (92/100 effectiveness)
-        war_matches = [kw for kw in Patterns.METAPHOR_WAR if kw in text_lower]
+        war_matches = ctx.keywords(self.patterns.METAPHOR_WAR)
         if war_matches:
             war_score = len(war_matches) * self.METAPHOR_SCORES["war"]
             total_score += war_score
@@ -1810,7 +1851,7 @@ class ConceptualMetaphorDetector:
             }
 
         # Journey/Path metaphors (85/100 effectiveness)
-        journey_matches = [kw for kw in Patterns.METAPHOR_JOURNEY if kw in text_lower]
+        journey_matches = ctx.keywords(self.patterns.METAPHOR_JOURNEY)
         if journey_matches:
             journey_score = len(journey_matches) * self.METAPHOR_SCORES["journey"]
             total_score += journey_score
@@ -1822,7 +1863,7 @@ class ConceptualMetaphorDetector:
             }
 
         # Health/Disease metaphors (88/100 effectiveness)
-        health_matches = [kw for kw in Patterns.METAPHOR_HEALTH if kw in text_lower]
+        health_matches = ctx.keywords(self.patterns.METAPHOR_HEALTH)
         if health_matches:
             health_score = len(health_matches) * self.METAPHOR_SCORES["health"]
             total_score += health_score
@@ -1834,7 +1875,7 @@ class ConceptualMetaphorDetector:
             }
 
         # Family/Kinship metaphors (80/100 effectiveness)
-        family_matches = [kw for kw in Patterns.METAPHOR_FAMILY if kw in text_lower]
+        family_matches = ctx.keywords(self.patterns.METAPHOR_FAMILY)
         if family_matches:
             family_score = len(family_matches) * self.METAPHOR_SCORES["family"]
             total_score += family_score
@@ -1846,7 +1887,7 @@ class ConceptualMetaphorDetector:
             }
 
         # Machine/System metaphors (75/100 effectiveness)
-        machine_matches = [kw for kw in Patterns.METAPHOR_MACHINE if kw in text_lower]
+        machine_matches = ctx.keywords(self.patterns.METAPHOR_MACHINE)
         if machine_matches:
             machine_score = len(machine_matches) * self.METAPHOR_SCORES["machine"]
             total_score += machine_score
@@ -1858,7 +1899,7 @@ class ConceptualMetaphorDetector:
             }
 
         # Personification (82/100 effectiveness, +12 per instance)
-        personification_matches = Patterns.PERSONIFICATION_PATTERNS.findall(text)
+        personification_matches = ctx.findall(self.patterns.PERSONIFICATION_PATTERNS)
         if personification_matches:
             pers_score = len(personification_matches) * 12
             total_score += pers_score
@@ -1870,7 +1911,7 @@ class ConceptualMetaphorDetector:
             }
 
         # Metonymy (institutional, +8 per instance)
-        metonymy_matches = [kw for kw in Patterns.METONYMY_INSTITUTIONAL if kw in text_lower]
+        metonymy_matches = ctx.keywords(self.patterns.METONYMY_INSTITUTIONAL)
         if metonymy_matches:
             met_score = len(metonymy_matches) * 8
             total_score += met_score
@@ -1882,7 +1923,7 @@ class ConceptualMetaphorDetector:
             }
 
         # Synecdoche (+10 per instance)
-        synecdoche_matches = [kw for kw in Patterns.SYNECDOCHE_PATTERNS if kw in text_lower]
+        synecdoche_matches = ctx.keywords(self.patterns.SYNECDOCHE_PATTERNS)
         if synecdoche_matches:
             syn_score = len(synecdoche_matches) * 10
             total_score += syn_score
@@ -1954,38 +1995,45 @@ class CompositeScorer:
         """Calculate composite scores from all detection results."""
 
         # Calculate averages
-        tactical_scores = [r.score for r in tactical_results.values()]
-        tactical_avg = sum(tactical_scores) / len(tactical_scores) if tactical_scores else 0
+        tactical_avg = self.average([r.score for r in tactical_results.values()])
+        psychological_avg = self.average([r.score for r in psychological_results.values()])
+        linguistic_avg = self.average([r.score for r in linguistic_results.values()])
+
+        composite_score = self.weighted(tactical_avg, psychological_avg, linguistic_avg)
+        classification = self.classify(composite_score)
 
-        psychological_scores = [r.score for r in psychological_results.values()]
-        psychological_avg = sum(psychological_scores) / len(psychological_scores) if psychological_scores else 0
+        return {
+            "tactical_average": round(tactical_avg, 1),
+            "psychological_average": round(psychological_avg, 1),
+            "linguistic_average": round(linguistic_avg, 1),
+            "overall_influence_index": round(composite_score, 1),
+            "classification": classification,
+            "classification_description": self._get_description(classification)
+        }
 
-        linguistic_scores = [r.score for r in linguistic_results.values()]
-        linguistic_avg = sum(linguistic_scores) / len(linguistic_scores) if linguistic_scores else 0
+    @staticmethod
+    def average(scores: List[int]) -> float:
+        return sum(scores) / len(scores) if scores else 0
 
-        # Weighted composite
+    def weighted(self, tactical_avg: float, psychological_avg: float, linguistic_avg: float) -> float:
+        """Weighted composite of the three group averages, capped at 100."""
         composite_score = (
             tactical_avg * self.WEIGHTS["tactical"] +
             psychological_avg * self.WEIGHTS["psychological"] +
             linguistic_avg * self.WEIGHTS["linguistic"]
         )
-        composite_score = min(composite_score, 100)
+        return min(composite_score, 100)
 
-        # Classification
-        classification = "LOW"
+    def classify(self, composite_score: float) -> str:
+        """Classification label; scores in the gaps between ranges stay LOW."""
         for (low, high), label in self.CLASSIFICATION_THRESHOLDS.items():
             if low <= composite_score <= high:
-                classification = label
-                break
+                return label
+        return "LOW"
 
-        return {
-            "tactical_average": round(tactical_avg, 1),
-            "psychological_average": round(psychological_avg, 1),
-            "linguistic_average": round(linguistic_avg, 1),
-            "overall_influence_index": round(composite_score, 1),
-            "classification": classification,
-            "classification_description": self._get_description(classification)
-        }
+    def breakpoints(self) -> List[float]:
+        """Scores at which classify() can change."""
+        return sorted({bound for bounds in self.CLASSIFICATION_THRESHOLDS for bound in bounds})
 
     def _get_description(self, classification: str) -> str:
         descriptions = {
@@ -2007,6 +2055,9 @@ class RedFlagGenerator:
     HIGH_SCORE_THRESHOLD = 60
     EXTREME_SCORE_THRESHOLD = 80
 
+    def __init__(self, combination_rules: Optional[RuleSet] = None):
+        self.combination_rules = combination_rules or RuleSet(PERSUASION_COMBINATION_RULES)
+
     def generate(
         self,
         tactical_results: Dict[str, DetectionResult],
@@ -2055,18 +2106,10 @@ class RedFlagGenerator:
                     "matches": result.matches[:3]
                 })
 
-        # Check for dangerous combinations
-        emotional_score = tactical_results.get("EMOTIONAL", DetectionResult("", 0, "", [], {})).score
-        scarcity_score = psychological_results.get("SCARCITY", DetectionResult("", 0, "", [], {})).score
-
-        if emotional_score > 50 and scarcity_score > 50:
-            red_flags.append({
-                "category": "COMBINATION",
-                "severity": "HIGH",
-                "score": (emotional_score + scarcity_score) / 2,
-                "details": "Emotional arc + scarcity combination detected (high-pressure pattern)",
-                "matches": []
-            })
+        # Check for dangerous combinations (COMBINATION_RULES.py)
+        red_flags.extend(self.combination_rules.evaluate(
+            {**tactical_results, **psychological_results, **linguistic_results}
+        ))
 
         # Sort by severity and score
         severity_order = {"EXTREME": 0, "HIGH": 1, "MODERATE": 2}
@@ -2089,7 +2132,10 @@ class UnifiedPersuasionAuditor:
         print(json.dumps(result, indent=2))
     """
 
-    def __init__(self):
+    def __init__(self, normalize: bool = False):
+        # Normalize text once per audit (TEXT_NORMALIZER.py); off by default
+        self.normalize = normalize
+
         # Initialize all detectors
         self.tactical_detectors = {
             "PERSONAL": PersonalStimulusDetector(),
@@ -2124,36 +2170,52 @@ class UnifiedPersuasionAuditor:
 
         self.scorer = CompositeScorer()
         self.red_flag_generator = RedFlagGenerator()
+        # Observed detector run times, for deadline-aware audits (AUDIT_BUDGET.py)
+        self.costs = DetectorCosts()
 
-    def audit(self, text: str) -> Dict[str, Any]:
+    def audit(self, text: str, ctx: Optional[ScanContext] = None,
+              deadline: Optional[float] = None) -> Dict[str, Any]:
         """
         Run comprehensive audit on text content.
 
         Args:
             text: The content to analyze
+            ctx: Shared scan state for `text`; pass one to reuse scans across auditors
+            deadline: time.perf_counter() instant by which to stop running detectors.
+                Detectors left unrun score 0 in the report (intensity "SKIPPED")
+                and a "deadline" section gives bounds on the overall score.
 
         Returns:
             Complete audit report as dictionary
         """
+        ctx = ctx or ScanContext.create(text, self.normalize)
+        # Detectors see the normalized form when normalization is on
+        scan_text = ctx.text
+
         # Generate audit metadata
         audit_id = hashlib.md5(f"{text[:100]}{datetime.now().isoformat()}".encode()).hexdigest()[:12]
         timestamp = datetime.now().isoformat()
         content_hash = hashlib.sha256(text.encode()).hexdigest()
 
-        # Run all tactical detectors
-        tactical_results = {}
-        for name, detector in self.tactical_detectors.items():
-            tactical_results[name] = detector.detect(text)
+        missing: List[str] = []
+        if deadline is not None:
+            (tactical_results, psychological_results,
+             linguistic_results), missing = self._run_until(scan_text, ctx, deadline)
+        else:
+            # Run all tactical detectors
+            tactical_results = {}
+            for name, detector in self.tactical_detectors.items():
+                tactical_results[name] = detector.detect(scan_text, ctx)
 
-        # Run all psychological detectors
-        psychological_results = {}
-        for name, detector in self.psychological_detectors.items():
-            psychological_results[name] = detector.detect(text)
+            # Run all psychological detectors
+            psychological_results = {}
+            for name, detector in self.psychological_detectors.items():
+                psychological_results[name] = detector.detect(scan_text, ctx)
 
-        # Run all linguistic detectors
-        linguistic_results = {}
-        for name, detector in self.linguistic_detectors.items():
-            linguistic_results[name] = detector.detect(text)
+            # Run all linguistic detectors
+            linguistic_results = {}
+            for name, detector in self.linguistic_detectors.items():
+                linguistic_results[name] = detector.detect(scan_text, ctx)
 
         # Calculate composite scores
         composite_scores = self.scorer.calculate(
@@ -2224,16 +2286,106 @@ class UnifiedPersuasionAuditor:
             }
         }
 
+        if deadline is not None:
+            report["deadline"] = self._deadline_section(
+                (tactical_results, psychological_results, linguistic_results), missing, composite_scores)
+
         return report
 
+    def _detector_values(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any], Dict[str, float]]:
+        """Detector groups, all detectors by name, and each one's weight in the composite."""
+        groups = {
+            "tactical": self.tactical_detectors,
+            "psychological": self.psychological_detectors,
+            "linguistic": self.linguistic_detectors,
+        }
+        detectors, values = {}, {}
+        for group, members in groups.items():
+            for name, detector in members.items():
+                detectors[name] = detector
+                values[name] = self.scorer.WEIGHTS[group] / len(members)
+        return groups, detectors, values
+
+    def _run_until(self, scan_text: str, ctx: ScanContext,
+                   deadline: float) -> Tuple[Tuple[Dict[str, DetectionResult], ...], List[str]]:
+        """Run detectors by composite weight per second until the deadline."""
+        groups, detectors, values = self._detector_values()
+        results, missing = run_until(detectors, values, scan_text, ctx, deadline, self.costs)
+        for name in missing:
+            results[name] = DetectionResult(name, SCORE_BOUNDS[0], "SKIPPED", [], {"skipped": "deadline"})
+        return tuple({name: results[name] for name in members} for members in groups.values()), missing
+
+    def _deadline_section(self, results: Tuple[Dict[str, DetectionResult], ...], missing: List[str],
+                          composite_scores: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Completed detectors and overall-score bounds with unrun detectors at
+        either end of their range. "classification" is the label every score
+        in the bounds gets (None if it can still change) and
+        "possible_classifications" lists each label still reachable.
+        """
+        upper = self.scorer.calculate(*(
+            {name: DetectionResult(name, SCORE_BOUNDS[1], "SKIPPED", [], {}) if name in missing else result
+             for name, result in group.items()}
+            for group in results
+        ))
+        low, high = composite_scores["overall_influence_index"], upper["overall_influence_index"]
+        breakpoints = self.scorer.breakpoints()
+        return {
+            "partial": bool(missing),
+            "completed": [name for group in results for name in group if name not in missing],
+            "missing": {name: list(SCORE_BOUNDS) for name in missing},
+            "overall_bounds": [low, high],
+            "classification": fixed_label(self.scorer.classify, low, high, breakpoints),
+            "possible_classifications": reachable_labels(self.scorer.classify, low, high, breakpoints),
+        }
+
+    def decide(self, text: str, ctx: Optional[ScanContext] = None,
+               deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Classification only: run detectors until the label can no longer change.
+
+        After each detector the overall score is bounded by scoring the rest
+        at 0 and at 100; detection stops once both bounds (and every score
+        between them) classify the same. The label always matches audit().
+        With a deadline that passes first, "classification" is None and
+        "possible_classifications" lists every label still reachable.
+        """
+        ctx = ctx or ScanContext.create(text, self.normalize)
+        groups, detectors, values = self._detector_values()
+        breakpoints = self.scorer.breakpoints()
+
+        def bounds(results: Dict[str, DetectionResult]) -> Tuple[float, ...]:
+            return tuple(
+                self.scorer.weighted(*(
+                    self.scorer.average([results[name].score if name in results else fill for name in members])
+                    for members in groups.values()
+                ))
+                for fill in SCORE_BOUNDS
+            )
+
+        def settled(results: Dict[str, DetectionResult]) -> bool:
+            return fixed_label(self.scorer.classify, *bounds(results), breakpoints) is not None
+
+        results, missing = run_until(detectors, values, ctx.text, ctx,
+                                     float("inf") if deadline is None else deadline, self.costs, settled)
+        low, high = bounds(results)
+        possible = reachable_labels(self.scorer.classify, low, high, breakpoints)
+        return {
+            "classification": possible[0] if len(possible) == 1 else None,
+            "possible_classifications": possible,
+            "overall_bounds": [round(low, 1), round(high, 1)],
+            "completed": list(results),
+            "skipped": missing,
+        }
+
     def audit_pretty(self, text: str) -> str:
         """Run audit and return formatted JSON string."""
         result = self.audit(text)
         return json.dumps(result, indent=2, default=str)
 
-    def quick_score(self, text: str) -> Dict[str, Any]:
+    def quick_score(self, text: str, ctx: Optional[ScanContext] = None) -> Dict[str, Any]:
         """Quick scoring without full details - returns just scores and classification."""
-        full_result = self.audit(text)
+        full_result = self.audit(text, ctx)
         return {
             "overall_score": full_result["composite_scores"]["overall_influence_index"],
             "classification": full_result["composite_scores"]["classification"],